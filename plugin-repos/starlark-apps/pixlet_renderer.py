@@ -5,18 +5,90 @@ Handles execution of Pixlet CLI to render .star files into WebP animations.
 Supports bundled binaries and system-installed Pixlet.
 """
 
+import asyncio
 import json
 import logging
 import os
 import platform
 import re
 import shutil
+import stat
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on .star source size accepted by extract_schema (guards against pathological inputs)
+MAX_SCHEMA_SOURCE_BYTES = 2 * 1024 * 1024
+
+# Seconds a `pixlet version` probe result is reused before the binary is re-executed
+VERSION_PROBE_TTL = 300
+
+# Config keys passed to Pixlet must be plain identifiers
+_VALID_CONFIG_KEY = re.compile(r'[A-Za-z_][A-Za-z0-9_]*').fullmatch
+
+# Shell metacharacters rejected in config values: backticks, $ (covers $()), pipes,
+# redirects, semicolons, ampersands, null bytes. Translating the UTF-8 bytes through
+# this table maps unsafe bytes to 1 and everything else to 0.
+_UNSAFE_CONFIG_BYTES = frozenset(b"`$|<>&;\x00")
+_UNSAFE_BYTE_TABLE = bytes(1 if b in _UNSAFE_CONFIG_BYTES else 0 for b in range(256))
+
+# Schema field `default = ...` forms: double-quoted, single-quoted, and bare (up to comma or paren)
+_DEFAULT_DQ_RE = re.compile(r'default\s*=\s*"([^"]*)"')
+_DEFAULT_SQ_RE = re.compile(r"default\s*=\s*'([^']*)'")
+_DEFAULT_RAW_RE = re.compile(r'default\s*=\s*([^,\)]+)')
+
+# Per-type conversion of config values to their CLI string form (anything else uses str())
+_CLI_VALUE_CONVERTERS = {
+    bool: lambda value: "true" if value else "false",
+    str: lambda value: value,
+}
+
+
+def _to_cli_value(value: Any) -> str:
+    """Convert a config value to the string Pixlet expects on the command line."""
+    return _CLI_VALUE_CONVERTERS.get(type(value), str)(value)
+
+
+def _is_executable_file(path: str) -> bool:
+    """Check with a single stat call that path is a regular file with an execute bit set."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+def _has_unsafe_shell_chars(value: str) -> bool:
+    """Check whether a config value contains any rejected shell metacharacter."""
+    # Multi-byte UTF-8 sequences never contain ASCII bytes, so a byte-level scan is exact
+    return 1 in value.encode('utf-8', 'surrogatepass').translate(_UNSAFE_BYTE_TABLE)
+
+
+def _resolve_working_directory(star_file: str) -> Optional[str]:
+    """
+    Resolve the directory Pixlet should run in for a .star file.
+
+    Args:
+        star_file: Path to .star file
+
+    Returns:
+        Resolved parent directory, or None if empty or invalid
+    """
+    try:
+        resolved_parent = os.path.dirname(os.path.abspath(star_file))
+        # Return None if empty string to avoid FileNotFoundError
+        if not resolved_parent:
+            logger.debug(f"Empty parent directory for star_file: {star_file}")
+            return None
+        return resolved_parent
+    except (OSError, ValueError):
+        logger.debug(f"Could not resolve working directory for: {star_file}")
+        return None
+
 
 class PixletRenderer:
     """
@@ -38,12 +110,25 @@ class PixletRenderer:
             timeout: Maximum seconds to wait for rendering
         """
         self.timeout = timeout
-        self.pixlet_binary = self._find_pixlet_binary(pixlet_path)
-
-        if self.pixlet_binary:
-            logger.info(f"[Starlark Pixlet] Pixlet renderer initialized with binary: {self.pixlet_binary}")
-        else:
-            logger.warning("[Starlark Pixlet] Pixlet binary not found - rendering will fail")
+        # Cached `pixlet version` probe: (monotonic timestamp, succeeded, version string)
+        self._version_probe: Optional[Tuple[float, bool, Optional[str]]] = None
+        # Binary lookup is deferred until first needed (schema extraction never needs it)
+        self._explicit_path = pixlet_path
+        self._binary_resolved = False
+        self._pixlet_binary: Optional[str] = None
+
+    @property
+    def pixlet_binary(self) -> Optional[str]:
+        """Path to the Pixlet binary, resolved and cached on first access."""
+        if not self._binary_resolved:
+            self._pixlet_binary = self._find_pixlet_binary(self._explicit_path)
+            self._binary_resolved = True
+
+            if self._pixlet_binary:
+                logger.info(f"[Starlark Pixlet] Using Pixlet binary: {self._pixlet_binary}")
+            else:
+                logger.warning("[Starlark Pixlet] Pixlet binary not found - rendering will fail")
+        return self._pixlet_binary
 
     def _find_pixlet_binary(self, explicit_path: Optional[str] = None) -> Optional[str]:
         """
@@ -59,26 +144,29 @@ class PixletRenderer:
             Path to Pixlet binary, or None if not found
         """
         # 1. Check explicit path
-        if explicit_path and os.path.isfile(explicit_path):
-            if os.access(explicit_path, os.X_OK):
+        if explicit_path:
+            if _is_executable_file(explicit_path):
                 logger.debug(f"Using explicit Pixlet path: {explicit_path}")
                 return explicit_path
-            else:
+            if os.path.isfile(explicit_path):
                 logger.warning(f"Explicit Pixlet path not executable: {explicit_path}")
 
         # 2. Check bundled binary
         try:
             bundled_path = self._get_bundled_binary_path()
-            if bundled_path and os.path.isfile(bundled_path):
+            if bundled_path:
+                if _is_executable_file(bundled_path):
+                    logger.debug(f"Using bundled Pixlet binary: {bundled_path}")
+                    return bundled_path
+
                 # Ensure executable
-                if not os.access(bundled_path, os.X_OK):
-                    try:
-                        os.chmod(bundled_path, 0o755)
-                        logger.debug(f"Made bundled binary executable: {bundled_path}")
-                    except OSError:
-                        logger.exception(f"Could not make bundled binary executable: {bundled_path}")
-
-                if os.access(bundled_path, os.X_OK):
+                try:
+                    os.chmod(bundled_path, 0o755)
+                    logger.debug(f"Made bundled binary executable: {bundled_path}")
+                except OSError:
+                    logger.exception(f"Could not make bundled binary executable: {bundled_path}")
+
+                if _is_executable_file(bundled_path):
                     logger.debug(f"Using bundled Pixlet binary: {bundled_path}")
                     return bundled_path
         except OSError:
@@ -131,7 +219,7 @@ class PixletRenderer:
                 return None
 
             binary_path = bin_dir / binary_name
-            if binary_path.exists():
+            if binary_path.is_file():
                 return str(binary_path)
 
             logger.debug(f"Bundled binary not found at: {binary_path}")
@@ -151,27 +239,27 @@ class PixletRenderer:
         Returns:
             Resolved parent directory, or None if empty or invalid
         """
-        try:
-            resolved_parent = os.path.dirname(os.path.abspath(star_file))
-            # Return None if empty string to avoid FileNotFoundError
-            if not resolved_parent:
-                logger.debug(f"Empty parent directory for star_file: {star_file}")
-                return None
-            return resolved_parent
-        except (OSError, ValueError):
-            logger.debug(f"Could not resolve working directory for: {star_file}")
-            return None
+        return _resolve_working_directory(str(star_file))
 
-    def is_available(self) -> bool:
+    def _probe_version(self) -> Tuple[bool, Optional[str]]:
         """
-        Check if Pixlet is available and functional.
+        Run `pixlet version` and cache the outcome.
+
+        Pixlet has no long-lived server mode to talk to, so every probe costs a
+        full Go binary cold start. The result is reused for VERSION_PROBE_TTL
+        seconds so status checks don't spawn a process each time.
 
         Returns:
-            True if Pixlet can be executed
+            Tuple of (succeeded: bool, version: Optional[str])
         """
         if not self.pixlet_binary:
-            return False
+            return False, None
+
+        now = time.monotonic()
+        if self._version_probe and now - self._version_probe[0] < VERSION_PROBE_TTL:
+            return self._version_probe[1], self._version_probe[2]
 
+        succeeded, version = False, None
         try:
             result = subprocess.run(
                 [self.pixlet_binary, "version"],
@@ -179,13 +267,24 @@ class PixletRenderer:
                 text=True,
                 timeout=5
             )
-            return result.returncode == 0
+            if result.returncode == 0:
+                succeeded, version = True, result.stdout.strip()
         except subprocess.TimeoutExpired:
             logger.debug("Pixlet version check timed out")
-            return False
         except (subprocess.SubprocessError, OSError):
             logger.exception("Pixlet not available")
-            return False
+
+        self._version_probe = (now, succeeded, version)
+        return succeeded, version
+
+    def is_available(self) -> bool:
+        """
+        Check if Pixlet is available and functional.
+
+        Returns:
+            True if Pixlet can be executed
+        """
+        return self._probe_version()[0]
 
     def get_version(self) -> Optional[str]:
         """
@@ -194,24 +293,85 @@ class PixletRenderer:
         Returns:
             Version string, or None if unavailable
         """
-        if not self.pixlet_binary:
-            return None
+        return self._probe_version()[1]
 
-        try:
-            result = subprocess.run(
-                [self.pixlet_binary, "version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except subprocess.TimeoutExpired:
-            logger.debug("Pixlet version check timed out")
-        except (subprocess.SubprocessError, OSError):
-            logger.exception("Could not get Pixlet version")
+    def _build_cmd(
+        self,
+        star_file: str,
+        output_path: str,
+        config: Optional[Dict[str, Any]],
+        magnify: int
+    ) -> List[str]:
+        """
+        Build the `pixlet render` command line.
 
-        return None
+        Args:
+            star_file: Path to .star file
+            output_path: Where to save WebP output
+            config: Configuration dictionary to pass to app
+            magnify: Magnification factor
+
+        Returns:
+            Command argument list
+        """
+        # Config params must be POSITIONAL between star_file and flags
+        # Format: pixlet render <file.star> [key=value]... [flags]
+        cmd = [
+            self.pixlet_binary,
+            "render",
+            star_file
+        ]
+
+        # Add configuration parameters as positional arguments (BEFORE flags)
+        if config:
+            cmd.extend(self._build_config_args(config))
+
+        # Add flags AFTER positional config arguments
+        cmd.extend([
+            "-o", output_path,
+            "-m", str(magnify)
+        ])
+
+        # Build sanitized command for logging (redact sensitive values)
+        sanitized_cmd = [self.pixlet_binary, "render", star_file]
+        if config:
+            config_keys = list(config.keys())
+            sanitized_cmd.append(f"[{len(config_keys)} config entries: {', '.join(config_keys)}]")
+        sanitized_cmd.extend(["-o", output_path, "-m", str(magnify)])
+        logger.debug(f"Executing Pixlet: {' '.join(sanitized_cmd)}")
+
+        return cmd
+
+    def _check_render_result(
+        self,
+        returncode: int,
+        stderr: str,
+        star_file: str,
+        output_path: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Turn a finished Pixlet process into a render result.
+
+        Args:
+            returncode: Pixlet exit code
+            stderr: Pixlet error output
+            star_file: Path to rendered .star file
+            output_path: Expected WebP output path
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        if returncode == 0:
+            if os.path.isfile(output_path):
+                logger.debug(f"Successfully rendered: {star_file} -> {output_path}")
+                return True, None
+            error = "Rendering succeeded but output file not found"
+            logger.error(error)
+            return False, error
+
+        error = f"Pixlet failed (exit {returncode}): {stderr}"
+        logger.error(error)
+        return False, error
 
     def render(
         self,
@@ -239,54 +399,7 @@ class PixletRenderer:
             return False, f"Star file not found: {star_file}"
 
         try:
-            # Build command - config params must be POSITIONAL between star_file and flags
-            # Format: pixlet render <file.star> [key=value]... [flags]
-            cmd = [
-                self.pixlet_binary,
-                "render",
-                star_file
-            ]
-
-            # Add configuration parameters as positional arguments (BEFORE flags)
-            if config:
-                for key, value in config.items():
-                    # Validate key format (alphanumeric + underscore only)
-                    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', key):
-                        logger.warning(f"Skipping invalid config key: {key}")
-                        continue
-
-                    # Convert value to string for CLI
-                    if isinstance(value, bool):
-                        value_str = "true" if value else "false"
-                    elif isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
-                        # JSON string - keep as-is, will be properly quoted by subprocess
-                        value_str = value
-                    else:
-                        value_str = str(value)
-
-                    # Validate value doesn't contain dangerous shell metacharacters
-                    # Block: backticks, $(), pipes, redirects, semicolons, ampersands, null bytes
-                    # Allow: most printable chars including spaces, quotes, brackets, braces
-                    if re.search(r'[`$|<>&;\x00]|\$\(', value_str):
-                        logger.warning(f"Skipping config value with unsafe shell characters for key {key}: {value_str}")
-                        continue
-
-                    # Add as positional argument (not -c flag)
-                    cmd.append(f"{key}={value_str}")
-
-            # Add flags AFTER positional config arguments
-            cmd.extend([
-                "-o", output_path,
-                "-m", str(magnify)
-            ])
-
-            # Build sanitized command for logging (redact sensitive values)
-            sanitized_cmd = [self.pixlet_binary, "render", star_file]
-            if config:
-                config_keys = list(config.keys())
-                sanitized_cmd.append(f"[{len(config_keys)} config entries: {', '.join(config_keys)}]")
-            sanitized_cmd.extend(["-o", output_path, "-m", str(magnify)])
-            logger.debug(f"Executing Pixlet: {' '.join(sanitized_cmd)}")
+            cmd = self._build_cmd(star_file, output_path, config, magnify)
 
             # Execute rendering
             safe_cwd = self._get_safe_working_directory(star_file)
@@ -297,19 +410,7 @@ class PixletRenderer:
                 timeout=self.timeout,
                 cwd=safe_cwd  # Run in .star file directory (or None if relative path)
             )
-
-            if result.returncode == 0:
-                if os.path.isfile(output_path):
-                    logger.debug(f"Successfully rendered: {star_file} -> {output_path}")
-                    return True, None
-                else:
-                    error = "Rendering succeeded but output file not found"
-                    logger.error(error)
-                    return False, error
-            else:
-                error = f"Pixlet failed (exit {result.returncode}): {result.stderr}"
-                logger.error(error)
-                return False, error
+            return self._check_render_result(result.returncode, result.stderr, star_file, output_path)
 
         except subprocess.TimeoutExpired:
             error = f"Rendering timeout after {self.timeout}s"
@@ -319,6 +420,127 @@ class PixletRenderer:
             logger.exception("Rendering exception")
             return False, "Rendering failed - see logs for details"
 
+    async def render_async(
+        self,
+        star_file: str,
+        output_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        magnify: int = 1
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Render a .star file to WebP output without blocking the event loop.
+
+        Same contract as render(), for callers already running inside asyncio.
+        Callers that want to cap concurrent Pixlet processes should wrap calls
+        in their own asyncio.Semaphore.
+
+        Args:
+            star_file: Path to .star file
+            output_path: Where to save WebP output
+            config: Configuration dictionary to pass to app
+            magnify: Magnification factor (default 1)
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        loop = asyncio.get_running_loop()
+        # Binary lookup and file checks stat the filesystem, keep them off the loop
+        pixlet_binary = await loop.run_in_executor(None, lambda: self.pixlet_binary)
+        if not pixlet_binary:
+            return False, "Pixlet binary not found"
+
+        if not await loop.run_in_executor(None, os.path.isfile, star_file):
+            return False, f"Star file not found: {star_file}"
+
+        proc = None
+        try:
+            cmd = self._build_cmd(star_file, output_path, config, magnify)
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._get_safe_working_directory(star_file)
+            )
+            _, stderr = await asyncio.wait_for(proc.communicate(), self.timeout)
+            stderr_text = stderr.decode('utf-8', errors='replace') if stderr else ""
+            return await loop.run_in_executor(
+                None, self._check_render_result, proc.returncode, stderr_text, star_file, output_path
+            )
+
+        except asyncio.TimeoutError:
+            error = f"Rendering timeout after {self.timeout}s"
+            logger.error(error)
+            return False, error
+        except OSError:
+            logger.exception("Rendering exception")
+            return False, "Rendering failed - see logs for details"
+        finally:
+            # Kill and reap the child on timeout and on cancellation alike, so a
+            # cancelled render never leaves a Pixlet process behind
+            if proc is not None and proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+
+    def render_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Render several .star files concurrently.
+
+        `pixlet render` only accepts one file per invocation, so each job still
+        spawns its own process; running them from a thread pool lets the process
+        start-up and rendering of different apps overlap. More workers lower the
+        total wall time of a batch but make each individual render slower and
+        less predictable on small devices, so tune max_workers to the hardware.
+
+        Args:
+            jobs: List of keyword-argument dicts for render() (star_file, output_path,
+                  and optionally config and magnify)
+            max_workers: Maximum concurrent Pixlet processes (default: CPU count)
+
+        Returns:
+            List of (success, error_message) tuples in the same order as jobs
+        """
+        if not jobs:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pixlet-render") as executor:
+            return list(executor.map(lambda job: self.render(**job), jobs))
+
+    def _build_config_args(self, config: Dict[str, Any]) -> List[str]:
+        """
+        Convert a config dict into positional `key=value` Pixlet arguments.
+
+        Entries with invalid keys or values containing shell metacharacters
+        are skipped with a warning. JSON strings are passed through as-is and
+        quoted by subprocess.
+
+        Args:
+            config: Configuration dictionary to pass to app
+
+        Returns:
+            List of `key=value` argument strings
+        """
+        args = []
+        for key, value in config.items():
+            if not _VALID_CONFIG_KEY(key):
+                logger.warning(f"Skipping invalid config key: {key}")
+                continue
+
+            value_str = _to_cli_value(value)
+            if _has_unsafe_shell_chars(value_str):
+                logger.warning(f"Skipping config value with unsafe shell characters for key {key}: {value_str}")
+                continue
+
+            args.append(f"{key}={value_str}")
+        return args
+
     def extract_schema(self, star_file: str) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
         """
         Extract configuration schema from a .star file by parsing source code.
@@ -334,13 +556,38 @@ class PixletRenderer:
         Returns:
             Tuple of (success: bool, schema: Optional[Dict], error: Optional[str])
         """
-        if not os.path.isfile(star_file):
+        try:
+            fd = os.open(star_file, os.O_RDONLY)
+        except OSError:
             return False, None, f"Star file not found: {star_file}"
 
         try:
-            # Read .star file
-            with open(star_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read the whole .star file as bytes; apps without a schema skip
+            # decoding and parsing entirely
+            try:
+                st = os.fstat(fd)
+                is_regular = stat.S_ISREG(st.st_mode)
+            except OSError:
+                is_regular = False
+            if not is_regular:
+                os.close(fd)
+                return False, None, f"Star file not found: {star_file}"
+            with os.fdopen(fd, 'rb') as f:
+                size = st.st_size
+                if size <= MAX_SCHEMA_SOURCE_BYTES:
+                    # read() loops until EOF; the cap also catches files that grew after fstat
+                    data = f.read(MAX_SCHEMA_SOURCE_BYTES + 1)
+                    size = len(data)
+            if size > MAX_SCHEMA_SOURCE_BYTES:
+                error = f"Star file too large for schema extraction ({size} bytes): {star_file}"
+                logger.warning(error)
+                return False, None, error
+
+            if b'get_schema' not in data:
+                logger.debug(f"No schema found in: {star_file}")
+                return True, None, None
+
+            content = data.decode('utf-8')
 
             # Parse schema from source
             schema = self._parse_schema_from_source(content, star_file)
@@ -587,23 +834,20 @@ class PixletRenderer:
             field_dict['icon'] = icon_match.group(1)
 
         # default (can be string, bool, or variable reference)
-        # First try to match quoted strings (which may contain commas)
-        default_match = re.search(r'default\s*=\s*"([^"]*)"', params_text)
-        if not default_match:
-            # Try single quotes
-            default_match = re.search(r"default\s*=\s*'([^']*)'", params_text)
-        if not default_match:
+        # First try to match quoted strings (which may contain commas), double then single quotes
+        default_match = _DEFAULT_DQ_RE.search(params_text) or _DEFAULT_SQ_RE.search(params_text)
+        default_quoted = default_match is not None
+        if not default_quoted:
             # Fall back to unquoted value (stop at comma or closing paren)
-            default_match = re.search(r'default\s*=\s*([^,\)]+)', params_text)
+            default_match = _DEFAULT_RAW_RE.search(params_text)
 
         if default_match:
             default_value = default_match.group(1).strip()
             # Handle boolean
             if default_value in ('True', 'False'):
                 field_dict['default'] = default_value.lower()
-            # Handle string literal from first two patterns (already extracted without quotes)
-            elif re.search(r'default\s*=\s*["\']', params_text):
-                # This was a quoted string, use the captured content directly
+            # Handle string literal from the quoted patterns (already extracted without quotes)
+            elif default_quoted:
                 field_dict['default'] = default_value
             # Handle variable reference (can't resolve, use as-is)
             else:
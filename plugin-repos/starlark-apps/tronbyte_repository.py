@@ -5,22 +5,310 @@ Handles interaction with the Tronbyte apps repository on GitHub.
 Fetches app listings, metadata, and downloads .star files.
 """
 
+import asyncio
+import copy
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import random
+import re
+import tempfile
 import time
 import requests
 import yaml
 import threading
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, NamedTuple, Optional, List, Tuple
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-# Module-level cache for bulk app listing (survives across requests)
-_apps_cache = {'data': None, 'timestamp': 0, 'categories': [], 'authors': []}
+
+class _AppsCache(NamedTuple):
+    """Immutable bulk app listing with its derived indexes."""
+    timestamp: float
+    apps: List[Dict[str, Any]]
+    categories: List[str]
+    authors: List[str]
+    etag: Optional[str]
+    search_index: List[str]
+    by_category: Dict[str, List[Dict[str, Any]]]
+
+
+# Module-level cache for bulk app listing (survives across requests). Always replaced
+# wholesale by a single assignment, so readers use it without taking a lock.
+_apps_cache: Optional[_AppsCache] = None
 _CACHE_TTL = 7200  # 2 hours
+# Held while loading or refreshing _apps_cache so only one thread fetches from GitHub
+_refresh_lock = threading.Lock()
+# Guards _tree_cache
 _cache_lock = threading.Lock()
 
+# Matches names that could escape their directory ('..', '/' or '\\'); one scan per name
+_PATH_TRAVERSAL = re.compile(r'\.\.|[/\\]').search
+
+# On-disk copy of _apps_cache so restarted processes skip the bulk fetch
+_DISK_CACHE_PATH = Path.home() / '.cache' / 'ledmatrix' / 'tronbyte_apps.json'
+_disk_cache_checked = False
+
+# Recursive git tree per branch: {branch: {'timestamp', 'etag', 'entries': [(path, type), ...]}}
+_tree_cache: Dict[str, Dict[str, Any]] = {}
+
+# Text bodies of raw files with their ETags: {url: (etag, text)}. Revalidated with
+# If-None-Match so unchanged files come back as an empty 304.
+_raw_etag_cache: Dict[str, Tuple[str, str]] = {}
+_RAW_ETAG_CACHE_MAX = 4096
+_raw_etag_lock = threading.Lock()
+
+# Successfully parsed manifests from get_app_metadata(): {app_id: (timestamp, metadata)}.
+# Entries expire with the app cache TTL and are dropped whenever the listing is refetched.
+_app_metadata_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_APP_METADATA_CACHE_MAX = 512
+_app_metadata_lock = threading.Lock()
+
+# Returned instead of a body when GitHub answers a conditional request with 304
+NOT_MODIFIED = object()
+
+# HTTP sessions shared by all TronbyteRepository instances, one per GitHub token
+_sessions: Dict[Optional[str], requests.Session] = {}
+_session_lock = threading.Lock()
+
+# Optional pre-built manifest listing (generated by scripts/build_manifest_snapshot.py)
+_SNAPSHOT_PATH = Path(__file__).with_name('manifests_snapshot.py')
+_snapshot_checked = False
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed manifests keyed by a hash of their text, so unchanged manifests are not re-parsed
+_manifest_parse_cache: Dict[bytes, Any] = {}
+_MANIFEST_PARSE_CACHE_MAX = 4096
+_manifest_parse_lock = threading.Lock()
+_PARSE_MISS = object()
+
+
+def _load_manifest_snapshot() -> Optional[List[Dict[str, Any]]]:
+    """
+    Load the pre-built app listing shipped next to this module, if present.
+
+    Returns:
+        List of app metadata dicts, or None if no usable snapshot exists
+    """
+    if not _SNAPSHOT_PATH.is_file():
+        return None
+
+    try:
+        spec = importlib.util.spec_from_file_location('manifests_snapshot', str(_SNAPSHOT_PATH))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except (ImportError, SyntaxError, OSError) as e:
+        logger.warning("[Tronbyte Repo] Could not load manifest snapshot: %s", e)
+        return None
+
+    apps = getattr(module, 'APPS', None)
+    if not isinstance(apps, list):
+        logger.warning("[Tronbyte Repo] Manifest snapshot has no APPS list, ignoring it")
+        return None
+    return apps
+
+
+def _parse_manifest_yaml(content: str) -> Any:
+    """
+    Parse manifest YAML, reusing the result for byte-identical content.
+
+    Args:
+        content: manifest.yaml text
+
+    Returns:
+        Parsed YAML document (a private copy the caller may mutate)
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    with _manifest_parse_lock:
+        parsed = _manifest_parse_cache.get(key, _PARSE_MISS)
+    if parsed is _PARSE_MISS:
+        parsed = yaml.load(content, Loader=_YAML_LOADER)
+        with _manifest_parse_lock:
+            if len(_manifest_parse_cache) >= _MANIFEST_PARSE_CACHE_MAX:
+                _manifest_parse_cache.clear()
+            _manifest_parse_cache[key] = parsed
+    return copy.deepcopy(parsed)
+
+
+def _get_raw_etag(url: str) -> Optional[Tuple[str, str]]:
+    """Return the cached (etag, text) for a raw file URL, if any."""
+    with _raw_etag_lock:
+        return _raw_etag_cache.get(url)
+
+
+def _remember_raw_etag(url: str, etag: Optional[str], text: str) -> None:
+    """Remember a raw file body under its ETag for later conditional requests."""
+    if not etag:
+        return
+    with _raw_etag_lock:
+        if len(_raw_etag_cache) >= _RAW_ETAG_CACHE_MAX:
+            _raw_etag_cache.clear()
+        _raw_etag_cache[url] = (etag, text)
+
+
+def _get_cached_app_metadata(app_id: str) -> Optional[Dict[str, Any]]:
+    """Return a private copy of an app's memoized manifest, if cached and unexpired."""
+    with _app_metadata_lock:
+        entry = _app_metadata_cache.get(app_id)
+    if entry is None or (time.time() - entry[0]) >= _CACHE_TTL:
+        return None
+    return copy.deepcopy(entry[1])
+
+
+def _remember_app_metadata(app_id: str, metadata: Dict[str, Any]) -> None:
+    """Memoize a private copy of an app's parsed manifest."""
+    metadata = copy.deepcopy(metadata)
+    with _app_metadata_lock:
+        if len(_app_metadata_cache) >= _APP_METADATA_CACHE_MAX:
+            _app_metadata_cache.clear()
+        _app_metadata_cache[app_id] = (time.time(), metadata)
+
+
+def _build_search_index(apps: List[Dict[str, Any]]) -> List[str]:
+    """
+    Build the lowercased searchable text for each app, parallel to the apps list.
+
+    Args:
+        apps: App metadata dicts
+
+    Returns:
+        List of search strings (name, summary, description, author, id)
+    """
+    return [
+        ' '.join(str(app.get(field) or '') for field in ('name', 'summary', 'desc', 'author', 'id')).lower()
+        for app in apps
+    ]
+
+
+def _build_listing_indexes(
+    apps: List[Dict[str, Any]]
+) -> Tuple[List[str], List[str], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Collect categories, authors and category buckets in a single pass over the apps.
+
+    Args:
+        apps: App metadata dicts
+
+    Returns:
+        Tuple of (sorted categories, sorted authors, dict mapping lowercased
+        category to its apps in listing order)
+    """
+    categories = set()
+    authors = set()
+    by_category: Dict[str, List[Dict[str, Any]]] = {}
+    for app in apps:
+        category = app.get('category')
+        author = app.get('author')
+        if category:
+            categories.add(category)
+        if author:
+            authors.add(author)
+        by_category.setdefault(str(category or '').lower(), []).append(app)
+    return sorted(categories), sorted(authors), by_category
+
+
+def _build_apps_cache(
+    apps: List[Dict[str, Any]],
+    timestamp: float,
+    etag: Optional[str] = None
+) -> _AppsCache:
+    """
+    Build a cache entry, with categories, authors and indexes, for a sorted app listing.
+
+    Args:
+        apps: App metadata dicts, already sorted
+        timestamp: Time the listing was fetched
+        etag: ETag of the GitHub directory listing the apps came from
+
+    Returns:
+        New cache entry
+    """
+    categories, authors, by_category = _build_listing_indexes(apps)
+    return _AppsCache(
+        timestamp=timestamp,
+        apps=apps,
+        categories=categories,
+        authors=authors,
+        etag=etag,
+        search_index=_build_search_index(apps),
+        by_category=by_category,
+    )
+
+
+def _apps_cache_result(cache: _AppsCache, cached: bool) -> Dict[str, Any]:
+    """Shape a cache entry as the list_all_apps_cached() result."""
+    return {
+        'apps': cache.apps,
+        'categories': cache.categories,
+        'authors': cache.authors,
+        'count': len(cache.apps),
+        'cached': cached
+    }
+
+
+def _load_disk_cache() -> Optional[_AppsCache]:
+    """
+    Read the on-disk copy of the app cache.
+
+    Returns:
+        Cache entry (possibly expired), or None if missing or unreadable
+    """
+    try:
+        with open(_DISK_CACHE_PATH, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("[Tronbyte Repo] Ignoring unreadable app cache %s: %s", _DISK_CACHE_PATH, e)
+        return None
+
+    if not isinstance(record, dict) or not isinstance(record.get('data'), list):
+        logger.warning("[Tronbyte Repo] Ignoring malformed app cache %s", _DISK_CACHE_PATH)
+        return None
+
+    logger.info("[Tronbyte Repo] Loaded %s apps from %s", len(record['data']), _DISK_CACHE_PATH)
+    return _build_apps_cache(record['data'], float(record.get('timestamp') or 0), record.get('etag'))
+
+
+def _save_disk_cache(cache: _AppsCache) -> None:
+    """Atomically write a cache entry to disk (indexes are rebuilt on load, not persisted)."""
+    record = {
+        'timestamp': cache.timestamp,
+        'data': cache.apps,
+        'categories': cache.categories,
+        'authors': cache.authors,
+        'etag': cache.etag,
+    }
+
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(_DISK_CACHE_PATH.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, default=str)
+            os.replace(temp_path, _DISK_CACHE_PATH)
+        except (OSError, TypeError, ValueError):
+            os.unlink(temp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("[Tronbyte Repo] Could not persist app cache to %s: %s", _DISK_CACHE_PATH, e)
+
 
 class TronbyteRepository:
     """
@@ -37,6 +325,14 @@ class TronbyteRepository:
     REPO_NAME = "apps"
     DEFAULT_BRANCH = "main"
     APPS_PATH = "apps"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    GRAPHQL_BATCH_SIZE = 100  # Manifest blobs requested per GraphQL query
+    HTTP_POOL_SIZE = 32  # Keep-alive connections kept per host
+    STREAM_CHUNK_SIZE = 65536  # Bytes written per chunk when downloading files
+    ASSET_DOWNLOAD_WORKERS = 8  # Parallel downloads per app in download_app_assets
+    MAX_RETRIES = 3  # Retries for rate-limited (403/429) and 5xx API responses
+    MAX_RETRY_WAIT = 30  # Seconds; rate limits that reset later than this are not waited out
+    ASSET_DIRS = ('images', 'sources', 'fonts', 'assets')  # Common asset directory names in Tronbyte apps
 
     def __init__(self, github_token: Optional[str] = None):
         """
@@ -49,15 +345,40 @@ class TronbyteRepository:
         self.base_url = "https://api.github.com"
         self.raw_url = "https://raw.githubusercontent.com"
 
-        self.session = requests.Session()
+        # Shared with every other instance using the same token, so per-request
+        # instances (the web API creates one per call) reuse open connections
+        with _session_lock:
+            session = _sessions.get(github_token)
+            if session is None:
+                session = _sessions[github_token] = self._create_session(github_token)
+        self.session = session
+
+    @classmethod
+    def _create_session(cls, github_token: Optional[str]) -> requests.Session:
+        """
+        Create an HTTP session for talking to GitHub.
+
+        Args:
+            github_token: Optional GitHub personal access token
+
+        Returns:
+            Session with connection pooling and GitHub headers set up
+        """
+        session = requests.Session()
+        # One keep-alive pool per host (api.github.com, raw.githubusercontent.com) sized
+        # for the manifest fan-out, so worker threads reuse TLS connections
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=cls.HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
         if github_token:
-            self.session.headers.update({
+            session.headers.update({
                 'Authorization': f'token {github_token}'
             })
-        self.session.headers.update({
+        session.headers.update({
             'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'LEDMatrix-Starlark-Plugin'
+            'User-Agent': 'LEDMatrix-Starlark-Plugin',
+            'Connection': 'keep-alive'
         })
+        return session
 
     def _make_request(self, url: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """
@@ -70,32 +391,295 @@ class TronbyteRepository:
         Returns:
             JSON response or None on error
         """
-        try:
-            response = self.session.get(url, timeout=timeout)
+        return self._request_json(url, timeout=timeout)[0]
 
-            if response.status_code == 403:
+    def _request_json(self, url: str, timeout: int = 10, etag: Optional[str] = None) -> Tuple[Any, Optional[str]]:
+        """
+        Make a (optionally conditional) request to GitHub API with error handling.
+
+        Args:
+            url: API URL to request
+            timeout: Request timeout in seconds
+            etag: ETag from a previous response; sent as If-None-Match
+
+        Returns:
+            Tuple of (JSON response, NOT_MODIFIED, or None on error; response ETag)
+        """
+        headers = {'If-None-Match': etag} if etag else None
+        try:
+            for attempt in range(self.MAX_RETRIES + 1):
+                response = self.session.get(url, timeout=timeout, headers=headers)
+                if attempt == self.MAX_RETRIES:
+                    break
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    break
+                logger.warning("[Tronbyte Repo] GitHub API returned %s for %s, retrying in %.1fs",
+                               response.status_code, url, delay)
+                time.sleep(delay)
+
+            if response.status_code == 304:
+                # Unchanged since etag; does not count against the rate limit
+                return NOT_MODIFIED, etag
+            elif response.status_code in (403, 429):
                 # Rate limit exceeded
                 logger.warning("[Tronbyte Repo] GitHub API rate limit exceeded")
-                return None
+                return None, None
             elif response.status_code == 404:
-                logger.warning(f"[Tronbyte Repo] Resource not found: {url}")
-                return None
+                logger.warning("[Tronbyte Repo] Resource not found: %s", url)
+                return None, None
             elif response.status_code != 200:
-                logger.error(f"[Tronbyte Repo] GitHub API error: {response.status_code}")
+                logger.error("[Tronbyte Repo] GitHub API error: %s", response.status_code)
+                return None, None
+
+            return response.json(), response.headers.get('ETag')
+
+        except requests.Timeout:
+            logger.error("[Tronbyte Repo] Request timeout: %s", url)
+            return None, None
+        except requests.RequestException as e:
+            logger.error("[Tronbyte Repo] Request error: %s", e, exc_info=True)
+            return None, None
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error("[Tronbyte Repo] JSON parse error for %s: %s", url, e, exc_info=True)
+            return None, None
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a GitHub API response.
+
+        Rate-limited responses wait for Retry-After or X-RateLimit-Reset; server
+        errors back off exponentially. Both add up to a second of random jitter.
+
+        Args:
+            response: Response to the previous attempt
+            attempt: Zero-based number of the previous attempt
+
+        Returns:
+            Seconds to sleep, or None if the response should not be retried
+        """
+        status = response.status_code
+        if status in (403, 429):
+            headers = response.headers
+            try:
+                if 'Retry-After' in headers:
+                    # Secondary rate limit
+                    delay = float(headers['Retry-After'])
+                elif headers.get('X-RateLimit-Remaining') == '0':
+                    delay = max(0.0, float(headers.get('X-RateLimit-Reset', 0)) - time.time())
+                else:
+                    # Permission error rather than a rate limit
+                    return None
+            except ValueError:
                 return None
+        elif 500 <= status < 600:
+            delay = float(2 ** attempt)
+        else:
+            return None
+
+        if delay > self.MAX_RETRY_WAIT:
+            return None
+        return delay + random.uniform(0, 1)
+
+    def _graphql(self, query: str, variables: Dict[str, Any], timeout: int = 15) -> Optional[Dict[str, Any]]:
+        """
+        Run a GitHub GraphQL query.
 
-            return response.json()
+        GitHub's GraphQL API only accepts authenticated requests, so this returns
+        None without a token and callers fall back to the REST endpoints.
+
+        Args:
+            query: GraphQL query text
+            variables: Query variables
+            timeout: Request timeout in seconds
+
+        Returns:
+            The response's `data` object, or None on error
+        """
+        if not self.github_token:
+            return None
+
+        try:
+            response = self.session.post(
+                self.GRAPHQL_URL,
+                json={'query': query, 'variables': variables},
+                timeout=timeout
+            )
+            if response.status_code != 200:
+                logger.warning("[Tronbyte Repo] GitHub GraphQL error: %s", response.status_code)
+                return None
+
+            payload = response.json()
+            if payload.get('errors'):
+                logger.warning("[Tronbyte Repo] GitHub GraphQL query failed: %s", payload['errors'])
+            return payload.get('data')
 
         except requests.Timeout:
-            logger.error(f"[Tronbyte Repo] Request timeout: {url}")
+            logger.error("[Tronbyte Repo] GitHub GraphQL request timeout")
             return None
         except requests.RequestException as e:
-            logger.error(f"[Tronbyte Repo] Request error: {e}", exc_info=True)
+            logger.error("[Tronbyte Repo] GitHub GraphQL request error: %s", e, exc_info=True)
             return None
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"[Tronbyte Repo] JSON parse error for {url}: {e}", exc_info=True)
+        except (json.JSONDecodeError, ValueError, AttributeError) as e:
+            logger.error("[Tronbyte Repo] GitHub GraphQL parse error: %s", e, exc_info=True)
+            return None
+
+    def _fetch_manifest_texts_graphql(self, app_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch manifest.yaml text for many apps with batched GraphQL queries.
+
+        Each query aliases up to GRAPHQL_BATCH_SIZE blob lookups, so the whole
+        listing costs a handful of requests instead of one per app.
+
+        Args:
+            app_ids: App identifiers
+
+        Returns:
+            Dict mapping app_id to manifest text (apps that failed are omitted)
+        """
+        texts: Dict[str, str] = {}
+        if not self.github_token:
+            return texts
+
+        for start in range(0, len(app_ids), self.GRAPHQL_BATCH_SIZE):
+            batch = app_ids[start:start + self.GRAPHQL_BATCH_SIZE]
+            var_decls = ', '.join(f'$e{i}: String!' for i in range(len(batch)))
+            fields = ' '.join(f'm{i}: object(expression: $e{i}) {{ ... on Blob {{ text }} }}' for i in range(len(batch)))
+            query = f'query($owner: String!, $name: String!, {var_decls}) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}'
+            variables = {'owner': self.REPO_OWNER, 'name': self.REPO_NAME}
+            for i, app_id in enumerate(batch):
+                variables[f'e{i}'] = f"{self.DEFAULT_BRANCH}:{self.APPS_PATH}/{app_id}/manifest.yaml"
+
+            data = self._graphql(query, variables)
+            repository = (data or {}).get('repository') or {}
+            for i, app_id in enumerate(batch):
+                blob = repository.get(f'm{i}') or {}
+                if blob.get('text'):
+                    texts[app_id] = blob['text']
+
+        return texts
+
+    def _fetch_all_manifests_async(self, app_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch manifest.yaml text for many apps concurrently on one asyncio loop.
+
+        raw.githubusercontent.com is not rate-limited, so all requests are issued
+        at once over a shared aiohttp connection pool.
+
+        Args:
+            app_ids: App identifiers
+
+        Returns:
+            Dict mapping app_id to manifest text (apps that failed are omitted)
+        """
+        texts: Dict[str, str] = {}
+
+        async def fetch_all():
+            timeout = aiohttp.ClientTimeout(total=10)
+            connector = aiohttp.TCPConnector(limit=64)
+            headers = {'User-Agent': self.session.headers.get('User-Agent', '')}
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+
+                async def fetch(app_id: str):
+                    url = (f"{self.raw_url}/{self.REPO_OWNER}/{self.REPO_NAME}/{self.DEFAULT_BRANCH}/"
+                           f"{self.APPS_PATH}/{app_id}/manifest.yaml")
+                    cached = _get_raw_etag(url)
+                    headers = {'If-None-Match': cached[0]} if cached else None
+                    try:
+                        async with session.get(url, headers=headers) as response:
+                            if response.status == 304 and cached:
+                                texts[app_id] = cached[1]
+                            elif response.status == 200:
+                                texts[app_id] = await response.text()
+                                _remember_raw_etag(url, response.headers.get('ETag'), texts[app_id])
+                            else:
+                                logger.warning("[Tronbyte Repo] Failed to fetch manifest for %s (%s)", app_id, response.status)
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.warning("[Tronbyte Repo] Network error fetching manifest for %s: %s", app_id, e)
+
+                await asyncio.gather(*(fetch(app_id) for app_id in app_ids))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Called from inside a running event loop; callers fall back to the thread pool
+            logger.debug("[Tronbyte Repo] Async manifest fetch unavailable inside a running event loop")
+            return {}
+
+        try:
+            asyncio.run(fetch_all())
+        except Exception as e:
+            logger.warning("[Tronbyte Repo] Async manifest fetch failed: %s", e, exc_info=True)
+        return texts
+
+    def _list_asset_files_graphql(self, app_id: str) -> Optional[Dict[str, List[str]]]:
+        """
+        List an app's asset directories and their files with one GraphQL query.
+
+        Args:
+            app_id: App identifier
+
+        Returns:
+            Dict mapping asset directory name to file names, or None if unavailable
+        """
+        query = (
+            'query($owner: String!, $name: String!, $expr: String!) { repository(owner: $owner, name: $name) {'
+            ' object(expression: $expr) { ... on Tree { entries { name type'
+            ' object { ... on Tree { entries { name type } } } } } } } }'
+        )
+        data = self._graphql(query, {
+            'owner': self.REPO_OWNER,
+            'name': self.REPO_NAME,
+            'expr': f"{self.DEFAULT_BRANCH}:{self.APPS_PATH}/{app_id}",
+        })
+        tree = ((data or {}).get('repository') or {}).get('object')
+        if not tree or 'entries' not in tree:
             return None
 
+        asset_files = {}
+        for entry in tree['entries']:
+            if entry.get('type') == 'tree' and entry.get('name') in self.ASSET_DIRS:
+                sub_entries = (entry.get('object') or {}).get('entries') or []
+                asset_files[entry['name']] = [e.get('name') for e in sub_entries if e.get('type') == 'blob']
+        return asset_files
+
+    def _list_asset_files_rest(self, app_id: str) -> Tuple[Optional[Dict[str, List[str]]], Optional[str]]:
+        """
+        List an app's asset directories and their files via the contents API.
+
+        Costs one request for the app directory plus one per asset directory.
+
+        Args:
+            app_id: App identifier
+
+        Returns:
+            Tuple of (dict mapping asset directory name to file names, error_message)
+        """
+        url = f"{self.base_url}/repos/{self.REPO_OWNER}/{self.REPO_NAME}/contents/{self.APPS_PATH}/{app_id}"
+        data = self._make_request(url)
+        if not data:
+            return None, "Failed to fetch app directory listing"
+
+        if not isinstance(data, list):
+            return None, "Invalid directory listing format"
+
+        asset_files = {}
+        for item in data:
+            dir_name = item.get('name')
+            if item.get('type') != 'dir' or dir_name not in self.ASSET_DIRS:
+                continue
+
+            # Get files in this directory
+            dir_data = self._make_request(item.get('url'))
+            if not dir_data or not isinstance(dir_data, list):
+                logger.warning("Could not list files in %s/%s", app_id, dir_name)
+                continue
+            asset_files[dir_name] = [f.get('name') for f in dir_data if f.get('type') == 'file']
+
+        return asset_files, None
+
     def _fetch_raw_file(self, file_path: str, branch: Optional[str] = None, binary: bool = False):
         """
         Fetch raw file content from repository.
@@ -105,26 +689,79 @@ class TronbyteRepository:
             branch: Branch name (default: DEFAULT_BRANCH)
             binary: If True, return bytes; if False, return text
 
+        Text files are fetched conditionally: if the file is unchanged since the
+        last download (304 Not Modified), the previously downloaded text is returned.
+
         Returns:
             File content as string/bytes, or None on error
         """
         branch = branch or self.DEFAULT_BRANCH
         url = f"{self.raw_url}/{self.REPO_OWNER}/{self.REPO_NAME}/{branch}/{file_path}"
 
+        cached = None if binary else _get_raw_etag(url)
+        headers = {'If-None-Match': cached[0]} if cached else None
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                return response.content if binary else response.text
+            response = self.session.get(url, timeout=10, headers=headers)
+            if response.status_code == 304 and cached:
+                return cached[1]
+            elif response.status_code == 200:
+                if binary:
+                    return response.content
+                _remember_raw_etag(url, response.headers.get('ETag'), response.text)
+                return response.text
             else:
-                logger.warning(f"[Tronbyte Repo] Failed to fetch raw file: {file_path} ({response.status_code})")
+                logger.warning("[Tronbyte Repo] Failed to fetch raw file: %s (%s)", file_path, response.status_code)
                 return None
         except requests.Timeout:
-            logger.error(f"[Tronbyte Repo] Timeout fetching raw file: {file_path}")
+            logger.error("[Tronbyte Repo] Timeout fetching raw file: %s", file_path)
             return None
         except requests.RequestException as e:
-            logger.error(f"[Tronbyte Repo] Network error fetching raw file {file_path}: {e}", exc_info=True)
+            logger.error("[Tronbyte Repo] Network error fetching raw file %s: %s", file_path, e, exc_info=True)
             return None
 
+    def _stream_raw_file(self, file_path: str, dest: Path, branch: Optional[str] = None,
+                         allow_empty: bool = True) -> bool:
+        """
+        Download a raw file from the repository straight to disk, in chunks.
+
+        Args:
+            file_path: Path to file in repository
+            dest: Local file to write
+            branch: Branch name (default: DEFAULT_BRANCH)
+            allow_empty: Whether a zero-byte body counts as a successful download
+
+        Returns:
+            True if the file was written, False on error (no partial file is left behind)
+        """
+        branch = branch or self.DEFAULT_BRANCH
+        url = f"{self.raw_url}/{self.REPO_OWNER}/{self.REPO_NAME}/{branch}/{file_path}"
+
+        try:
+            with self.session.get(url, stream=True, timeout=10) as response:
+                if response.status_code != 200:
+                    logger.warning("[Tronbyte Repo] Failed to fetch raw file: %s (%s)", file_path, response.status_code)
+                    return False
+                written = 0
+                with open(dest, 'wb') as f:
+                    # iter_content (not response.raw) so gzip transfer encoding is decoded
+                    for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                        written += f.write(chunk)
+            if written or allow_empty:
+                return True
+            logger.warning("[Tronbyte Repo] Empty response for raw file: %s", file_path)
+        except requests.Timeout:
+            logger.error("[Tronbyte Repo] Timeout fetching raw file: %s", file_path)
+        except requests.RequestException as e:
+            logger.error("[Tronbyte Repo] Network error fetching raw file %s: %s", file_path, e, exc_info=True)
+        except OSError as e:
+            logger.warning("[Tronbyte Repo] Failed to save %s to %s: %s", file_path, dest, e, exc_info=True)
+
+        try:
+            dest.unlink()
+        except OSError:
+            pass
+        return False
+
     def list_apps(self) -> Tuple[bool, Optional[List[Dict[str, Any]]], Optional[str]]:
         """
         List all available apps in the repository.
@@ -132,9 +769,106 @@ class TronbyteRepository:
         Returns:
             Tuple of (success, apps_list, error_message)
         """
-        url = f"{self.base_url}/repos/{self.REPO_OWNER}/{self.REPO_NAME}/contents/{self.APPS_PATH}"
+        # Walk the recursive tree if an earlier asset download already fetched it
+        entries = self._get_tree(fetch=False)
+        if entries is not None:
+            prefix = f"{self.APPS_PATH}/"
+            apps = []
+            for path, entry_type in entries:
+                app_id = path[len(prefix):] if path.startswith(prefix) else ''
+                if entry_type == 'tree' and app_id and '/' not in app_id and not app_id.startswith('.'):
+                    apps.append({
+                        'id': app_id,
+                        'path': path,
+                        'url': f"{self._apps_listing_url()}/{app_id}"
+                    })
+            logger.info("Found %s apps in repository", len(apps))
+            return True, apps, None
 
-        data = self._make_request(url)
+        return self._parse_app_listing(self._make_request(self._apps_listing_url()))
+
+    def _get_tree(self, branch: Optional[str] = None, fetch: bool = True) -> Optional[List[Tuple[str, str]]]:
+        """
+        Get every (path, type) entry of the repository with one recursive Git Trees call.
+
+        The tree is cached per branch for the app cache TTL and revalidated with
+        its ETag afterwards, so repeated asset downloads cost no extra listings.
+
+        Args:
+            branch: Branch name (default: DEFAULT_BRANCH)
+            fetch: If False, only return an already cached, unexpired tree
+
+        Returns:
+            List of (path, type) tuples where type is 'blob' or 'tree', or None if
+            unavailable (including when GitHub truncated the listing)
+        """
+        branch = branch or self.DEFAULT_BRANCH
+        now = time.time()
+        with _cache_lock:
+            cached = _tree_cache.get(branch)
+        if cached and now - cached['timestamp'] < _CACHE_TTL:
+            return cached['entries']
+        if not fetch:
+            return None
+
+        url = f"{self.base_url}/repos/{self.REPO_OWNER}/{self.REPO_NAME}/git/trees/{branch}?recursive=1"
+        data, etag = self._request_json(url, timeout=30, etag=cached['etag'] if cached else None)
+        if data is NOT_MODIFIED:
+            entries = cached['entries']
+        elif isinstance(data, dict) and isinstance(data.get('tree'), list):
+            if data.get('truncated'):
+                logger.warning("[Tronbyte Repo] Repository tree listing truncated by GitHub, not using it")
+                return None
+            entries = [(item.get('path', ''), item.get('type', '')) for item in data['tree']]
+        else:
+            return None
+
+        with _cache_lock:
+            _tree_cache[branch] = {'timestamp': now, 'etag': etag, 'entries': entries}
+        return entries
+
+    def _list_asset_files_tree(self, app_id: str) -> Optional[Dict[str, List[str]]]:
+        """
+        List an app's asset directories and their files from the cached repository tree.
+
+        Args:
+            app_id: App identifier
+
+        Returns:
+            Dict mapping asset directory name to file names, or None if the tree is unavailable
+        """
+        entries = self._get_tree()
+        if entries is None:
+            return None
+
+        app_prefix = f"{self.APPS_PATH}/{app_id}/"
+        asset_files: Dict[str, List[str]] = {}
+        for path, entry_type in entries:
+            if not path.startswith(app_prefix):
+                continue
+            parts = path[len(app_prefix):].split('/')
+            if parts[0] not in self.ASSET_DIRS:
+                continue
+            if len(parts) == 1 and entry_type == 'tree':
+                asset_files.setdefault(parts[0], [])
+            elif len(parts) == 2 and entry_type == 'blob':
+                asset_files.setdefault(parts[0], []).append(parts[1])
+        return asset_files
+
+    def _apps_listing_url(self) -> str:
+        """GitHub contents API URL for the apps directory."""
+        return f"{self.base_url}/repos/{self.REPO_OWNER}/{self.REPO_NAME}/contents/{self.APPS_PATH}"
+
+    def _parse_app_listing(self, data: Any) -> Tuple[bool, Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Turn a contents API listing of the apps directory into app entries.
+
+        Args:
+            data: Decoded JSON response, or None if the request failed
+
+        Returns:
+            Tuple of (success, apps_list, error_message)
+        """
         if data is None:
             return False, None, "Failed to fetch repository contents"
 
@@ -153,14 +887,15 @@ class TronbyteRepository:
                         'url': item.get('url')
                     })
 
-        logger.info(f"Found {len(apps)} apps in repository")
+        logger.info("Found %s apps in repository", len(apps))
         return True, apps, None
 
     def get_app_metadata(self, app_id: str) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
         """
         Fetch metadata for a specific app.
 
-        Reads the manifest.yaml file for the app and parses it.
+        Reads the manifest.yaml file for the app and parses it. Successful results
+        are memoized for the app cache TTL, so repeat calls skip the network.
 
         Args:
             app_id: App identifier
@@ -168,6 +903,10 @@ class TronbyteRepository:
         Returns:
             Tuple of (success, metadata_dict, error_message)
         """
+        metadata = _get_cached_app_metadata(app_id)
+        if metadata is not None:
+            return True, metadata, None
+
         manifest_path = f"{self.APPS_PATH}/{app_id}/manifest.yaml"
 
         content = self._fetch_raw_file(manifest_path)
@@ -175,15 +914,15 @@ class TronbyteRepository:
             return False, None, f"Failed to fetch manifest for {app_id}"
 
         try:
-            metadata = yaml.safe_load(content)
+            metadata = _parse_manifest_yaml(content)
 
             # Validate that metadata is a dict before mutating
             if not isinstance(metadata, dict):
                 if metadata is None:
-                    logger.warning(f"Manifest for {app_id} is empty or None, initializing empty dict")
+                    logger.warning("Manifest for %s is empty or None, initializing empty dict", app_id)
                     metadata = {}
                 else:
-                    logger.error(f"Manifest for {app_id} is not a dict (got {type(metadata).__name__}), skipping")
+                    logger.error("Manifest for %s is not a dict (got %s), skipping", app_id, type(metadata).__name__)
                     return False, None, f"Invalid manifest format: expected dict, got {type(metadata).__name__}"
 
             # Enhance with app_id
@@ -194,10 +933,11 @@ class TronbyteRepository:
                 # Schema is already parsed from YAML
                 pass
 
+            _remember_app_metadata(app_id, metadata)
             return True, metadata, None
 
         except (yaml.YAMLError, TypeError) as e:
-            logger.error(f"Failed to parse manifest for {app_id}: {e}")
+            logger.error("Failed to parse manifest for %s: %s", app_id, e)
             return False, None, f"Invalid manifest format: {e}"
 
     def list_apps_with_metadata(self, max_apps: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -215,7 +955,7 @@ class TronbyteRepository:
         success, apps, error = self.list_apps()
 
         if not success:
-            logger.error(f"Failed to list apps: {error}")
+            logger.error("Failed to list apps: %s", error)
             return []
 
         if max_apps is not None:
@@ -244,55 +984,129 @@ class TronbyteRepository:
 
         return apps_with_metadata
 
-    def list_all_apps_cached(self) -> Dict[str, Any]:
+    def list_all_apps_cached(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Fetch ALL apps with metadata, using a module-level cache.
 
-        On first call (or after cache TTL expires), fetches the directory listing
-        via the GitHub API (1 call) then fetches all manifests in parallel via
-        raw.githubusercontent.com (not rate-limited). Results are cached for 2 hours.
+        On first call, seeds the cache from the shipped manifest snapshot when one
+        exists. Otherwise (or after cache TTL expires, or when force_refresh is set),
+        fetches the directory listing via the GitHub API (1 call) then fetches all
+        manifests in parallel via raw.githubusercontent.com (not rate-limited).
+        Results are cached for 2 hours.
+
+        Cache hits never take a lock. Only one thread refreshes at a time; while
+        it does, other callers get the previous (stale) listing if there is one.
+
+        Args:
+            force_refresh: Skip the cache and snapshot and fetch from GitHub
 
         Returns:
             Dict with keys: apps, categories, authors, count, cached
         """
-        global _apps_cache
-
         now = time.time()
 
-        # Check cache with lock (read-only check)
-        with _cache_lock:
-            if _apps_cache['data'] is not None and (now - _apps_cache['timestamp']) < _CACHE_TTL:
-                return {
-                    'apps': _apps_cache['data'],
-                    'categories': _apps_cache['categories'],
-                    'authors': _apps_cache['authors'],
-                    'count': len(_apps_cache['data']),
-                    'cached': True
-                }
+        # Lock-free fast path
+        cache = _apps_cache
+        if not force_refresh and cache is not None and (now - cache.timestamp) < _CACHE_TTL:
+            return _apps_cache_result(cache, cached=True)
+
+        if not _refresh_lock.acquire(blocking=False):
+            # Another thread is already refreshing; serve stale data instead of piling on
+            cache = _apps_cache
+            if cache is not None:
+                return _apps_cache_result(cache, cached=True)
+            _refresh_lock.acquire()
 
-        # Fetch directory listing (1 GitHub API call)
-        success, app_dirs, error = self.list_apps()
+        try:
+            return self._refresh_apps_cache(now, force_refresh)
+        finally:
+            _refresh_lock.release()
+
+    def _refresh_apps_cache(self, now: float, force_refresh: bool) -> Dict[str, Any]:
+        """
+        Load or re-fetch the bulk app listing. Caller must hold _refresh_lock.
+
+        Args:
+            now: Time list_all_apps_cached() was called
+            force_refresh: Skip the cache and snapshot and fetch from GitHub
+
+        Returns:
+            Dict with keys: apps, categories, authors, count, cached
+        """
+        global _apps_cache, _snapshot_checked, _disk_cache_checked
+
+        # Another thread may have refreshed while this one waited for the lock
+        cache = _apps_cache
+        if cache is not None and (cache.timestamp >= now or
+                                  (not force_refresh and (now - cache.timestamp) < _CACHE_TTL)):
+            return _apps_cache_result(cache, cached=True)
+
+        listing_etag = None
+        if not force_refresh:
+            # Cold start: prefer the on-disk copy, then the shipped snapshot
+            if cache is None and not _disk_cache_checked:
+                _disk_cache_checked = True
+                cache = _load_disk_cache()
+                if cache is not None:
+                    _apps_cache = cache
+                    if (now - cache.timestamp) < _CACHE_TTL:
+                        return _apps_cache_result(cache, cached=True)
+
+            if cache is None and not _snapshot_checked:
+                _snapshot_checked = True
+                snapshot_apps = _load_manifest_snapshot()
+                if snapshot_apps:
+                    _apps_cache = cache = _build_apps_cache(snapshot_apps, now)
+                    logger.info("[Tronbyte Repo] Loaded %s apps from manifest snapshot", len(snapshot_apps))
+                    return _apps_cache_result(cache, cached=True)
+
+            # A stale listing can still be revalidated with its ETag
+            listing_etag = cache.etag if cache is not None else None
+
+        # Fetch directory listing (1 GitHub API call, free when answered with 304)
+        data, new_etag = self._request_json(self._apps_listing_url(), etag=listing_etag)
+        if data is NOT_MODIFIED:
+            _apps_cache = cache = cache._replace(timestamp=now)
+            logger.info("[Tronbyte Repo] App listing unchanged, reusing cached manifests")
+            _save_disk_cache(cache)
+            return _apps_cache_result(cache, cached=True)
+
+        success, app_dirs, error = self._parse_app_listing(data)
         if not success or not app_dirs:
-            logger.error(f"Failed to list apps for bulk fetch: {error}")
+            logger.error("Failed to list apps for bulk fetch: %s", error)
             return {'apps': [], 'categories': [], 'authors': [], 'count': 0, 'cached': False}
 
-        logger.info(f"Bulk-fetching manifests for {len(app_dirs)} apps...")
+        # The listing changed (or a refresh was forced), so drop memoized single-app manifests
+        with _app_metadata_lock:
+            _app_metadata_cache.clear()
+
+        logger.info("Bulk-fetching manifests for %s apps...", len(app_dirs))
+
+        # With a token, pull manifest text in a few batched GraphQL queries, then fetch
+        # the rest concurrently on one event loop when aiohttp is installed
+        prefetched = self._fetch_manifest_texts_graphql([info['id'] for info in app_dirs])
+        if AIOHTTP_AVAILABLE:
+            missing_ids = [info['id'] for info in app_dirs if info['id'] not in prefetched]
+            if missing_ids:
+                prefetched.update(self._fetch_all_manifests_async(missing_ids))
 
         def fetch_one(app_info):
             """Fetch a single app's manifest (runs in thread pool)."""
             app_id = app_info['id']
-            manifest_path = f"{self.APPS_PATH}/{app_id}/manifest.yaml"
-            content = self._fetch_raw_file(manifest_path)
+            content = prefetched.get(app_id)
+            if content is None:
+                manifest_path = f"{self.APPS_PATH}/{app_id}/manifest.yaml"
+                content = self._fetch_raw_file(manifest_path)
             if content:
                 try:
-                    metadata = yaml.safe_load(content)
+                    metadata = _parse_manifest_yaml(content)
                     if not isinstance(metadata, dict):
                         metadata = {}
                     metadata['id'] = app_id
                     metadata['repository_path'] = app_info.get('path', '')
                     return metadata
                 except (yaml.YAMLError, TypeError) as e:
-                    logger.warning(f"Failed to parse manifest for {app_id}: {e}")
+                    logger.warning("Failed to parse manifest for %s: %s", app_id, e)
             # Fallback: minimal entry
             return {
                 'id': app_id,
@@ -301,10 +1115,13 @@ class TronbyteRepository:
                 'repository_path': app_info.get('path', ''),
             }
 
+        # Already fetched manifests only need parsing
+        apps_with_metadata = [fetch_one(info) for info in app_dirs if info['id'] in prefetched]
+
         # Parallel manifest fetches via raw.githubusercontent.com (high rate limit)
-        apps_with_metadata = []
+        remaining = [info for info in app_dirs if info['id'] not in prefetched]
         with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(fetch_one, info): info for info in app_dirs}
+            futures = {executor.submit(fetch_one, info): info for info in remaining}
             for future in as_completed(futures):
                 try:
                     result = future.result(timeout=30)
@@ -312,7 +1129,7 @@ class TronbyteRepository:
                         apps_with_metadata.append(result)
                 except Exception as e:
                     app_info = futures[future]
-                    logger.warning(f"Failed to fetch manifest for {app_info['id']}: {e}")
+                    logger.warning("Failed to fetch manifest for %s: %s", app_info['id'], e)
                     apps_with_metadata.append({
                         'id': app_info['id'],
                         'name': app_info['id'].replace('_', ' ').replace('-', ' ').title(),
@@ -323,26 +1140,13 @@ class TronbyteRepository:
         # Sort by name for consistent ordering
         apps_with_metadata.sort(key=lambda a: (a.get('name') or a.get('id', '')).lower())
 
-        # Extract unique categories and authors
-        categories = sorted({a.get('category', '') for a in apps_with_metadata if a.get('category')})
-        authors = sorted({a.get('author', '') for a in apps_with_metadata if a.get('author')})
+        # Extract unique categories and authors and publish the new cache
+        _apps_cache = cache = _build_apps_cache(apps_with_metadata, now, new_etag)
+        _save_disk_cache(cache)
 
-        # Update cache with lock
-        with _cache_lock:
-            _apps_cache['data'] = apps_with_metadata
-            _apps_cache['timestamp'] = now
-            _apps_cache['categories'] = categories
-            _apps_cache['authors'] = authors
+        logger.info("Cached %s apps (%s categories, %s authors)", len(cache.apps), len(cache.categories), len(cache.authors))
 
-        logger.info(f"Cached {len(apps_with_metadata)} apps ({len(categories)} categories, {len(authors)} authors)")
-
-        return {
-            'apps': apps_with_metadata,
-            'categories': categories,
-            'authors': authors,
-            'count': len(apps_with_metadata),
-            'cached': False
-        }
+        return _apps_cache_result(cache, cached=False)
 
     def download_star_file(self, app_id: str, output_path: Path, filename: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """
@@ -358,15 +1162,14 @@ class TronbyteRepository:
             Tuple of (success, error_message)
         """
         # Validate inputs for path traversal
-        if '..' in app_id or '/' in app_id or '\\' in app_id:
+        if _PATH_TRAVERSAL(app_id):
             return False, f"Invalid app_id: contains path traversal characters"
 
         star_filename = filename or f"{app_id}.star"
-        if '..' in star_filename or '/' in star_filename or '\\' in star_filename:
+        if _PATH_TRAVERSAL(star_filename):
             return False, f"Invalid filename: contains path traversal characters"
 
         # Validate output_path to prevent path traversal
-        import tempfile
         try:
             resolved_output = output_path.resolve()
             temp_dir = Path(tempfile.gettempdir()).resolve()
@@ -380,31 +1183,27 @@ class TronbyteRepository:
                 is_safe = str(resolved_output).startswith(str(temp_dir) + '/')
 
             if not is_safe:
-                logger.warning(f"Path traversal attempt in download_star_file: app_id={app_id}, output_path={output_path}")
+                logger.warning("Path traversal attempt in download_star_file: app_id=%s, output_path=%s", app_id, output_path)
                 return False, f"Invalid output_path for {app_id}: must be within temp directory"
         except Exception as e:
-            logger.error(f"Error validating output_path for {app_id}: {e}")
+            logger.error("Error validating output_path for %s: %s", app_id, e)
             return False, f"Invalid output_path for {app_id}"
 
         # Use provided filename or fall back to app_id.star
         star_path = f"{self.APPS_PATH}/{app_id}/{star_filename}"
 
-        content = self._fetch_raw_file(star_path)
-        if not content:
-            return False, f"Failed to download .star file for {app_id} (tried {star_filename})"
-
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            logger.info(f"Downloaded {app_id}.star to {output_path}")
-            return True, None
-
         except OSError as e:
-            logger.exception(f"Failed to save .star file: {e}")
+            logger.exception("Failed to save .star file: %s", e)
             return False, f"Failed to save file: {e}"
 
+        if not self._stream_raw_file(star_path, output_path, allow_empty=False):
+            return False, f"Failed to download .star file for {app_id} (tried {star_filename})"
+
+        logger.info("Downloaded %s.star to %s", app_id, output_path)
+        return True, None
+
     def get_app_files(self, app_id: str) -> Tuple[bool, Optional[List[str]], Optional[str]]:
         """
         List all files in an app directory.
@@ -439,83 +1238,67 @@ class TronbyteRepository:
             Tuple of (success, error_message)
         """
         # Validate app_id for path traversal
-        if '..' in app_id or '/' in app_id or '\\' in app_id:
+        if _PATH_TRAVERSAL(app_id):
             return False, f"Invalid app_id: contains path traversal characters"
 
         try:
-            # Get directory listing for the app
-            url = f"{self.base_url}/repos/{self.REPO_OWNER}/{self.REPO_NAME}/contents/{self.APPS_PATH}/{app_id}"
-            data = self._make_request(url)
-            if not data:
-                return False, f"Failed to fetch app directory listing"
-
-            if not isinstance(data, list):
-                return False, f"Invalid directory listing format"
-
-            # Find directories that contain assets (images, sources, etc.)
-            asset_dirs = []
-            for item in data:
-                if item.get('type') == 'dir':
-                    dir_name = item.get('name')
-                    # Common asset directory names in Tronbyte apps
-                    if dir_name in ('images', 'sources', 'fonts', 'assets'):
-                        asset_dirs.append((dir_name, item.get('url')))
-
-            if not asset_dirs:
+            # One GraphQL query when a token is configured, then the cached recursive
+            # tree, and per-directory REST listings only if neither is available
+            asset_files = self._list_asset_files_graphql(app_id)
+            if asset_files is None:
+                asset_files = self._list_asset_files_tree(app_id)
+            if asset_files is None:
+                asset_files, error = self._list_asset_files_rest(app_id)
+                if asset_files is None:
+                    return False, error
+
+            if not asset_files:
                 # No asset directories, this is fine
                 return True, None
 
-            # Download each asset directory
-            for dir_name, dir_url in asset_dirs:
+            # Collect every file to download, creating the local directories up front
+            downloads = []
+            for dir_name, file_names in asset_files.items():
                 # Validate directory name for path traversal
-                if '..' in dir_name or '/' in dir_name or '\\' in dir_name:
-                    logger.warning(f"Skipping potentially unsafe directory: {dir_name}")
-                    continue
-
-                # Get files in this directory
-                dir_data = self._make_request(dir_url)
-                if not dir_data or not isinstance(dir_data, list):
-                    logger.warning(f"Could not list files in {app_id}/{dir_name}")
+                if _PATH_TRAVERSAL(dir_name):
+                    logger.warning("Skipping potentially unsafe directory: %s", dir_name)
                     continue
 
                 # Create local directory
                 local_dir = output_dir / dir_name
                 local_dir.mkdir(parents=True, exist_ok=True)
 
-                # Download each file
-                for file_item in dir_data:
-                    if file_item.get('type') == 'file':
-                        file_name = file_item.get('name')
-
-                        # Ensure file_name is a non-empty string before validation
-                        if not file_name or not isinstance(file_name, str):
-                            logger.warning(f"Skipping file with invalid name in {dir_name}: {file_item}")
-                            continue
-
-                        # Validate filename for path traversal
-                        if '..' in file_name or '/' in file_name or '\\' in file_name:
-                            logger.warning(f"Skipping potentially unsafe file: {file_name}")
-                            continue
-
-                        file_path = f"{self.APPS_PATH}/{app_id}/{dir_name}/{file_name}"
-                        content = self._fetch_raw_file(file_path, binary=True)
-                        if content:
-                            # Write binary content to file
-                            output_path = local_dir / file_name
-                            try:
-                                with open(output_path, 'wb') as f:
-                                    f.write(content)
-                                logger.debug(f"[Tronbyte Repo] Downloaded asset: {dir_name}/{file_name}")
-                            except OSError as e:
-                                logger.warning(f"[Tronbyte Repo] Failed to save {dir_name}/{file_name}: {e}", exc_info=True)
-                        else:
-                            logger.warning(f"Failed to download {dir_name}/{file_name}")
-
-            logger.info(f"[Tronbyte Repo] Downloaded assets for {app_id} ({len(asset_dirs)} directories)")
+                for file_name in file_names:
+                    # Ensure file_name is a non-empty string before validation
+                    if not file_name or not isinstance(file_name, str):
+                        logger.warning("Skipping file with invalid name in %s: %r", dir_name, file_name)
+                        continue
+
+                    # Validate filename for path traversal
+                    if _PATH_TRAVERSAL(file_name):
+                        logger.warning("Skipping potentially unsafe file: %s", file_name)
+                        continue
+
+                    downloads.append((f"{dir_name}/{file_name}", local_dir / file_name))
+
+            # Download the files in parallel
+            with ThreadPoolExecutor(max_workers=self.ASSET_DOWNLOAD_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._stream_raw_file, f"{self.APPS_PATH}/{app_id}/{rel_path}", dest): rel_path
+                    for rel_path, dest in downloads
+                }
+                for future in as_completed(futures):
+                    rel_path = futures[future]
+                    if future.result():
+                        logger.debug("[Tronbyte Repo] Downloaded asset: %s", rel_path)
+                    else:
+                        logger.warning("Failed to download %s", rel_path)
+
+            logger.info("[Tronbyte Repo] Downloaded assets for %s (%s directories)", app_id, len(asset_files))
             return True, None
 
         except (OSError, ValueError) as e:
-            logger.exception(f"[Tronbyte Repo] Error downloading assets for {app_id}: {e}")
+            logger.exception("[Tronbyte Repo] Error downloading assets for %s: %s", app_id, e)
             return False, f"Error downloading assets: {e}"
 
     def search_apps(self, query: str, apps_with_metadata: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -533,22 +1316,16 @@ class TronbyteRepository:
             return apps_with_metadata
 
         query_lower = query.lower()
-        results = []
-
-        for app in apps_with_metadata:
-            # Search in name, summary, description, author
-            searchable = ' '.join([
-                app.get('name', ''),
-                app.get('summary', ''),
-                app.get('desc', ''),
-                app.get('author', ''),
-                app.get('id', '')
-            ]).lower()
 
-            if query_lower in searchable:
-                results.append(app)
+        # Search in name, summary, description, author, id; reuse the index built
+        # with the bulk cache when searching that same listing
+        cache = _apps_cache
+        if cache is not None and apps_with_metadata is cache.apps:
+            search_index = cache.search_index
+        else:
+            search_index = _build_search_index(apps_with_metadata)
 
-        return results
+        return [app for app, searchable in zip(apps_with_metadata, search_index, strict=True) if query_lower in searchable]
 
     def filter_by_category(self, category: str, apps_with_metadata: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -565,14 +1342,13 @@ class TronbyteRepository:
             return apps_with_metadata
 
         category_lower = category.lower()
-        results = []
 
-        for app in apps_with_metadata:
-            app_category = app.get('category', '').lower()
-            if app_category == category_lower:
-                results.append(app)
+        # Use the category buckets built with the bulk cache when filtering that same listing
+        cache = _apps_cache
+        if cache is not None and apps_with_metadata is cache.apps:
+            return list(cache.by_category.get(category_lower, []))
 
-        return results
+        return [app for app in apps_with_metadata if str(app.get('category') or '').lower() == category_lower]
 
     def get_rate_limit_info(self) -> Dict[str, Any]:
         """
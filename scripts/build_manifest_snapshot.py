@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Build the Tronbyte manifest snapshot shipped with the starlark-apps plugin.
+
+Fetches every app manifest from the Tronbyte repository and writes the result
+as a Python literal to plugin-repos/starlark-apps/manifests_snapshot.py, so the
+app browser can start from an import instead of hundreds of HTTP requests and
+YAML parses.
+
+Usage:
+    python scripts/build_manifest_snapshot.py [--token GITHUB_TOKEN]
+"""
+import argparse
+import json
+import logging
+import pprint
+import sys
+from pathlib import Path
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent / "plugin-repos" / "starlark-apps"
+OUTPUT = PLUGIN_DIR / "manifests_snapshot.py"
+
+sys.path.insert(0, str(PLUGIN_DIR))
+
+from tronbyte_repository import TronbyteRepository  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def build_snapshot(github_token: str | None = None) -> int:
+    """
+    Fetch all manifests and write the snapshot module.
+
+    Args:
+        github_token: Optional GitHub token for higher API rate limits
+
+    Returns:
+        Number of apps written
+    """
+    repo = TronbyteRepository(github_token=github_token)
+    result = repo.list_all_apps_cached(force_refresh=True)
+    if not result["apps"]:
+        raise RuntimeError("No apps fetched from the Tronbyte repository")
+
+    # Round-trip through JSON so YAML-specific types (dates etc.) become plain literals
+    apps = json.loads(json.dumps(result["apps"], default=str))
+
+    OUTPUT.write_text(
+        '"""Pre-built Tronbyte app listing. Generated by scripts/build_manifest_snapshot.py - do not edit."""\n\n'
+        f"APPS = {pprint.pformat(apps, width=120, sort_dicts=True)}\n",
+        encoding="utf-8",
+    )
+    return len(apps)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the Tronbyte manifest snapshot")
+    parser.add_argument("--token", help="GitHub personal access token")
+    args = parser.parse_args()
+
+    try:
+        count = build_snapshot(args.token)
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+
+    logger.info(f"Wrote {count} apps to {OUTPUT}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
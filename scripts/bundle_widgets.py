@@ -21,12 +21,19 @@ def bundle() -> None:
         if path not in files:
             files.append(path)
 
-    parts = [f"/* Widget Bundle - {len(files)} files */"]
-    for f in files:
-        parts.append(f"\n/* === {f.name} === */")
-        parts.append(f.read_text())
+    # Skip if no widget changed since the last bundle (the directory mtime covers added/removed files)
+    newest_source = max([WIDGETS_DIR.stat().st_mtime] + [f.stat().st_mtime for f in files])
+    if OUTPUT.exists() and OUTPUT.stat().st_mtime >= newest_source:
+        print(f"{OUTPUT} is up to date")
+        return
+
+    # Concatenate the raw bytes; no decode/encode round trip
+    with open(OUTPUT, "wb") as out:
+        out.write(f"/* Widget Bundle - {len(files)} files */".encode())
+        for f in files:
+            out.write(f"\n\n/* === {f.name} === */\n".encode())
+            out.write(f.read_bytes())
 
-    OUTPUT.write_text("\n".join(parts))
     print(f"Bundled {len(files)} widget files into {OUTPUT} ({OUTPUT.stat().st_size:,} bytes)")
 
 
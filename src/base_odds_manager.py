@@ -12,13 +12,25 @@ Follows LEDMatrix configuration management patterns:
 """
 
 import time
+import random
 import logging
+import threading
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 import pytz
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import the API counter function from web interface
 try:
     from web_interface_v2 import increment_api_counter
@@ -27,6 +39,30 @@ except ImportError:
     def increment_api_counter(kind: str, count: int = 1):
         pass
 
+# Cached in place of odds data when ESPN has no odds for a game
+_NO_ODDS_MARKER = "no_odds"
+
+# Stand-in for a missing home/away odds dict; only ever read
+_NO_TEAM_ODDS: Dict[str, Any] = {}
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps_pretty(data: Any) -> str:
+    """Serialize data as indented JSON for log output, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects some values stdlib json accepts (e.g. non-str keys)
+            pass
+    return json.dumps(data, indent=2)
+
 
 class BaseOddsManager:
     """
@@ -40,6 +76,15 @@ class BaseOddsManager:
     
     Plugins can inherit from this class to get odds functionality.
     """
+
+    # League names whose ESPN API slug differs from ours; others are used as-is
+    ESPN_LEAGUE_MAP: Mapping[str, str] = MappingProxyType({
+        'ncaa_fb': 'college-football',
+        'nfl': 'nfl',
+        'nba': 'nba',
+        'mlb': 'mlb',
+        'nhl': 'nhl'
+    })
     
     def __init__(self, cache_manager, config_manager=None):
         """
@@ -58,10 +103,31 @@ class BaseOddsManager:
         self.update_interval = 3600  # 1 hour default
         self.request_timeout = 30    # 30 seconds default
         self.cache_ttl = 1800       # 30 minutes default
+        self.max_concurrent_requests = 8  # Parallel ESPN requests in get_odds_for_games
         
         # Load configuration if available
         if config_manager:
             self._load_configuration()
+
+        # Persistent session so odds requests (including concurrent ones from
+        # get_odds_for_games) reuse pooled keep-alive connections to ESPN. The pool
+        # holds at least one connection per batch worker so none are thrown away.
+        self.session = requests.Session()
+        self._retry_strategy = retry_strategy = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=max(16, self.max_concurrent_requests),
+                              max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Cache keys currently being fetched, so concurrent misses for the same
+        # game make one ESPN request instead of one each
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
     
     def _load_configuration(self):
         """Load configuration from config manager."""
@@ -75,6 +141,14 @@ class BaseOddsManager:
             self.update_interval = odds_config.get('update_interval', self.update_interval)
             self.request_timeout = odds_config.get('timeout', self.request_timeout)
             self.cache_ttl = odds_config.get('cache_ttl', self.cache_ttl)
+            try:
+                self.max_concurrent_requests = max(
+                    1, int(odds_config.get('max_concurrent_requests', self.max_concurrent_requests))
+                )
+            except (TypeError, ValueError):
+                self.logger.warning(f"Invalid max_concurrent_requests "
+                                    f"{odds_config.get('max_concurrent_requests')!r}, "
+                                    f"using {self.max_concurrent_requests}")
             
             self.logger.debug(f"BaseOddsManager configuration loaded: "
                             f"update_interval={self.update_interval}s, "
@@ -105,36 +179,164 @@ class BaseOddsManager:
         interval = update_interval_seconds or self.update_interval
         cache_key = f"odds_espn_{sport}_{league}_{event_id}"
 
-        # Check cache first
-        cached_data = self.cache_manager.get_with_auto_strategy(cache_key)
+        # Check cache first; odds past cache_ttl are still served (up to twice
+        # the TTL) while a background thread refreshes them
+        cached = self._read_cached_odds(cache_key)
+        if cached is not None:
+            odds_data, age = cached
+            if age >= self.cache_ttl:
+                self.logger.debug(f"Serving stale odds for {cache_key} ({age:.0f}s old), refreshing in background")
+                self._refresh_in_background(sport, league, event_id, cache_key, interval)
+            elif self._should_refresh_early(age):
+                self.logger.debug(f"Refreshing odds for {cache_key} early ({age:.0f}s old)")
+                self._refresh_in_background(sport, league, event_id, cache_key, interval)
+            return odds_data
+
+        # Single-flight: the first thread to miss fetches, the others wait for it
+        # and then read what it cached
+        fetch_done, is_fetcher = self._claim_fetch(cache_key)
+        if not is_fetcher:
+            self.logger.debug(f"Waiting for in-flight odds request for {cache_key}")
+            fetch_done.wait(self._inflight_wait_timeout())
+            return self._cached_odds_or_none(cache_key)
+
+        return self._fetch_and_release(sport, league, event_id, cache_key, interval, fetch_done)
+
+    def _inflight_wait_timeout(self) -> float:
+        """
+        How long a waiter should wait for another thread's in-flight fetch.
+
+        Covers every attempt the session's retry strategy may make, each bounded
+        by request_timeout, plus the backoff sleeps between them.
+
+        Returns:
+            Timeout in seconds
+        """
+        retries = self._retry_strategy.total or 0
+        backoff = sum(self._retry_strategy.backoff_factor * (2 ** attempt) for attempt in range(retries))
+        return self.request_timeout * (retries + 1) + backoff
+
+    def _read_cached_odds(self, cache_key: str) -> Optional[Tuple[Optional[Dict[str, Any]], float]]:
+        """
+        Look up cached odds for a game.
+
+        Args:
+            cache_key: Odds cache key
+
+        Returns:
+            Tuple of (odds_data, age in seconds), or None on a cache miss.
+            odds_data is None when the cache records that the game has no odds.
+        """
+        stale_limit = 2 * self.cache_ttl
+        record = self.cache_manager.get_cached_data(cache_key, max_age=stale_limit, memory_ttl=stale_limit)
+        if not isinstance(record, dict) or not record.get('data'):
+            return None
+
+        age = max(0.0, time.time() - record.get('timestamp', 0))
+        cached_data = record['data']
+        if cached_data == _NO_ODDS_MARKER:
+            self.logger.debug(f"Cached: no odds available for {cache_key}")
+            return None, age
+        self.logger.info(f"Using cached odds from ESPN for {cache_key}")
+        return cached_data, age
+
+    def _should_refresh_early(self, age: float) -> bool:
+        """
+        Decide whether to refresh odds that are still fresh.
+
+        Entries cached together would otherwise all expire together. Over the
+        last 20% of cache_ttl the chance of an early refresh rises linearly from
+        0 to 1, spreading the refreshes out.
+
+        Args:
+            age: Age of the cached entry in seconds
+
+        Returns:
+            True if the entry should be refreshed now
+        """
+        early_start = self.cache_ttl * 0.8
+        if age <= early_start:
+            return False
+        return random.random() < (age - early_start) / (self.cache_ttl * 0.2)
+
+    def _cached_odds_or_none(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return whatever odds are cached for a game, or None."""
+        cached = self._read_cached_odds(cache_key)
+        return cached[0] if cached is not None else None
 
-        if cached_data:
-            self.logger.info(f"Using cached odds from ESPN for {cache_key}")
-            return cached_data
+    def _claim_fetch(self, cache_key: str) -> Tuple[threading.Event, bool]:
+        """
+        Register a fetch for a cache key unless one is already running.
+
+        Args:
+            cache_key: Odds cache key
+
+        Returns:
+            Tuple of (event set when the fetch finishes, whether the caller
+            claimed the fetch and must release it)
+        """
+        with self._inflight_lock:
+            fetch_done = self._inflight.get(cache_key)
+            if fetch_done is not None:
+                return fetch_done, False
+            fetch_done = self._inflight[cache_key] = threading.Event()
+            return fetch_done, True
 
+    def _fetch_and_release(self, sport: str, league: str, event_id: str, cache_key: str,
+                           interval: int, fetch_done: threading.Event) -> Optional[Dict[str, Any]]:
+        """Run a claimed fetch, then wake any threads waiting on it."""
+        try:
+            return self._fetch_odds(sport, league, event_id, cache_key, interval)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            fetch_done.set()
+
+    def _refresh_in_background(self, sport: str, league: str, event_id: str, cache_key: str,
+                               interval: int) -> None:
+        """Refresh cached odds on a daemon thread unless a fetch is already running."""
+        fetch_done, is_fetcher = self._claim_fetch(cache_key)
+        if not is_fetcher:
+            return
+        threading.Thread(
+            target=self._fetch_and_release,
+            args=(sport, league, event_id, cache_key, interval, fetch_done),
+            name=f"OddsRefresh-{event_id}",
+            daemon=True,
+        ).start()
+
+    def _fetch_odds(self, sport: str, league: str, event_id: str, cache_key: str,
+                    interval: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch odds for a game from ESPN and cache the result.
+
+        Args:
+            sport: Sport name (e.g., 'football', 'basketball')
+            league: League name (e.g., 'nfl', 'nba')
+            event_id: ESPN event ID
+            cache_key: Odds cache key
+            interval: Cache TTL in seconds
+
+        Returns:
+            Dictionary containing odds data, or None if unavailable (falls back
+            to whatever is cached if the request fails)
+        """
         self.logger.info(f"Cache miss - fetching fresh odds from ESPN for {cache_key}")
         
         try:
             # Map league names to ESPN API format
-            league_mapping = {
-                'ncaa_fb': 'college-football',
-                'nfl': 'nfl',
-                'nba': 'nba',
-                'mlb': 'mlb',
-                'nhl': 'nhl'
-            }
-            
-            espn_league = league_mapping.get(league, league)
+            espn_league = self.ESPN_LEAGUE_MAP.get(league, league)
             url = f"{self.base_url}/{sport}/leagues/{espn_league}/events/{event_id}/competitions/{event_id}/odds"
             self.logger.info(f"Requesting odds from URL: {url}")
             
-            response = requests.get(url, timeout=self.request_timeout)
+            response = self.session.get(url, timeout=self.request_timeout)
             response.raise_for_status()
-            raw_data = response.json()
+            raw_data = _loads(response.content)
             
             # Increment API counter for odds data
             increment_api_counter('odds', 1)
-            self.logger.debug(f"Received raw odds data from ESPN: {json.dumps(raw_data, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Received raw odds data from ESPN: %s", _dumps_pretty(raw_data))
             
             odds_data = self._extract_espn_data(raw_data)
             if odds_data:
@@ -148,7 +350,7 @@ class BaseOddsManager:
             else:
                 self.logger.debug(f"No odds data available for {cache_key}")
                 # Cache the fact that no odds are available to avoid repeated API calls
-                self.cache_manager.set(cache_key, {"no_odds": True}, ttl=interval)
+                self.cache_manager.set(cache_key, _NO_ODDS_MARKER, ttl=interval)
             
             return odds_data
 
@@ -157,7 +359,7 @@ class BaseOddsManager:
         except json.JSONDecodeError:
             self.logger.error(f"Error decoding JSON response from ESPN API for {cache_key}.")
         
-        return self.cache_manager.get_with_auto_strategy(cache_key)
+        return self._cached_odds_or_none(cache_key)
 
     def _extract_espn_data(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -191,52 +393,66 @@ class BaseOddsManager:
                     "spread_odds": item.get("awayTeamOdds", {}).get("current", {}).get("pointSpread", {}).get("value")
                 }
             }
-            self.logger.debug(f"Returning extracted odds data: {json.dumps(extracted_data, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Returning extracted odds data: %s", _dumps_pretty(extracted_data))
             return extracted_data
         
         # Check if this is a valid empty response or an unexpected structure
         if "count" in data and data["count"] == 0 and "items" in data and data["items"] == []:
             # This is a valid empty response - no odds available for this game
-            self.logger.debug(f"No odds available for this game. Response: {json.dumps(data, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("No odds available for this game. Response: %s", _dumps_pretty(data))
             return None
         else:
             # This is an unexpected response structure
             self.logger.warning("No 'items' found in ESPN odds data.")
-            self.logger.warning(f"Unexpected response structure: {json.dumps(data, indent=2)}")
+            self.logger.warning(f"Unexpected response structure: {_dumps_pretty(data)}")
             return None
     
     def get_odds_for_games(self, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Fetch odds for multiple games efficiently.
 
+        Games are fetched concurrently so their ESPN round-trips overlap.
+
         Args:
             games: List of game dictionaries with sport, league, and id
 
         Returns:
-            List of games with odds data added
+            List of games with odds data added, in the same order
         """
-        games_with_odds = []
+        if len(games) <= 1:
+            return [self._add_odds_to_game(game) for game in games]
 
-        for game in games:
-            try:
-                sport = game.get('sport')
-                league = game.get('league')
-                event_id = game.get('id')
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrent_requests, len(games))),
+                                thread_name_prefix="OddsFetch") as executor:
+            return list(executor.map(self._add_odds_to_game, games))
+
+    def _add_odds_to_game(self, game: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch odds for one game and store them under game['odds'].
 
-                if sport and league and event_id:
-                    odds_data = self.get_odds(sport, league, event_id)
-                    game['odds'] = odds_data
-                else:
-                    game['odds'] = None
+        Args:
+            game: Game dictionary with sport, league, and id
 
-                games_with_odds.append(game)
+        Returns:
+            The same game dictionary
+        """
+        try:
+            sport = game.get('sport')
+            league = game.get('league')
+            event_id = game.get('id')
 
-            except Exception as e:
-                self.logger.error(f"Error fetching odds for game {game.get('id', 'unknown')}: {e}")
+            if sport and league and event_id:
+                game['odds'] = self.get_odds(sport, league, event_id)
+            else:
                 game['odds'] = None
-                games_with_odds.append(game)
 
-        return games_with_odds
+        except Exception as e:
+            self.logger.error(f"Error fetching odds for game {game.get('id', 'unknown')}: {e}")
+            game['odds'] = None
+
+        return game
     
     def is_odds_available(self, odds_data: Optional[Dict[str, Any]]) -> bool:
         """
@@ -248,20 +464,34 @@ class BaseOddsManager:
         Returns:
             True if valid odds are available, False otherwise
         """
+        return self._odds_fields(odds_data) is not None
+
+    def _odds_fields(self, odds_data: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        """
+        Read the summary fields out of odds data in a single pass.
+
+        Args:
+            odds_data: Odds data dictionary
+
+        Returns:
+            Tuple of (spread, over_under, home_money_line, away_money_line), or
+            None if the data has no spread, spread odds, or over/under
+        """
+        # 'no_odds' dicts are what older versions cached for games without odds
         if not odds_data or odds_data.get('no_odds'):
-            return False
-            
-        # Check for any valid odds data
-        if odds_data.get('spread') is not None:
-            return True
-        if odds_data.get('home_team_odds', {}).get('spread_odds') is not None:
-            return True
-        if odds_data.get('away_team_odds', {}).get('spread_odds') is not None:
-            return True
-        if odds_data.get('over_under') is not None:
-            return True
-            
-        return False
+            return None
+
+        home = odds_data.get('home_team_odds') or _NO_TEAM_ODDS
+        away = odds_data.get('away_team_odds') or _NO_TEAM_ODDS
+        spread = odds_data.get('spread')
+        over_under = odds_data.get('over_under')
+
+        # Check for any valid odds data (money lines alone do not count)
+        if (spread is None and over_under is None
+                and home.get('spread_odds') is None and away.get('spread_odds') is None):
+            return None
+
+        return spread, over_under, home.get('money_line'), away.get('money_line')
     
     def format_odds_summary(self, odds_data: Optional[Dict[str, Any]]) -> str:
         """
@@ -273,25 +503,22 @@ class BaseOddsManager:
         Returns:
             Formatted odds summary string
         """
-        if not self.is_odds_available(odds_data):
+        fields = self._odds_fields(odds_data)
+        if fields is None:
             return "No odds available"
+        spread, over_under, home_ml, away_ml = fields
         
         parts = []
         
         # Add spread information
-        spread = odds_data.get('spread')
         if spread is not None:
             parts.append(f"Spread: {spread}")
         
         # Add over/under
-        over_under = odds_data.get('over_under')
         if over_under is not None:
             parts.append(f"O/U: {over_under}")
         
         # Add money lines
-        home_ml = odds_data.get('home_team_odds', {}).get('money_line')
-        away_ml = odds_data.get('away_team_odds', {}).get('money_line')
-        
         if home_ml is not None:
             parts.append(f"Home ML: {home_ml}")
         if away_ml is not None:
@@ -5,10 +5,181 @@ Manages cache strategies for different data types with sport-specific configurat
 """
 
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from datetime import datetime, time as dtime
 import pytz
 
+# US stock market regular trading hours (Eastern Time)
+_ET_TZ = pytz.timezone('America/New_York')
+_MARKET_OPEN = dtime(9, 30)
+_MARKET_CLOSE = dtime(16, 0)
+
+# Strategies that do not depend on sport config, built once and shared read-only
+_STATIC_STRATEGIES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    # Ultra time-sensitive data (current weather)
+    'weather_current': MappingProxyType({
+        'max_age': 300,  # 5 minutes
+        'memory_ttl': 600,
+        'force_refresh': False
+    }),
+
+    # Market data (stocks, crypto)
+    'stocks': MappingProxyType({
+        'max_age': 600,  # 10 minutes
+        'memory_ttl': 1200,
+        'market_hours_only': True,
+        'force_refresh': False
+    }),
+    'crypto': MappingProxyType({
+        'max_age': 300,  # 5 minutes (crypto trades 24/7)
+        'memory_ttl': 600,
+        'force_refresh': False
+    }),
+
+    # Sports data
+    'sports_schedules': MappingProxyType({
+        'max_age': 86400,  # 24 hours
+        'memory_ttl': 172800,
+        'force_refresh': False
+    }),
+    'leaderboard': MappingProxyType({
+        'max_age': 604800,  # 7 days (1 week) - football rankings updated weekly
+        'memory_ttl': 1209600,  # 14 days in memory
+        'force_refresh': False
+    }),
+
+    # News and odds
+    'news': MappingProxyType({
+        'max_age': 3600,  # 1 hour
+        'memory_ttl': 7200,
+        'force_refresh': False
+    }),
+    'odds': MappingProxyType({
+        'max_age': 1800,  # 30 minutes for upcoming games
+        'memory_ttl': 3600,
+        'force_refresh': False
+    }),
+    'odds_live': MappingProxyType({
+        'max_age': 120,  # 2 minutes for live games (odds change rapidly)
+        'memory_ttl': 240,
+        'force_refresh': False
+    }),
+
+    # Static/stable data
+    'team_info': MappingProxyType({
+        'max_age': 604800,  # 1 week
+        'memory_ttl': 1209600,
+        'force_refresh': False
+    }),
+    'logos': MappingProxyType({
+        'max_age': 2592000,  # 30 days
+        'memory_ttl': 5184000,
+        'force_refresh': False
+    }),
+
+    # Default fallback
+    'default': MappingProxyType({
+        'max_age': 300,  # 5 minutes
+        'memory_ttl': 600,
+        'force_refresh': False
+    }),
+})
+_DEFAULT_STRATEGY = _STATIC_STRATEGIES['default']
+
+# Strategies whose intervals come from sport-specific config, built per call
+_LIVE_TYPES = frozenset(('live_scores', 'sports_live'))
+_DYNAMIC_TYPES = _LIVE_TYPES | {'sports_recent', 'sports_upcoming'}
+
+# Cache key patterns mapped to sport keys, checked in order
+_SPORT_PATTERNS = (
+    ('nfl', ('nfl',)),
+    ('nba', ('nba', 'basketball')),
+    ('mlb', ('mlb', 'baseball')),
+    ('nhl', ('nhl', 'hockey')),
+    ('soccer', ('soccer',)),
+    ('ncaa_fb', ('ncaa_fb', 'ncaafb', 'college_football')),
+    ('ncaa_baseball', ('ncaa_baseball', 'college_baseball')),
+    ('ncaam_basketball', ('ncaam_basketball', 'college_basketball')),
+    ('milb', ('milb', 'minor_league')),
+)
+
+
+@lru_cache(maxsize=1)
+def _is_market_open_at(epoch_second: int) -> bool:
+    """Whether the market is open at the given whole second (memoized per second)."""
+    now = datetime.fromtimestamp(epoch_second, _ET_TZ)
+    # Weekdays only (5 = Saturday, 6 = Sunday)
+    return now.weekday() < 5 and _MARKET_OPEN <= now.time() <= _MARKET_CLOSE
+
+
+@lru_cache(maxsize=4096)
+def _classify_data_type(key: str) -> str:
+    """Map a cache key to its strategy data type (memoized; keys repeat constantly)."""
+    key_lower = key.lower()
+
+    # Odds data — checked FIRST because odds keys may also contain 'live'/'current'
+    # (e.g. odds_espn_nba_game_123_live). The odds TTL (120s for live, 1800s for
+    # upcoming) must win over the generic sports_live TTL (30s) to avoid hitting
+    # the ESPN odds API every 30 seconds per game.
+    if 'odds' in key_lower:
+        # For live games, use shorter cache; for upcoming games, use longer cache
+        if 'live' in key_lower or 'current' in key_lower:
+            return 'odds_live'  # Live odds change more frequently (120s TTL)
+        return 'odds'  # Regular odds for upcoming games (1800s TTL)
+
+    # Live sports data (only reached if key does NOT contain 'odds')
+    if 'live' in key_lower or 'current' in key_lower or 'scoreboard' in key_lower:
+        return 'sports_live'
+
+    # Weather data
+    if 'weather' in key_lower:
+        return 'weather_current'
+
+    # Market data
+    if 'crypto' in key_lower:
+        return 'crypto'
+    if 'stock' in key_lower:
+        return 'stocks'
+
+    # News data
+    if 'news' in key_lower:
+        return 'news'
+
+    # Sports schedules and team info
+    if 'schedule' in key_lower or 'team_map' in key_lower or 'league' in key_lower:
+        return 'sports_schedules'
+
+    # Recent games (last few hours)
+    if 'recent' in key_lower:
+        return 'sports_recent'
+
+    # Upcoming games
+    if 'upcoming' in key_lower:
+        return 'sports_upcoming'
+
+    # Static data like logos, team info
+    if 'logo' in key_lower or 'team_info' in key_lower or 'config' in key_lower:
+        return 'team_info'
+
+    # Default fallback
+    return 'default'
+
+
+@lru_cache(maxsize=4096)
+def _classify_sport_key(key: str) -> Optional[str]:
+    """Map a cache key to the sport it belongs to, or None (memoized)."""
+    key_lower = key.lower()
+
+    for sport_key, patterns in _SPORT_PATTERNS:
+        for pattern in patterns:
+            if pattern in key_lower:
+                return sport_key
+
+    return None
+
 
 class CacheStrategy:
     """Manages cache strategies for different data types."""
@@ -23,6 +194,37 @@ class CacheStrategy:
         """
         self.config_manager = config_manager
         self.logger = logger or logging.getLogger(__name__)
+        # Per-sport "<sport>_scoreboard" sections, valid for the config dict they were read from
+        self._sport_cfg_cache: Dict[str, Any] = {}
+        self._sport_cfg_source: Optional[Any] = None
+
+    def invalidate(self) -> None:
+        """Drop memoized sport config; call after the config is edited in place."""
+        self._sport_cfg_cache = {}
+        self._sport_cfg_source = None
+
+    def _sport_cfg(self, sport_key: str) -> Any:
+        """
+        Get the "<sport_key>_scoreboard" section of the config, memoized per sport.
+
+        The memo is dropped automatically when the config manager loads or saves
+        a new config dict.
+
+        Args:
+            sport_key: Sport identifier (e.g., 'nba', 'nfl')
+
+        Returns:
+            The sport's scoreboard config, or an empty dict if it has none
+        """
+        config = self.config_manager.config
+        if config is not self._sport_cfg_source:
+            self._sport_cfg_cache = {}
+            self._sport_cfg_source = config
+        sport_cfg = self._sport_cfg_cache.get(sport_key)
+        if sport_cfg is None:
+            # All sports now use _scoreboard suffix
+            sport_cfg = self._sport_cfg_cache[sport_key] = config.get(f"{sport_key}_scoreboard", {})
+        return sport_cfg
     
     def get_sport_live_interval(self, sport_key: str) -> int:
         """
@@ -51,15 +253,12 @@ class CacheStrategy:
             return default_intervals.get(sport_key, 60)
         
         try:
-            config = self.config_manager.config
-            # All sports now use _scoreboard suffix
-            sport_config = config.get(f"{sport_key}_scoreboard", {})
-            return sport_config.get("live_update_interval", 60)  # Default to 60 seconds
+            return self._sport_cfg(sport_key).get("live_update_interval", 60)  # Default to 60 seconds
         except (KeyError, AttributeError, TypeError) as e:
             self.logger.warning("Could not get live_update_interval for %s: %s", sport_key, e, exc_info=True)
             return 60  # Default to 60 seconds
     
-    def get_cache_strategy(self, data_type: str, sport_key: Optional[str] = None) -> Dict[str, Any]:
+    def get_cache_strategy(self, data_type: str, sport_key: Optional[str] = None) -> Mapping[str, Any]:
         """
         Get cache strategy for different data types.
         Now respects sport-specific live_update_interval configurations.
@@ -69,117 +268,42 @@ class CacheStrategy:
             sport_key: Optional sport key for sport-specific intervals
             
         Returns:
-            Dictionary with cache strategy (max_age, memory_ttl, etc.)
+            Read-only mapping with cache strategy (max_age, memory_ttl, etc.)
         """
-        # Get sport-specific live interval if provided
-        live_interval = None
-        if sport_key and data_type in ['sports_live', 'live_scores']:
-            live_interval = self.get_sport_live_interval(sport_key)
-        
+        if data_type not in _DYNAMIC_TYPES:
+            return _STATIC_STRATEGIES.get(data_type, _DEFAULT_STRATEGY)
+
+        if data_type in _LIVE_TYPES:
+            # Get sport-specific live interval if provided
+            live_interval = self.get_sport_live_interval(sport_key) if sport_key else None
+            default_max_age = 15 if data_type == 'live_scores' else 30
+            max_age = live_interval or default_max_age  # Use sport-specific interval
+            return {
+                'max_age': max_age,
+                'memory_ttl': max_age * 2,  # 2x for memory cache
+                'force_refresh': True
+            }
+
         # Try to read sport-specific config for recent/upcoming
-        recent_interval = None
-        upcoming_interval = None
+        interval = None
         if self.config_manager and sport_key:
             try:
-                # All sports now use _scoreboard suffix
-                sport_cfg = self.config_manager.config.get(f"{sport_key}_scoreboard", {})
-                recent_interval = sport_cfg.get('recent_update_interval')
-                upcoming_interval = sport_cfg.get('upcoming_update_interval')
+                sport_cfg = self._sport_cfg(sport_key)
+                if data_type == 'sports_recent':
+                    interval = sport_cfg.get('recent_update_interval')
+                else:
+                    interval = sport_cfg.get('upcoming_update_interval')
             except (KeyError, AttributeError, TypeError) as e:
                 self.logger.debug("Could not read sport-specific recent/upcoming intervals for %s: %s", 
                                 sport_key, e, exc_info=True)
-        
-        strategies = {
-            # Ultra time-sensitive data (live scores, current weather)
-            'live_scores': {
-                'max_age': live_interval or 15,  # Use sport-specific interval
-                'memory_ttl': (live_interval or 15) * 2,  # 2x for memory cache
-                'force_refresh': True
-            },
-            'sports_live': {
-                'max_age': live_interval or 30,  # Use sport-specific interval
-                'memory_ttl': (live_interval or 30) * 2,
-                'force_refresh': True
-            },
-            'weather_current': {
-                'max_age': 300,  # 5 minutes
-                'memory_ttl': 600,
-                'force_refresh': False
-            },
-            
-            # Market data (stocks, crypto)
-            'stocks': {
-                'max_age': 600,  # 10 minutes
-                'memory_ttl': 1200,
-                'market_hours_only': True,
-                'force_refresh': False
-            },
-            'crypto': {
-                'max_age': 300,  # 5 minutes (crypto trades 24/7)
-                'memory_ttl': 600,
-                'force_refresh': False
-            },
-            
-            # Sports data
-            'sports_recent': {
-                'max_age': recent_interval or 1800,  # 30 minutes default; override by config
-                'memory_ttl': (recent_interval or 1800) * 2,
-                'force_refresh': False
-            },
-            'sports_upcoming': {
-                'max_age': upcoming_interval or 10800,  # 3 hours default; override by config
-                'memory_ttl': (upcoming_interval or 10800) * 2,
-                'force_refresh': False
-            },
-            'sports_schedules': {
-                'max_age': 86400,  # 24 hours
-                'memory_ttl': 172800,
-                'force_refresh': False
-            },
-            'leaderboard': {
-                'max_age': 604800,  # 7 days (1 week) - football rankings updated weekly
-                'memory_ttl': 1209600,  # 14 days in memory
-                'force_refresh': False
-            },
-            
-            # News and odds
-            'news': {
-                'max_age': 3600,  # 1 hour
-                'memory_ttl': 7200,
-                'force_refresh': False
-            },
-            'odds': {
-                'max_age': 1800,  # 30 minutes for upcoming games
-                'memory_ttl': 3600,
-                'force_refresh': False
-            },
-            'odds_live': {
-                'max_age': 120,  # 2 minutes for live games (odds change rapidly)
-                'memory_ttl': 240,
-                'force_refresh': False
-            },
-            
-            # Static/stable data
-            'team_info': {
-                'max_age': 604800,  # 1 week
-                'memory_ttl': 1209600,
-                'force_refresh': False
-            },
-            'logos': {
-                'max_age': 2592000,  # 30 days
-                'memory_ttl': 5184000,
-                'force_refresh': False
-            },
-            
-            # Default fallback
-            'default': {
-                'max_age': 300,  # 5 minutes
-                'memory_ttl': 600,
-                'force_refresh': False
-            }
+
+        # 30 minutes (recent) / 3 hours (upcoming) default; override by config
+        max_age = interval or (1800 if data_type == 'sports_recent' else 10800)
+        return {
+            'max_age': max_age,
+            'memory_ttl': max_age * 2,
+            'force_refresh': False
         }
-        
-        return strategies.get(data_type, strategies['default'])
     
     def get_data_type_from_key(self, key: str) -> str:
         """
@@ -192,54 +316,7 @@ class CacheStrategy:
         Returns:
             Data type string for strategy lookup
         """
-        key_lower = key.lower()
-        
-        # Odds data — checked FIRST because odds keys may also contain 'live'/'current'
-        # (e.g. odds_espn_nba_game_123_live). The odds TTL (120s for live, 1800s for
-        # upcoming) must win over the generic sports_live TTL (30s) to avoid hitting
-        # the ESPN odds API every 30 seconds per game.
-        if 'odds' in key_lower:
-            # For live games, use shorter cache; for upcoming games, use longer cache
-            if any(x in key_lower for x in ['live', 'current']):
-                return 'odds_live'  # Live odds change more frequently (120s TTL)
-            return 'odds'  # Regular odds for upcoming games (1800s TTL)
-
-        # Live sports data (only reached if key does NOT contain 'odds')
-        if any(x in key_lower for x in ['live', 'current', 'scoreboard']):
-            return 'sports_live'
-
-        # Weather data
-        if 'weather' in key_lower:
-            return 'weather_current'
-
-        # Market data
-        if 'stock' in key_lower or 'crypto' in key_lower:
-            if 'crypto' in key_lower:
-                return 'crypto'
-            return 'stocks'
-
-        # News data
-        if 'news' in key_lower:
-            return 'news'
-        
-        # Sports schedules and team info
-        if any(x in key_lower for x in ['schedule', 'team_map', 'league']):
-            return 'sports_schedules'
-        
-        # Recent games (last few hours)
-        if 'recent' in key_lower:
-            return 'sports_recent'
-        
-        # Upcoming games
-        if 'upcoming' in key_lower:
-            return 'sports_upcoming'
-        
-        # Static data like logos, team info
-        if any(x in key_lower for x in ['logo', 'team_info', 'config']):
-            return 'team_info'
-        
-        # Default fallback
-        return 'default'
+        return _classify_data_type(key)
     
     def get_sport_key_from_cache_key(self, key: str) -> Optional[str]:
         """
@@ -251,26 +328,7 @@ class CacheStrategy:
         Returns:
             Sport key or None if not found
         """
-        key_lower = key.lower()
-        
-        # Map cache key patterns to sport keys
-        sport_patterns = {
-            'nfl': ['nfl'],
-            'nba': ['nba', 'basketball'],
-            'mlb': ['mlb', 'baseball'],
-            'nhl': ['nhl', 'hockey'],
-            'soccer': ['soccer'],
-            'ncaa_fb': ['ncaa_fb', 'ncaafb', 'college_football'],
-            'ncaa_baseball': ['ncaa_baseball', 'college_baseball'],
-            'ncaam_basketball': ['ncaam_basketball', 'college_basketball'],
-            'milb': ['milb', 'minor_league'],
-        }
-        
-        for sport_key, patterns in sport_patterns.items():
-            if any(pattern in key_lower for pattern in patterns):
-                return sport_key
-        
-        return None
+        return _classify_sport_key(key)
     
     def is_market_open(self) -> bool:
         """
@@ -279,17 +337,4 @@ class CacheStrategy:
         Returns:
             True if market is open, False otherwise
         """
-        et_tz = pytz.timezone('America/New_York')
-        now = datetime.now(et_tz)
-        
-        # Check if it's a weekday
-        if now.weekday() >= 5:  # 5 = Saturday, 6 = Sunday
-            return False
-        
-        # Convert current time to ET
-        current_time = now.time()
-        market_open = datetime.strptime('09:30', '%H:%M').time()
-        market_close = datetime.strptime('16:00', '%H:%M').time()
-        
-        return market_open <= current_time <= market_close
-
+        return _is_market_open_at(int(time.time()))
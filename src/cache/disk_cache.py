@@ -5,6 +5,7 @@ Handles persistent disk-based caching with atomic writes and error recovery.
 """
 
 import json
+import math
 import os
 import time
 import tempfile
@@ -15,6 +16,12 @@ from datetime import datetime
 
 from src.exceptions import CacheError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class CacheStrategyProtocol(Protocol):
     """Protocol for cache strategy objects that categorize cache keys."""
@@ -40,6 +47,49 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _has_non_finite(value: Any) -> bool:
+    """Check whether a record contains a NaN or infinite float anywhere."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _encode_record(data: Any) -> bytes:
+    """Serialize a cache record to JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            # orjson writes datetimes as ISO 8601, like DateTimeEncoder
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson rejects (e.g. ints over 64 bits) go through the stdlib encoder
+            pass
+        else:
+            # orjson writes NaN and Infinity as null; keep them via the stdlib encoder.
+            # Only records that serialized a null can contain one, so most skip the walk.
+            if b'null' not in payload or not _has_non_finite(data):
+                return payload
+    return json.dumps(data, indent=4, cls=DateTimeEncoder).encode('utf-8')
+
+
+def _decode_record(content: bytes) -> Any:
+    """Parse a cache record from JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib encoder writes
+            pass
+    return json.loads(content)
+
+
 class DiskCache:
     """Manages persistent disk-based cache."""
     
@@ -69,6 +119,24 @@ class DiskCache:
             return None
         return os.path.join(self.cache_dir, f"{key}.json")
     
+    def get_mtime_ns(self, key: str) -> Optional[int]:
+        """
+        Get the modification time of a cache file.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            File mtime in nanoseconds, or None if there is no file or cache is disabled
+        """
+        cache_path = self.get_cache_path(key)
+        if not cache_path:
+            return None
+        try:
+            return os.stat(cache_path).st_mtime_ns
+        except OSError:
+            return None
+    
     def get(self, key: str, max_age: int = 300) -> Optional[Dict[str, Any]]:
         """
         Get data from disk cache.
@@ -86,8 +154,8 @@ class DiskCache:
         
         try:
             with self._lock:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    record = json.load(f)
+                with open(cache_path, 'rb') as f:
+                    record = _decode_record(f.read())
             
             # Determine record timestamp (prefer embedded, else file mtime)
             record_ts = None
@@ -151,6 +219,9 @@ class DiskCache:
             return
         
         try:
+            # Serialize up front so a bad value never truncates an existing file
+            payload = _encode_record(data)
+
             # Atomic write to avoid partial/corrupt files
             with self._lock:
                 tmp_dir = os.path.dirname(cache_path)
@@ -177,8 +248,8 @@ class DiskCache:
                     if tmp_path and fd is not None:
                         # Use atomic write with temp file
                         try:
-                            with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
-                                json.dump(data, tmp_file, indent=4, cls=DateTimeEncoder)
+                            with os.fdopen(fd, 'wb') as tmp_file:
+                                tmp_file.write(payload)
                                 tmp_file.flush()
                                 os.fsync(tmp_file.fileno())
                             os.replace(tmp_path, cache_path)
@@ -196,8 +267,8 @@ class DiskCache:
                     else:
                         # Fallback: direct write (not atomic, but better than failing)
                         try:
-                            with open(cache_path, 'w', encoding='utf-8') as cache_file:
-                                json.dump(data, cache_file, indent=4, cls=DateTimeEncoder)
+                            with open(cache_path, 'wb') as cache_file:
+                                cache_file.write(payload)
                                 cache_file.flush()
                                 os.fsync(cache_file.fileno())
                             # Set proper permissions: 660 (rw-rw----) for group-readable cache files
@@ -224,8 +295,8 @@ class DiskCache:
                         
                         if os.path.isdir(fallback_dir) and os.access(fallback_dir, os.W_OK):
                             fallback_path = os.path.join(fallback_dir, os.path.basename(cache_path))
-                            with open(fallback_path, 'w', encoding='utf-8') as tmp_file:
-                                json.dump(data, tmp_file, indent=4, cls=DateTimeEncoder)
+                            with open(fallback_path, 'wb') as tmp_file:
+                                tmp_file.write(payload)
                             # Set proper permissions: 660 (rw-rw----) for group-readable cache files
                             try:
                                 os.chmod(fallback_path, 0o660)
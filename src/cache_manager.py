@@ -3,7 +3,7 @@ import os
 import time
 from datetime import datetime
 import pytz
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import logging
 import threading
 import tempfile
@@ -522,6 +522,37 @@ class CacheManager:
         }
         return self.save_cache(data_type, cache_data)
 
+    def get_if_changed(self, key: str, last_version: Optional[int],
+                       max_age: int = 300) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """
+        Read a key from disk only if its file changed since last_version.
+
+        Meant for polling keys written by another process (e.g. requests posted
+        by the web interface): an unchanged key costs one stat() instead of a
+        read, and a changed one is read from disk rather than from a memory
+        entry that may predate the write.
+
+        Args:
+            key: Cache key
+            last_version: Version returned by the previous call, or None
+            max_age: Maximum age in seconds of the on-disk entry
+
+        Returns:
+            Tuple of (version, data). version is None if the key has no cache
+            file; data is None if the key is unchanged, missing or stale.
+        """
+        version = self._disk_cache_component.get_mtime_ns(key)
+        if version is None or version == last_version:
+            return version, None
+
+        record = self._disk_cache_component.get(key, max_age=max_age)
+        if record is None:
+            return version, None
+        self._memory_cache_component.set(key, record)
+        if 'data' in record:
+            return version, record['data']
+        return version, record
+
     def get(self, key: str, max_age: int = 300) -> Optional[Dict[str, Any]]:
         """Get data from cache if it exists and is not stale."""
         cached_data = self.get_cached_data(key, max_age)
@@ -732,7 +763,7 @@ class CacheManager:
         """
         return self._strategy_component.get_sport_live_interval(sport_key)
 
-    def get_cache_strategy(self, data_type: str, sport_key: Optional[str] = None) -> Dict[str, Any]:
+    def get_cache_strategy(self, data_type: str, sport_key: Optional[str] = None) -> Mapping[str, Any]:
         """
         Get cache strategy for different data types.
         Now respects sport-specific live_update_interval configurations.
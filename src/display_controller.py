@@ -3,8 +3,11 @@ import logging
 import sys
 import os
 import json
+import inspect
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed  # pylint: disable=no-name-in-module
 import pytz
@@ -25,8 +28,107 @@ _vegas_mode_imported = False
 VegasModeCoordinator = None
 DEFAULT_DYNAMIC_DURATION_CAP = 180.0
 
-# WiFi status message file path (same as used in wifi_manager.py)
-WIFI_STATUS_FILE = None  # Will be initialized in __init__
+# WiFi status message file path (same as used in wifi_manager.py: <project root>/config/wifi_status.json)
+WIFI_STATUS_FILE = Path(__file__).resolve().parent.parent / "config" / "wifi_status.json"
+
+# Optional plugin hooks the render loop probes every frame; resolved once per
+# plugin instance by DisplayController._plugin_caps
+_PLUGIN_CAPABILITIES = (
+    'get_display_duration', 'supports_dynamic_duration', 'get_dynamic_duration_cap',
+    'get_cycle_duration', 'reset_cycle_state', 'is_cycle_complete',
+    'has_live_priority', 'has_live_content', 'get_live_modes',
+)
+
+# Unchanged on-demand state is still republished this often so the web API
+# (which reads it with max_age=120) never sees it expire
+ON_DEMAND_STATE_REFRESH_SECONDS = 60.0
+# Granularity of the published 'remaining' time: a change of bucket forces a republish
+ON_DEMAND_REMAINING_BUCKET_SECONDS = 5
+
+
+# datetime.weekday() -> lowercase day name as used in schedule 'days' configs.
+# Interned, as are the parsed 'days' keys, so per-tick day lookups compare by identity.
+_DAYS = tuple(sys.intern(day) for day in
+              ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'))
+_SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class _ScheduleWindow:
+    """A start/end window from a schedule config, parsed once per config version."""
+    start_str: str
+    end_str: str
+    start: Optional[int] = None  # Seconds since midnight; None when the time strings are invalid
+    end: Optional[int] = None
+    error: Optional[str] = None
+
+    def contains(self, seconds_of_day: int) -> bool:
+        """Check whether a time of day is inside the window (inclusive), including overnight windows."""
+        # Offsets from the start modulo one day make overnight windows (start > end) the same case
+        return (seconds_of_day - self.start) % _SECONDS_PER_DAY <= (self.end - self.start) % _SECONDS_PER_DAY
+
+
+def _seconds_of_day(hhmm: str) -> int:
+    """Convert an HH:MM string to seconds since midnight."""
+    parsed = datetime.strptime(hhmm, '%H:%M')
+    return parsed.hour * 3600 + parsed.minute * 60
+
+
+def _pin_current_thread(cores: Any, role: str) -> bool:
+    """
+    Restrict the calling thread to the given CPU cores (Linux only).
+
+    Args:
+        cores: Core ids (int or list of ints); falsy leaves affinity unchanged
+        role: Thread description for logs
+
+    Returns:
+        True if the affinity was applied
+    """
+    if cores is None or cores == [] or not hasattr(os, 'sched_setaffinity'):
+        return False
+    core_set = {cores} if isinstance(cores, int) else set(cores)
+    try:
+        # pid 0 targets the calling thread on Linux
+        os.sched_setaffinity(0, core_set)
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Could not pin %s to CPU cores %s: %s", role, sorted(core_set, key=str), e)
+        return False
+    logger.debug("Pinned %s to CPU cores %s", role, sorted(core_set))
+    return True
+
+
+def _parse_schedule_window(window_config: Dict[str, Any], default_start: str, default_end: str) -> _ScheduleWindow:
+    """Parse the 'start_time'/'end_time' (HH:MM) pair of a schedule or schedule day."""
+    start_str = window_config.get('start_time', default_start)
+    end_str = window_config.get('end_time', default_end)
+    try:
+        return _ScheduleWindow(
+            start_str,
+            end_str,
+            _seconds_of_day(start_str),
+            _seconds_of_day(end_str),
+        )
+    except ValueError as e:
+        return _ScheduleWindow(start_str, end_str, error=str(e))
+
+
+def _parse_schedule_days(days_config: Optional[Dict[str, Any]], default_start: str,
+                         default_end: str) -> Dict[str, Optional[_ScheduleWindow]]:
+    """Parse per-day schedule windows keyed by interned lowercase day name; disabled days map to None."""
+    if not days_config:
+        return {}
+    return {
+        sys.intern(day.lower()): _parse_schedule_window(day_config, default_start, default_end) if day_config.get('enabled', True) else None
+        for day, day_config in days_config.items()
+    }
+
+
+def _partition_live_modes(modes: List[str]) -> Tuple[List[str], List[str]]:
+    """Split display modes into (live modes, other modes), keeping their order."""
+    live_modes = [m for m in modes if m.endswith('_live')]
+    other_modes = [m for m in modes if not m.endswith('_live')]
+    return live_modes, other_modes
 
 class DisplayController:
     def __init__(self):
@@ -45,11 +147,13 @@ class DisplayController:
         self.cache_manager = CacheManager()
         logger.info("Config loaded in %.3f seconds (hot-reload: %s)", time.time() - start_time, enable_hot_reload)
         
-        # Validate startup configuration
+        # Validate startup configuration (plugins are validated by the same
+        # validator once the plugin manager exists)
+        validator = None
         try:
             from src.startup_validator import StartupValidator
             validator = StartupValidator(self.config_manager)
-            is_valid, errors, warnings = validator.validate_all()
+            is_valid, errors, warnings = validator.validate_config()
             
             if warnings:
                 for warning in warnings:
@@ -86,6 +190,10 @@ class DisplayController:
         # List of available display modes - now handled entirely by plugins
         self.available_modes = []
         
+        # Optional CPU pinning for the render loop and plugin loader threads,
+        # e.g. {"render_core": 3, "worker_cores": [0, 1]}
+        self.cpu_affinity_config = self.config.get("display", {}).get("cpu_affinity") or {}
+
         # Initialize Plugin System
         plugin_time = time.time()
         self.plugin_manager = None
@@ -100,23 +208,40 @@ class DisplayController:
         self.on_demand_duration: Optional[float] = None
         self.on_demand_requested_at: Optional[float] = None
         self.on_demand_expires_at: Optional[float] = None
+        # on_demand_expires_at converted to a time.monotonic() deadline, and the
+        # wall-clock value it was converted from (see _check_on_demand_expiration)
+        self._on_demand_deadline: Optional[float] = None
+        self._on_demand_deadline_source: Optional[float] = None
         self.on_demand_pinned = False
         self.on_demand_request_id: Optional[str] = None
+        # Disk version (file mtime) of the on-demand request last polled
+        self._on_demand_request_version: Optional[int] = None
         self.on_demand_status: str = 'idle'
         self.on_demand_last_error: Optional[str] = None
         self.on_demand_last_event: Optional[str] = None
         self.on_demand_schedule_override = False
         self.rotation_resume_index: Optional[int] = None
+        # (state fields, publish time) of the last on-demand state written to the cache
+        self._last_on_demand_publish: Optional[Tuple[tuple, float]] = None
+        # Enabled plugins whose modes come from their manifest and that load on first display
+        # (plugin_system.lazy_load)
+        self._lazy_plugins: set = set()
+        self._plugin_load_lock = threading.Lock()
+        # Loaded plugins that handle config changes; one config_service subscription
+        # dispatches to all of them
+        self._config_subscribers: Dict[str, Any] = {}
+        # plugin_id -> (live modes, other modes) of plugin_display_modes, for on-demand ordering
+        self._plugin_mode_partitions: Dict[str, Tuple[List[str], List[str]]] = {}
+        # id(plugin instance) -> (instance, {hook name: bound method or None})
+        self._plugin_capabilities: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+        self.config_service.subscribe(self._dispatch_config_change)
         
         # WiFi status message tracking
-        global WIFI_STATUS_FILE
-        if WIFI_STATUS_FILE is None:
-            # Resolve project root (same logic as wifi_manager.py)
-            project_root = Path(__file__).parent.parent.parent.resolve()
-            WIFI_STATUS_FILE = project_root / "config" / "wifi_status.json"
         self.wifi_status_file = WIFI_STATUS_FILE
         self.wifi_status_active = False
         self.wifi_status_expires_at: Optional[float] = None
+        # ((mtime_ns, size), parsed status or None) for the last WiFi status file read
+        self._wifi_status_cache: Optional[Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = None
         
         try:
             logger.info("Attempting to import plugin system...")
@@ -147,9 +272,10 @@ class DisplayController:
             
             # Validate plugins after plugin manager is created
             try:
-                from src.startup_validator import StartupValidator
-                validator = StartupValidator(self.config_manager, self.plugin_manager)
-                is_valid, errors, warnings = validator.validate_all()
+                if validator is None:
+                    from src.startup_validator import StartupValidator
+                    validator = StartupValidator(self.config_manager)
+                is_valid, errors, warnings = validator.validate_plugins(self.plugin_manager)
                 
                 if warnings:
                     for warning in warnings:
@@ -203,102 +329,14 @@ class DisplayController:
             
             # Count enabled plugins for progress tracking
             enabled_count = len(enabled_plugins)
-            logger.info("Loading %d enabled plugin(s) in parallel (max 4 concurrent)...", enabled_count)
-            
-            # Helper function for parallel loading
-            def load_single_plugin(plugin_id):
-                """Load a single plugin and return result."""
-                plugin_load_start = time.time()
-                try:
-                    if self.plugin_manager.load_plugin(plugin_id):
-                        plugin_load_time = time.time() - plugin_load_start
-                        return {
-                            'success': True,
-                            'plugin_id': plugin_id,
-                            'load_time': plugin_load_time,
-                            'error': None
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'plugin_id': plugin_id,
-                            'load_time': time.time() - plugin_load_start,
-                            'error': 'Load returned False'
-                        }
-                except Exception as e:
-                    return {
-                        'success': False,
-                        'plugin_id': plugin_id,
-                        'load_time': time.time() - plugin_load_start,
-                        'error': str(e)
-                    }
-            
-            # Load enabled plugins in parallel with up to 4 concurrent workers
-            loaded_count = 0
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                # Submit all enabled plugins for loading
-                future_to_plugin = {
-                    executor.submit(load_single_plugin, plugin_id): plugin_id
-                    for plugin_id in enabled_plugins
-                }
-                
-                # Process results as they complete
-                for future in as_completed(future_to_plugin):
-                    result = future.result()
-                    loaded_count += 1
-                    
-                    if result['success']:
-                        plugin_id = result['plugin_id']
-                        logger.info("✓ Loaded plugin %s in %.3f seconds (%d/%d)", 
-                                  plugin_id, result['load_time'], loaded_count, enabled_count)
-                        
-                        # Get plugin instance and manifest
-                        plugin_instance = self.plugin_manager.get_plugin(plugin_id)
-                        manifest = self.plugin_manager.plugin_manifests.get(plugin_id, {})
-                        
-                        # Prefer plugin's modes attribute if available (dynamic based on enabled leagues)
-                        # Fall back to manifest display_modes if plugin doesn't provide modes
-                        if plugin_instance and hasattr(plugin_instance, 'modes') and plugin_instance.modes:
-                            display_modes = list(plugin_instance.modes)
-                            logger.debug("Using plugin.modes for %s: %s", plugin_id, display_modes)
-                        else:
-                            display_modes = manifest.get('display_modes', [plugin_id])
-                            logger.debug("Using manifest display_modes for %s: %s", plugin_id, display_modes)
-                        
-                        if isinstance(display_modes, list) and display_modes:
-                            self.plugin_display_modes[plugin_id] = list(display_modes)
-                        else:
-                            display_modes = [plugin_id]
-                            self.plugin_display_modes[plugin_id] = list(display_modes)
-                        
-                        # Subscribe plugin to config changes for hot-reload
-                        if hasattr(self, 'config_service') and hasattr(plugin_instance, 'on_config_change'):
-                            def config_change_callback(old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
-                                """Callback for plugin config changes."""
-                                try:
-                                    plugin_instance.on_config_change(new_config)
-                                    logger.debug("Plugin %s notified of config change", plugin_id)
-                                except Exception as e:
-                                    logger.error("Error in plugin %s config change handler: %s", plugin_id, e, exc_info=True)
-                            
-                            self.config_service.subscribe(config_change_callback, plugin_id=plugin_id)
-                            logger.debug("Subscribed plugin %s to config changes", plugin_id)
-                        
-                        # Add plugin modes to available modes
-                        for mode in display_modes:
-                            self.available_modes.append(mode)
-                            self.plugin_modes[mode] = plugin_instance
-                            self.mode_to_plugin_id[mode] = plugin_id
-                            logger.debug("  Added mode: %s", mode)
-                        
-                        # Show progress
-                        progress_pct = int((loaded_count / enabled_count) * 100)
-                        elapsed = time.time() - plugin_time
-                        logger.info("Progress: %d%% (%d/%d plugins, %.1fs elapsed)", 
-                                  progress_pct, loaded_count, enabled_count, elapsed)
-                    else:
-                        logger.warning("✗ Failed to load plugin %s: %s", 
-                                     result['plugin_id'], result['error'])
+
+            # On-demand startup already loads a single plugin, so lazy loading only applies to normal rotation
+            if plugin_system_config.get('lazy_load', False) and not self.on_demand_active:
+                logger.info("Lazy loading enabled: %d plugin(s) will load on first display", enabled_count)
+                for plugin_id in enabled_plugins:
+                    self._register_manifest_modes(plugin_id)
+            else:
+                self._load_plugins(enabled_plugins, plugin_time)
             
             # Log disabled plugins
             disabled_count = len(discovered_plugins) - enabled_count
@@ -320,21 +358,32 @@ class DisplayController:
         # Display rotation state
         self.current_mode_index = 0
         self.current_display_mode = None
-        self.last_mode_change = time.time()
+        self.last_mode_change = time.monotonic()
         self.mode_duration = 30  # Default duration
         self.global_dynamic_config = (
             self.config.get("display", {}).get("dynamic_duration", {}) or {}
         )
+        # max_duration_seconds parsed once per global_dynamic_config dict (see _get_global_dynamic_cap)
+        self._global_dynamic_cap_source: Optional[Dict[str, Any]] = None
+        self._global_dynamic_cap: Optional[float] = None
+        # display.display_durations, resolved once per config dict (see _get_display_duration)
+        self._display_durations_source: Optional[Dict[str, Any]] = None
+        self._display_durations: Dict[str, Any] = {}
         self._active_dynamic_mode: Optional[str] = None
         
         # Memory monitoring
         self._memory_log_interval = 3600.0  # Log memory stats every hour
-        self._last_memory_log = time.time()
+        self._last_memory_log = time.monotonic()
         self._enable_memory_logging = self.config.get("display", {}).get("memory_logging", False)
         
         # Schedule management
         self.is_display_active = True
         self._was_display_active = True  # Track previous state for schedule change detection
+        # Parsed schedule/dim_schedule config, rebuilt only when the config version changes
+        self._schedule_cache: Optional[Dict[str, Any]] = None
+        self._dim_schedule_cache: Optional[Dict[str, Any]] = None
+        # (epoch second, tz, day name, time of day) from the last _now_decomposed() call
+        self._wallclock_cache: Tuple[int, Any, Optional[str], Optional[int]] = (0, None, None, None)
 
         # Brightness state tracking for dim schedule
         self.current_brightness = self.config.get('display', {}).get('hardware', {}).get('brightness', 90)
@@ -359,6 +408,231 @@ class DisplayController:
 
         logger.info("DisplayController initialization completed in %.3f seconds", time.time() - start_time)
 
+    def _load_plugins(self, plugin_ids: List[str], plugin_time: float) -> None:
+        """
+        Load plugins and add their display modes to the rotation.
+
+        Two or fewer plugins (e.g. on-demand startup) load inline; more load in
+        parallel on a thread pool.
+
+        Args:
+            plugin_ids: Plugins to load
+            plugin_time: Start time of plugin system initialization, for progress logs
+        """
+        enabled_count = len(plugin_ids)
+        
+        # A thread pool gains nothing for one or two plugins
+        if enabled_count <= 2:
+            logger.info("Loading %d enabled plugin(s)...", enabled_count)
+            for loaded_count, plugin_id in enumerate(plugin_ids, 1):
+                result = self._load_single_plugin(self.plugin_manager, plugin_id)
+                self._post_process_loaded_plugin(result, loaded_count, enabled_count, plugin_time)
+            return
+
+        # Plugin loads mix imports with file and network I/O (config reads, dependency
+        # checks, plugin __init__), so use more threads than cores
+        max_workers = min(enabled_count, (os.cpu_count() or 1) * 2)
+        logger.info("Loading %d enabled plugin(s) in parallel (max %d concurrent)...", enabled_count, max_workers)
+        
+        # Load enabled plugins in parallel
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PluginLoad",
+                                initializer=_pin_current_thread,
+                                initargs=(self.cpu_affinity_config.get("worker_cores"), "plugin loader thread")) as executor:
+            # Submit all enabled plugins for loading
+            future_to_plugin = {
+                executor.submit(self._load_single_plugin, self.plugin_manager, plugin_id): plugin_id
+                for plugin_id in plugin_ids
+            }
+            
+            # Process results as they complete
+            for loaded_count, future in enumerate(as_completed(future_to_plugin), 1):
+                self._post_process_loaded_plugin(future.result(), loaded_count, enabled_count, plugin_time)
+
+    @staticmethod
+    def _load_single_plugin(plugin_manager: Any, plugin_id: str) -> Dict[str, Any]:
+        """Load a single plugin and return result."""
+        plugin_load_start = time.time()
+        try:
+            if plugin_manager.load_plugin(plugin_id):
+                plugin_load_time = time.time() - plugin_load_start
+                return {
+                    'success': True,
+                    'plugin_id': plugin_id,
+                    'load_time': plugin_load_time,
+                    'error': None
+                }
+            else:
+                return {
+                    'success': False,
+                    'plugin_id': plugin_id,
+                    'load_time': time.time() - plugin_load_start,
+                    'error': 'Load returned False'
+                }
+        except Exception as e:
+            return {
+                'success': False,
+                'plugin_id': plugin_id,
+                'load_time': time.time() - plugin_load_start,
+                'error': str(e)
+            }
+
+    def _post_process_loaded_plugin(self, result: Dict[str, Any], loaded_count: int,
+                                    enabled_count: int, plugin_time: float) -> None:
+        """Register a plugin after a load attempt and log progress."""
+        if result['success']:
+            plugin_id = result['plugin_id']
+            logger.info("✓ Loaded plugin %s in %.3f seconds (%d/%d)", 
+                      plugin_id, result['load_time'], loaded_count, enabled_count)
+            self._register_loaded_plugin(plugin_id)
+            
+            # Show progress
+            progress_pct = int((loaded_count / enabled_count) * 100)
+            elapsed = time.time() - plugin_time
+            logger.info("Progress: %d%% (%d/%d plugins, %.1fs elapsed)", 
+                      progress_pct, loaded_count, enabled_count, elapsed)
+        else:
+            logger.warning("✗ Failed to load plugin %s: %s", 
+                         result['plugin_id'], result['error'])
+
+    def _register_loaded_plugin(self, plugin_id: str) -> None:
+        """Add a loaded plugin's display modes to the rotation and subscribe it to config changes."""
+        # Get plugin instance and manifest
+        plugin_instance = self.plugin_manager.get_plugin(plugin_id)
+        manifest = self.plugin_manager.plugin_manifests.get(plugin_id, {})
+        previous_modes = self.plugin_display_modes.get(plugin_id, [])
+        
+        # Prefer plugin's modes attribute if available (dynamic based on enabled leagues)
+        # Fall back to manifest display_modes if plugin doesn't provide modes
+        if plugin_instance and hasattr(plugin_instance, 'modes') and plugin_instance.modes:
+            display_modes = list(plugin_instance.modes)
+            logger.debug("Using plugin.modes for %s: %s", plugin_id, display_modes)
+        else:
+            display_modes = manifest.get('display_modes', [plugin_id])
+            logger.debug("Using manifest display_modes for %s: %s", plugin_id, display_modes)
+        
+        if isinstance(display_modes, list) and display_modes:
+            self.plugin_display_modes[plugin_id] = list(display_modes)
+        else:
+            display_modes = [plugin_id]
+            self.plugin_display_modes[plugin_id] = list(display_modes)
+        self._plugin_mode_partitions[plugin_id] = _partition_live_modes(display_modes)
+        
+        # A (re)loaded plugin gets its hooks probed afresh
+        self._plugin_capabilities.pop(id(plugin_instance), None)
+
+        # Subscribe plugin to config changes for hot-reload
+        if hasattr(plugin_instance, 'on_config_change'):
+            self._config_subscribers[plugin_id] = plugin_instance
+            logger.debug("Subscribed plugin %s to config changes", plugin_id)
+        
+        # Lazily loaded plugins listed all their manifest modes; drop the ones the
+        # loaded plugin does not provide (e.g. disabled leagues)
+        self._remove_plugin_modes(plugin_id, [mode for mode in previous_modes if mode not in display_modes])
+
+        # Add plugin modes to available modes (lazily loaded plugins already
+        # listed their manifest modes)
+        for mode in display_modes:
+            if self.mode_to_plugin_id.get(mode) != plugin_id:
+                self.available_modes.append(mode)
+            self.plugin_modes[mode] = plugin_instance
+            self.mode_to_plugin_id[mode] = plugin_id
+            logger.debug("  Added mode: %s", mode)
+
+    def _remove_plugin_modes(self, plugin_id: str, modes: List[str]) -> None:
+        """
+        Take display modes registered by a plugin out of the rotation.
+
+        The current rotation position is kept: if the current mode is removed,
+        the next advance moves on to the mode that followed it.
+
+        Args:
+            plugin_id: Plugin identifier
+            modes: Display modes to remove; modes owned by another plugin are ignored
+        """
+        dropped = {mode for mode in modes if self.mode_to_plugin_id.get(mode) == plugin_id}
+        if not dropped:
+            return
+
+        position = self.current_mode_index
+        kept = []
+        for index, mode in enumerate(self.available_modes):
+            if mode in dropped:
+                if index <= self.current_mode_index:
+                    position -= 1
+            else:
+                kept.append(mode)
+        self.available_modes[:] = kept
+        self.current_mode_index = position % len(kept) if kept else 0
+
+        for mode in dropped:
+            self.mode_to_plugin_id.pop(mode, None)
+            self.plugin_modes.pop(mode, None)
+            logger.debug("  Removed mode: %s", mode)
+
+    def _dispatch_config_change(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        """Notify each subscribed plugin whose config section changed."""
+        for plugin_id, plugin_instance in list(self._config_subscribers.items()):
+            new_plugin_config = new_config.get(plugin_id, {})
+            if old_config.get(plugin_id, {}) == new_plugin_config:
+                continue
+            try:
+                plugin_instance.on_config_change(new_plugin_config)
+                logger.debug("Plugin %s notified of config change", plugin_id)
+            except Exception as e:
+                logger.error("Error in plugin %s config change handler: %s", plugin_id, e, exc_info=True)
+
+    def _register_manifest_modes(self, plugin_id: str) -> None:
+        """Add an unloaded plugin's manifest display modes to the rotation for lazy loading."""
+        manifest = self.plugin_manager.plugin_manifests.get(plugin_id, {})
+        display_modes = manifest.get('display_modes', [plugin_id])
+        if not isinstance(display_modes, list) or not display_modes:
+            display_modes = [plugin_id]
+
+        self.plugin_display_modes[plugin_id] = list(display_modes)
+        self._plugin_mode_partitions[plugin_id] = _partition_live_modes(display_modes)
+        for mode in display_modes:
+            self.available_modes.append(mode)
+            self.mode_to_plugin_id[mode] = plugin_id
+        self._lazy_plugins.add(plugin_id)
+
+    def _ensure_plugin_loaded(self, plugin_id: Optional[str]) -> None:
+        """
+        Load a lazily loaded plugin the first time one of its modes is needed.
+
+        Does nothing for plugins that were loaded at startup or already loaded.
+
+        Args:
+            plugin_id: Plugin identifier
+        """
+        if plugin_id not in self._lazy_plugins:
+            return
+        with self._plugin_load_lock:
+            if plugin_id not in self._lazy_plugins:
+                return
+            self._lazy_plugins.discard(plugin_id)
+
+            load_start = time.time()
+            try:
+                loaded = self.plugin_manager.load_plugin(plugin_id)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("✗ Failed to lazy-load plugin %s", plugin_id)
+                loaded = False
+            else:
+                if not loaded:
+                    logger.warning("✗ Failed to lazy-load plugin %s: Load returned False", plugin_id)
+            if not loaded:
+                # Take its manifest modes out of the rotation rather than hitting them every cycle
+                self._remove_plugin_modes(plugin_id, self.plugin_display_modes.pop(plugin_id, []))
+                self._plugin_mode_partitions.pop(plugin_id, None)
+                return
+
+            logger.info("✓ Lazy-loaded plugin %s in %.3f seconds", plugin_id, time.time() - load_start)
+            self._register_loaded_plugin(plugin_id)
+            plugin_instance = self.plugin_manager.get_plugin(plugin_id)
+            if plugin_instance is not None:
+                # Fetch data before the first display, as the startup update does for eager plugins
+                self._update_plugin(plugin_id, plugin_instance)
+
     def _initialize_vegas_mode(self):
         """Initialize Vegas mode coordinator if enabled."""
         global _vegas_mode_imported, VegasModeCoordinator
@@ -434,12 +708,85 @@ class DisplayController:
 
         return False
 
+    def _load_schedule_timezone(self, config: Dict[str, Any], context: str = '') -> Any:
+        """Resolve the configured timezone, falling back to UTC."""
+        timezone_str = config.get('timezone', 'UTC')
+        try:
+            return pytz.timezone(timezone_str)
+        except pytz.UnknownTimeZoneError:
+            logger.warning("Unknown timezone '%s'%s, using UTC", timezone_str, context)
+            return pytz.UTC
+
+    def _get_schedule_cache(self) -> Dict[str, Any]:
+        """
+        Get the parsed display schedule for the current config version.
+
+        Timezone lookup and HH:MM parsing happen once per config change
+        instead of on every schedule check.
+        """
+        version = self.config_service.get_version()
+        cache = self._schedule_cache
+        if cache is None or cache['version'] != version:
+            # Get fresh config from config_service to support hot-reload
+            current_config = self.config_service.get_config()
+            schedule_config = current_config.get('schedule', {})
+            cache = self._schedule_cache = {
+                'version': version,
+                'config': schedule_config,
+                'tz': self._load_schedule_timezone(current_config),
+                'global': _parse_schedule_window(schedule_config, '07:00', '23:00'),
+                'days': _parse_schedule_days(schedule_config.get('days'), '07:00', '23:00'),
+            }
+        return cache
+
+    def _get_dim_schedule_cache(self) -> Dict[str, Any]:
+        """Get the parsed dim schedule for the current config version."""
+        version = self.config_service.get_version()
+        cache = self._dim_schedule_cache
+        if cache is None or cache['version'] != version:
+            # Get fresh config from config_service to support hot-reload
+            current_config = self.config_service.get_config()
+            dim_config = current_config.get('dim_schedule', {})
+            enabled = bool(dim_config) and bool(dim_config.get('enabled', False))
+            cache = self._dim_schedule_cache = {
+                'version': version,
+                'enabled': enabled,
+                'normal_brightness': current_config.get('display', {}).get('hardware', {}).get('brightness', 90),
+                'dim_brightness': dim_config.get('dim_brightness', 30),
+                # Normalize mode to handle both "per-day" and "per_day" variants
+                'per_day': (dim_config.get('mode') or 'global').replace('_', '-') == 'per-day',
+                'tz': self._load_schedule_timezone(current_config, ' in dim schedule') if enabled else None,
+                'global': _parse_schedule_window(dim_config, '20:00', '07:00'),
+                'days': _parse_schedule_days(dim_config.get('days'), '20:00', '07:00'),
+            }
+        return cache
+
+    def _now_decomposed(self, tz: Any) -> Tuple[str, int]:
+        """
+        Get the current day name and time of day (seconds since midnight) in a timezone.
+
+        The result is reused for the rest of the current second, so back-to-back
+        schedule checks share one conversion.
+
+        Args:
+            tz: Timezone to convert to
+
+        Returns:
+            Tuple of (lowercase day name, seconds since midnight)
+        """
+        now_s = int(time.time())
+        cached_s, cached_tz, day_name, time_of_day = self._wallclock_cache
+        if now_s != cached_s or tz is not cached_tz:
+            current_time = datetime.fromtimestamp(now_s, tz)
+            day_name = _DAYS[current_time.weekday()]
+            time_of_day = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+            self._wallclock_cache = (now_s, tz, day_name, time_of_day)
+        return day_name, time_of_day
+
     def _check_schedule(self):
         """Check if display should be active based on schedule."""
-        # Get fresh config from config_service to support hot-reload
-        current_config = self.config_service.get_config()
-
-        schedule_config = current_config.get('schedule', {})
+        schedule = self._get_schedule_cache()
+        schedule_config = schedule['config']
 
         # If schedule config doesn't exist or is empty, default to always active
         if not schedule_config:
@@ -455,38 +802,16 @@ class DisplayController:
             logger.debug("Schedule is disabled - display always active")
             return
 
-        # Get configured timezone, default to UTC
-        timezone_str = current_config.get('timezone', 'UTC')
-        try:
-            tz = pytz.timezone(timezone_str)
-        except pytz.UnknownTimeZoneError:
-            logger.warning(f"Unknown timezone '{timezone_str}', using UTC")
-            tz = pytz.UTC
-
         # Use timezone-aware current time
-        current_time = datetime.now(tz)
-        current_day = current_time.strftime('%A').lower()  # Get day name (monday, tuesday, etc.)
-        current_time_only = current_time.time()
-        
-        # Check if per-day schedule is configured
-        days_config = schedule_config.get('days')
-        
-        # Determine which schedule to use
-        use_per_day = False
-        if days_config:
-            # Check if days dict is not empty and contains current day
-            if days_config and current_day in days_config:
-                use_per_day = True
-            elif days_config:
-                # Days dict exists but doesn't have current day - fall back to global
-                logger.debug("Per-day schedule exists but %s not configured, using global schedule", current_day)
+        current_day, current_time_only = self._now_decomposed(schedule['tz'])
         
-        if use_per_day:
-            # Use per-day schedule
-            day_config = days_config[current_day]
+        # Use the per-day schedule if one is configured for today
+        days = schedule['days']
+        if current_day in days:
+            window = days[current_day]
             
             # Check if this day is enabled
-            if not day_config.get('enabled', True):
+            if window is None:
                 was_active = getattr(self, '_was_display_active', True)
                 self.is_display_active = False
                 if was_active:
@@ -496,55 +821,48 @@ class DisplayController:
                 self._was_display_active = self.is_display_active
                 return
             
-            start_time_str = day_config.get('start_time', '07:00')
-            end_time_str = day_config.get('end_time', '23:00')
             schedule_type = f"per-day ({current_day})"
         else:
-            # Use global schedule
-            start_time_str = schedule_config.get('start_time', '07:00')
-            end_time_str = schedule_config.get('end_time', '23:00')
+            if days:
+                # Days dict exists but doesn't have current day - fall back to global
+                logger.debug("Per-day schedule exists but %s not configured, using global schedule", current_day)
+            window = schedule['global']
             schedule_type = "global"
         
-        try:
-            start_time = datetime.strptime(start_time_str, '%H:%M').time()
-            end_time = datetime.strptime(end_time_str, '%H:%M').time()
-            
-            if start_time <= end_time:
-                # Normal case: start and end on same day
-                self.is_display_active = start_time <= current_time_only <= end_time
-            else:
-                # Overnight case: start and end on different days
-                self.is_display_active = current_time_only >= start_time or current_time_only <= end_time
-            
-            # Track previous state to detect changes
-            was_active = getattr(self, '_was_display_active', True)
-            
-            # Log schedule state changes
-            if not self.is_display_active:
-                if was_active:
-                    # State changed from active to inactive - schedule kicked in
-                    logger.info("Schedule activated: Display is now INACTIVE (outside %s schedule window %s - %s). Display will be blanked.", 
-                               schedule_type, start_time_str, end_time_str)
-                else:
-                    logger.debug("Display inactive - outside %s schedule window (%s - %s)", 
-                               schedule_type, start_time_str, end_time_str)
-            else:
-                if not was_active:
-                    # State changed from inactive to active
-                    logger.info("Schedule activated: Display is now ACTIVE (within %s schedule window %s - %s)", 
-                               schedule_type, start_time_str, end_time_str)
-                else:
-                    logger.debug("Display active - within %s schedule window (%s - %s)", 
-                               schedule_type, start_time_str, end_time_str)
-            
-            # Store current state for next check
-            self._was_display_active = self.is_display_active
-                
-        except ValueError as e:
+        start_time_str, end_time_str = window.start_str, window.end_str
+        if window.error is not None:
             logger.warning("Invalid schedule format for %s schedule: %s (start: %s, end: %s). Defaulting to active.",
-                         schedule_type, e, start_time_str, end_time_str)
+                         schedule_type, window.error, start_time_str, end_time_str)
             self.is_display_active = True
             self._was_display_active = True  # Track previous state for schedule change detection
+            return
+
+        # Handles both same-day and overnight (start after end) windows
+        self.is_display_active = window.contains(current_time_only)
+        
+        # Track previous state to detect changes
+        was_active = getattr(self, '_was_display_active', True)
+        
+        # Log schedule state changes
+        if not self.is_display_active:
+            if was_active:
+                # State changed from active to inactive - schedule kicked in
+                logger.info("Schedule activated: Display is now INACTIVE (outside %s schedule window %s - %s). Display will be blanked.", 
+                           schedule_type, start_time_str, end_time_str)
+            else:
+                logger.debug("Display inactive - outside %s schedule window (%s - %s)", 
+                           schedule_type, start_time_str, end_time_str)
+        else:
+            if not was_active:
+                # State changed from inactive to active
+                logger.info("Schedule activated: Display is now ACTIVE (within %s schedule window %s - %s)", 
+                           schedule_type, start_time_str, end_time_str)
+            else:
+                logger.debug("Display active - within %s schedule window (%s - %s)", 
+                           schedule_type, start_time_str, end_time_str)
+        
+        # Store current state for next check
+        self._was_display_active = self.is_display_active
 
     def _check_dim_schedule(self) -> int:
         """
@@ -554,85 +872,58 @@ class DisplayController:
             Target brightness level (dim_brightness if in dim period,
             normal brightness otherwise)
         """
-        # Get fresh config from config_service to support hot-reload
-        current_config = self.config_service.get_config()
+        dim_schedule = self._get_dim_schedule_cache()
 
         # Get normal brightness from config
-        normal_brightness = current_config.get('display', {}).get('hardware', {}).get('brightness', 90)
+        normal_brightness = dim_schedule['normal_brightness']
 
         # If display is OFF via schedule, don't process dim schedule
         if not self.is_display_active:
             self.is_dimmed = False
             return normal_brightness
 
-        dim_config = current_config.get('dim_schedule', {})
-
         # If dim schedule doesn't exist or is disabled, use normal brightness
-        if not dim_config or not dim_config.get('enabled', False):
+        if not dim_schedule['enabled']:
             self.is_dimmed = False
             return normal_brightness
 
-        # Get configured timezone
-        timezone_str = current_config.get('timezone', 'UTC')
-        try:
-            tz = pytz.timezone(timezone_str)
-        except pytz.UnknownTimeZoneError:
-            logger.warning(f"Unknown timezone '{timezone_str}' in dim schedule, using UTC")
-            tz = pytz.UTC
-
-        current_time = datetime.now(tz)
-        current_day = current_time.strftime('%A').lower()
-        current_time_only = current_time.time()
+        current_day, current_time_only = self._now_decomposed(dim_schedule['tz'])
 
         # Determine if using per-day or global dim schedule
-        # Normalize mode to handle both "per-day" and "per_day" variants
-        mode = dim_config.get('mode', 'global')
-        mode_normalized = mode.replace('_', '-') if mode else 'global'
-        days_config = dim_config.get('days')
-        use_per_day = mode_normalized == 'per-day' and days_config and current_day in days_config
+        days = dim_schedule['days']
+        use_per_day = dim_schedule['per_day'] and current_day in days
 
         if use_per_day:
-            day_config = days_config[current_day]
-            if not day_config.get('enabled', True):
+            window = days[current_day]
+            if window is None:
                 self.is_dimmed = False
                 return normal_brightness
-            start_time_str = day_config.get('start_time', '20:00')
-            end_time_str = day_config.get('end_time', '07:00')
         else:
-            start_time_str = dim_config.get('start_time', '20:00')
-            end_time_str = dim_config.get('end_time', '07:00')
+            window = dim_schedule['global']
 
-        try:
-            start_time = datetime.strptime(start_time_str, '%H:%M').time()
-            end_time = datetime.strptime(end_time_str, '%H:%M').time()
+        if window.error is not None:
+            logger.warning("Invalid dim schedule time format: %s", window.error)
+            return normal_brightness
 
-            # Determine if currently in dim period
-            if start_time <= end_time:
-                # Same-day schedule (e.g., 10:00 to 18:00)
-                in_dim_period = start_time <= current_time_only <= end_time
-            else:
-                # Overnight schedule (e.g., 20:00 to 07:00)
-                in_dim_period = current_time_only >= start_time or current_time_only <= end_time
+        # Determine if currently in dim period (same-day, e.g. 10:00 to 18:00,
+        # or overnight, e.g. 20:00 to 07:00)
+        in_dim_period = window.contains(current_time_only)
 
-            if in_dim_period:
-                self.is_dimmed = True
-                target_brightness = dim_config.get('dim_brightness', 30)
-            else:
-                self.is_dimmed = False
-                target_brightness = normal_brightness
+        if in_dim_period:
+            self.is_dimmed = True
+            target_brightness = dim_schedule['dim_brightness']
+        else:
+            self.is_dimmed = False
+            target_brightness = normal_brightness
 
-            # Log state changes
-            if self.is_dimmed and not self._was_dimmed:
-                logger.info(f"Dim schedule activated: brightness set to {target_brightness}%")
-            elif not self.is_dimmed and self._was_dimmed:
-                logger.info(f"Dim schedule deactivated: brightness restored to {target_brightness}%")
+        # Log state changes
+        if self.is_dimmed and not self._was_dimmed:
+            logger.info("Dim schedule activated: brightness set to %s%%", target_brightness)
+        elif not self.is_dimmed and self._was_dimmed:
+            logger.info("Dim schedule deactivated: brightness restored to %s%%", target_brightness)
 
-            self._was_dimmed = self.is_dimmed
-            return target_brightness
-
-        except ValueError as e:
-            logger.warning(f"Invalid dim schedule time format: {e}")
-            return normal_brightness
+        self._was_dimmed = self.is_dimmed
+        return target_brightness
 
     def _update_modules(self):
         """Update all plugin modules."""
@@ -642,32 +933,39 @@ class DisplayController:
         # Update all loaded plugins
         plugins_dict = getattr(self.plugin_manager, 'loaded_plugins', None) or getattr(self.plugin_manager, 'plugins', {})
         for plugin_id, plugin_instance in plugins_dict.items():
-            # Check circuit breaker before attempting update
-            if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
-                if self.plugin_manager.health_tracker.should_skip_plugin(plugin_id):
-                    logger.debug(f"Skipping update for plugin {plugin_id} due to circuit breaker")
-                    continue
-            
-            # Use PluginExecutor if available for safe execution
-            if hasattr(self.plugin_manager, 'plugin_executor'):
-                success = self.plugin_manager.plugin_executor.execute_update(plugin_instance, plugin_id)
-                if success and hasattr(self.plugin_manager, 'plugin_last_update'):
-                    self.plugin_manager.plugin_last_update[plugin_id] = time.time()
-            else:
-                # Fallback to direct call
-                try:
-                    if hasattr(plugin_instance, 'update'):
-                        plugin_instance.update()
-                        if hasattr(self.plugin_manager, 'plugin_last_update'):
-                            self.plugin_manager.plugin_last_update[plugin_id] = time.time()
-                        # Record success
-                        if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
-                            self.plugin_manager.health_tracker.record_success(plugin_id)
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.exception("Error updating plugin %s", plugin_id)
-                    # Record failure
-                    if hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
-                        self.plugin_manager.health_tracker.record_failure(plugin_id, exc)
+            self._update_plugin(plugin_id, plugin_instance)
+
+    def _update_plugin(self, plugin_id: str, plugin_instance: Any) -> None:
+        """Update a single plugin, honoring its circuit breaker."""
+        plugin_manager = self.plugin_manager
+        health_tracker = getattr(plugin_manager, 'health_tracker', None)
+        last_update = getattr(plugin_manager, 'plugin_last_update', None)
+
+        # Check circuit breaker before attempting update
+        if health_tracker and health_tracker.should_skip_plugin(plugin_id):
+            logger.debug("Skipping update for plugin %s due to circuit breaker", plugin_id)
+            return
+        
+        # Use PluginExecutor if available for safe execution
+        if hasattr(plugin_manager, 'plugin_executor'):
+            success = plugin_manager.plugin_executor.execute_update(plugin_instance, plugin_id)
+            if success and last_update is not None:
+                last_update[plugin_id] = time.time()
+        else:
+            # Fallback to direct call
+            try:
+                if hasattr(plugin_instance, 'update'):
+                    plugin_instance.update()
+                    if last_update is not None:
+                        last_update[plugin_id] = time.time()
+                    # Record success
+                    if health_tracker:
+                        health_tracker.record_success(plugin_id)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception("Error updating plugin %s", plugin_id)
+                # Record failure
+                if health_tracker:
+                    health_tracker.record_failure(plugin_id, exc)
 
     def _tick_plugin_updates(self):
         """Run scheduled plugin updates if the plugin manager supports them."""
@@ -680,37 +978,93 @@ class DisplayController:
             except Exception:  # pylint: disable=broad-except
                 logger.exception("Error running scheduled plugin updates")
 
+    def _seconds_until_next_plugin_update(self) -> Optional[float]:
+        """Ask the plugin manager how long until a scheduled update is due, if it can tell."""
+        if not self.plugin_manager or not hasattr(self.plugin_manager, "seconds_until_next_update"):
+            return None
+        try:
+            next_due = self.plugin_manager.seconds_until_next_update()
+            return None if next_due is None else float(next_due)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error reading the plugin update schedule")
+            return None
+
     def _sleep_with_plugin_updates(self, duration: float, tick_interval: float = 1.0):
-        """Sleep while continuing to service plugin update schedules."""
+        """
+        Sleep while continuing to service plugin update schedules.
+
+        Wakes every tick_interval, or less often when the plugin manager reports
+        that no update is due sooner.
+        """
         if duration <= 0:
             return
 
-        end_time = time.time() + duration
+        end_time = time.monotonic() + duration
         tick_interval = max(0.001, tick_interval)
+        next_due = self._seconds_until_next_plugin_update()
 
         while True:
-            remaining = end_time - time.time()
+            remaining = end_time - time.monotonic()
             if remaining <= 0:
                 break
 
-            sleep_time = min(tick_interval, remaining)
+            sleep_time = min(max(tick_interval, next_due or 0.0), remaining)
             time.sleep(sleep_time)
             self._tick_plugin_updates()
+            next_due = self._seconds_until_next_plugin_update()
+
+    def _plugin_caps(self, plugin_instance) -> Dict[str, Any]:
+        """
+        Get a plugin's optional hooks, probing its attributes only on first use.
+
+        Args:
+            plugin_instance: The plugin to inspect
+
+        Returns:
+            Dict mapping each name in _PLUGIN_CAPABILITIES to the bound method,
+            or None when the plugin doesn't provide a callable of that name,
+            plus 'accepts_display_mode': whether display() takes a display_mode argument
+        """
+        entry = self._plugin_capabilities.get(id(plugin_instance))
+        # The identity check keeps a reused id() from returning another plugin's hooks
+        if entry is None or entry[0] is not plugin_instance:
+            caps = {}
+            for name in _PLUGIN_CAPABILITIES:
+                fn = getattr(plugin_instance, name, None)
+                caps[name] = fn if callable(fn) else None
+            try:
+                caps['accepts_display_mode'] = (
+                    'display_mode' in inspect.signature(plugin_instance.display).parameters
+                )
+            except (AttributeError, TypeError, ValueError):
+                caps['accepts_display_mode'] = False
+            entry = self._plugin_capabilities[id(plugin_instance)] = (plugin_instance, caps)
+        return entry[1]
 
     def _get_display_duration(self, mode_key):
         """Get display duration for a mode."""
         # Check plugin-specific duration first
-        if mode_key in self.plugin_modes:
-            plugin_instance = self.plugin_modes[mode_key]
-            if hasattr(plugin_instance, 'get_display_duration'):
-                return plugin_instance.get_display_duration()
+        plugin_instance = self.plugin_modes.get(mode_key)
+        if plugin_instance is not None:
+            duration_fn = self._plugin_caps(plugin_instance)['get_display_duration']
+            if duration_fn is not None:
+                return duration_fn()
         
         # Fall back to config
-        display_durations = self.config.get('display', {}).get('display_durations', {})
-        return display_durations.get(mode_key, 30)
+        if self._display_durations_source is not self.config:
+            self._display_durations = self.config.get('display', {}).get('display_durations', {}) or {}
+            self._display_durations_source = self.config
+        return self._display_durations.get(mode_key, 30)
 
     def _get_global_dynamic_cap(self) -> Optional[float]:
         """Return global fallback dynamic duration cap."""
+        if self._global_dynamic_cap_source is not self.global_dynamic_config:
+            self._global_dynamic_cap = self._parse_global_dynamic_cap()
+            self._global_dynamic_cap_source = self.global_dynamic_config
+        return self._global_dynamic_cap
+
+    def _parse_global_dynamic_cap(self) -> Optional[float]:
+        """Parse display.dynamic_duration.max_duration_seconds."""
         cap_value = self.global_dynamic_config.get("max_duration_seconds")
         if cap_value is None:
             return DEFAULT_DYNAMIC_DURATION_CAP
@@ -725,8 +1079,8 @@ class DisplayController:
 
     def _plugin_supports_dynamic(self, plugin_instance) -> bool:
         """Safely determine whether plugin supports dynamic duration."""
-        supports_fn = getattr(plugin_instance, "supports_dynamic_duration", None)
-        if not callable(supports_fn):
+        supports_fn = self._plugin_caps(plugin_instance)["supports_dynamic_duration"]
+        if supports_fn is None:
             return False
         try:
             return bool(supports_fn())
@@ -739,8 +1093,8 @@ class DisplayController:
 
     def _plugin_dynamic_cap(self, plugin_instance) -> Optional[float]:
         """Fetch plugin-specific dynamic duration cap."""
-        cap_fn = getattr(plugin_instance, "get_dynamic_duration_cap", None)
-        if not callable(cap_fn):
+        cap_fn = self._plugin_caps(plugin_instance)["get_dynamic_duration_cap"]
+        if cap_fn is None:
             return None
         try:
             return cap_fn()
@@ -764,8 +1118,8 @@ class DisplayController:
         Returns:
             Calculated duration in seconds, or None if not available
         """
-        duration_fn = getattr(plugin_instance, "get_cycle_duration", None)
-        if not callable(duration_fn):
+        duration_fn = self._plugin_caps(plugin_instance)["get_cycle_duration"]
+        if duration_fn is None:
             return None
         try:
             return duration_fn(display_mode=display_mode)
@@ -781,8 +1135,8 @@ class DisplayController:
 
     def _plugin_reset_cycle(self, plugin_instance) -> None:
         """Reset plugin cycle tracking if supported."""
-        reset_fn = getattr(plugin_instance, "reset_cycle_state", None)
-        if not callable(reset_fn):
+        reset_fn = self._plugin_caps(plugin_instance)["reset_cycle_state"]
+        if reset_fn is None:
             return
         try:
             reset_fn()
@@ -792,8 +1146,8 @@ class DisplayController:
 
     def _plugin_cycle_complete(self, plugin_instance) -> bool:
         """Determine if plugin reports cycle completion."""
-        complete_fn = getattr(plugin_instance, "is_cycle_complete", None)
-        if not callable(complete_fn):
+        complete_fn = self._plugin_caps(plugin_instance)["is_cycle_complete"]
+        if complete_fn is None:
             return True
         try:
             return bool(complete_fn())
@@ -813,11 +1167,42 @@ class DisplayController:
         """Calculate remaining time for an active on-demand session."""
         if not self.on_demand_active or self.on_demand_expires_at is None:
             return None
-        remaining = self.on_demand_expires_at - time.time()
+        remaining = self._get_on_demand_deadline() - time.monotonic()
         return max(0.0, remaining)
 
+    def _get_on_demand_deadline(self) -> float:
+        """
+        Get on_demand_expires_at as a time.monotonic() deadline.
+
+        The wall-clock expiry is anchored to the monotonic clock the first time
+        each value is seen, so an NTP step (common right after a Pi boots without
+        an RTC) can't end the session early or extend it.
+
+        Returns:
+            Monotonic time at which the on-demand session expires
+        """
+        if self._on_demand_deadline_source != self.on_demand_expires_at:
+            self._on_demand_deadline = time.monotonic() + (self.on_demand_expires_at - time.time())
+            self._on_demand_deadline_source = self.on_demand_expires_at
+        return self._on_demand_deadline
+
     def _publish_on_demand_state(self) -> None:
         """Publish current on-demand state to cache for external consumers."""
+        now = time.time()
+        remaining = self._get_on_demand_remaining()
+        fields = (
+            self.on_demand_active, self.on_demand_mode, self.on_demand_plugin_id,
+            self.on_demand_requested_at, self.on_demand_expires_at, self.on_demand_duration,
+            self.on_demand_pinned, self.on_demand_status, self.on_demand_last_error,
+            self.on_demand_last_event,
+            # Coarse bucket so rotation publishes keep the web UI countdown current
+            None if remaining is None else int(remaining) // ON_DEMAND_REMAINING_BUCKET_SECONDS,
+        )
+        # Skip no-op republishes (e.g. rotating a single-mode on-demand session
+        # twice within one remaining-time bucket); 'last_updated' doesn't count
+        last = self._last_on_demand_publish
+        if last is not None and last[0] == fields and now - last[1] < ON_DEMAND_STATE_REFRESH_SECONDS:
+            return
         try:
             state = {
                 'active': self.on_demand_active,
@@ -830,10 +1215,11 @@ class DisplayController:
                 'status': self.on_demand_status,
                 'error': self.on_demand_last_error,
                 'last_event': self.on_demand_last_event,
-                'remaining': self._get_on_demand_remaining(),
-                'last_updated': time.time()
+                'remaining': remaining,
+                'last_updated': now
             }
             self.cache_manager.set('display_on_demand_state', state)
+            self._last_on_demand_publish = (fields, now)
         except (OSError, RuntimeError, ValueError, TypeError) as err:
             logger.error("Failed to publish on-demand state: %s", err, exc_info=True)
 
@@ -860,7 +1246,15 @@ class DisplayController:
         try:
             # Use a long max_age (1 hour) to ensure requests aren't expired before processing
             # The request_id check prevents duplicate processing
-            request = self.cache_manager.get('display_on_demand_request', max_age=3600)
+            version, request = self.cache_manager.get_if_changed(
+                'display_on_demand_request', self._on_demand_request_version, max_age=3600)
+            if version is None:
+                # No request file on disk (or disk cache disabled): use the regular lookup
+                request = self.cache_manager.get('display_on_demand_request', max_age=3600)
+            elif version == self._on_demand_request_version:
+                # Request file unchanged since the last poll; it has been handled
+                return
+            self._on_demand_request_version = version
         except (OSError, RuntimeError, ValueError, TypeError) as err:
             logger.error("Failed to read on-demand request: %s", err, exc_info=True)
             return
@@ -948,61 +1342,70 @@ class DisplayController:
                 return modes[0]
         return plugin_id
 
-    def _populate_on_demand_modes_from_plugin(self) -> None:
+    def _order_on_demand_modes(self, plugin_id: str) -> List[str]:
         """
-        Populate on_demand_modes from the on-demand plugin's display modes.
-        Called after plugin loading completes when on-demand state is restored from cache.
+        Order a plugin's loaded display modes for on-demand rotation.
+
+        Live modes with content come first, then the other modes, then live modes
+        without content. Live modes without content are left out unless the
+        plugin has nothing else to show.
+
+        Args:
+            plugin_id: Plugin identifier
+
+        Returns:
+            Ordered list of modes, empty if the plugin has no loaded modes
         """
-        if not self.on_demand_active or not self.on_demand_plugin_id:
-            return
-        
-        plugin_id = self.on_demand_plugin_id
-        
-        # Get all modes for this plugin
-        plugin_modes = self.plugin_display_modes.get(plugin_id, [])
-        if not plugin_modes:
-            # Fallback: find all modes that belong to this plugin
-            plugin_modes = [mode for mode, pid in self.mode_to_plugin_id.items() if pid == plugin_id]
-        
+        partition = self._plugin_mode_partitions.get(plugin_id)
+        if partition is None:
+            plugin_modes = self.plugin_display_modes.get(plugin_id, [])
+            if not plugin_modes:
+                # Fallback: find all modes that belong to this plugin
+                plugin_modes = [mode for mode, pid in self.mode_to_plugin_id.items() if pid == plugin_id]
+            partition = _partition_live_modes(plugin_modes)
+
         # Filter to only include modes that exist in plugin_modes
-        available_plugin_modes = [m for m in plugin_modes if m in self.plugin_modes]
-        
-        if not available_plugin_modes:
-            logger.warning("No valid display modes found for on-demand plugin '%s' after restoration", plugin_id)
-            self.on_demand_modes = []
-            return
-        
-        # Prioritize live modes if they exist and have content
-        live_modes = [m for m in available_plugin_modes if m.endswith('_live')]
-        other_modes = [m for m in available_plugin_modes if not m.endswith('_live')]
-        
+        live_modes = [m for m in partition[0] if m in self.plugin_modes]
+        other_modes = [m for m in partition[1] if m in self.plugin_modes]
+
         # Check if live modes have content
         live_with_content = []
         for live_mode in live_modes:
-            plugin_instance = self.plugin_modes.get(live_mode)
-            if plugin_instance and hasattr(plugin_instance, 'has_live_content'):
+            has_live_content = self._plugin_caps(self.plugin_modes[live_mode])['has_live_content']
+            if has_live_content is not None:
                 try:
-                    if plugin_instance.has_live_content():
+                    if has_live_content():
                         live_with_content.append(live_mode)
                 except Exception:
                     pass
-        
+
         # Build mode list: live modes with content first, then other modes, then live modes without content
         if live_with_content:
-            ordered_modes = live_with_content + other_modes + [m for m in live_modes if m not in live_with_content]
-        else:
-            # No live content, skip live modes
-            ordered_modes = other_modes
+            return live_with_content + other_modes + [m for m in live_modes if m not in live_with_content]
+        # No live content, skip live modes unless they are all the plugin has
+        return other_modes or live_modes
+
+    def _populate_on_demand_modes_from_plugin(self) -> None:
+        """
+        Populate on_demand_modes from the on-demand plugin's display modes.
+        Called after plugin loading completes when on-demand state is restored from cache.
+        """
+        if not self.on_demand_active or not self.on_demand_plugin_id:
+            return
+        
+        plugin_id = self.on_demand_plugin_id
+        ordered_modes = self._order_on_demand_modes(plugin_id)
         
         if not ordered_modes:
-            # Only live modes available but no content - use them anyway
-            ordered_modes = live_modes
+            logger.warning("No valid display modes found for on-demand plugin '%s' after restoration", plugin_id)
+            self.on_demand_modes = []
+            return
         
         self.on_demand_modes = ordered_modes
         # Set index to match the restored mode if available, otherwise start at 0
-        if self.on_demand_mode and self.on_demand_mode in ordered_modes:
+        try:
             self.on_demand_mode_index = ordered_modes.index(self.on_demand_mode)
-        else:
+        except ValueError:
             self.on_demand_mode_index = 0
         
         logger.info("Populated on-demand modes for plugin '%s': %s (starting at index %d: %s)", 
@@ -1020,6 +1423,7 @@ class DisplayController:
             self._set_on_demand_error("missing-mode")
             return
 
+        self._ensure_plugin_loaded(self.mode_to_plugin_id.get(resolved_mode))
         if resolved_mode not in self.plugin_modes:
             logger.error("Requested on-demand mode '%s' is not available", resolved_mode)
             self._set_on_demand_error("invalid-mode")
@@ -1049,49 +1453,17 @@ class DisplayController:
         else:
             self.rotation_resume_index = None
 
-        if resolved_mode in self.available_modes:
+        try:
             self.current_mode_index = self.available_modes.index(resolved_mode)
+        except ValueError:
+            pass
 
-        # Get all modes for this plugin
-        plugin_modes = self.plugin_display_modes.get(resolved_plugin_id, [])
-        if not plugin_modes:
-            # Fallback: find all modes that belong to this plugin
-            plugin_modes = [mode for mode, pid in self.mode_to_plugin_id.items() if pid == resolved_plugin_id]
-        
-        # Filter to only include modes that exist in plugin_modes
-        available_plugin_modes = [m for m in plugin_modes if m in self.plugin_modes]
-        
-        if not available_plugin_modes:
+        ordered_modes = self._order_on_demand_modes(resolved_plugin_id)
+        if not ordered_modes:
             logger.error("No valid display modes found for plugin '%s'", resolved_plugin_id)
             self._set_on_demand_error("no-modes")
             return
         
-        # Prioritize live modes if they exist and have content
-        live_modes = [m for m in available_plugin_modes if m.endswith('_live')]
-        other_modes = [m for m in available_plugin_modes if not m.endswith('_live')]
-        
-        # Check if live modes have content
-        live_with_content = []
-        for live_mode in live_modes:
-            plugin_instance = self.plugin_modes.get(live_mode)
-            if plugin_instance and hasattr(plugin_instance, 'has_live_content'):
-                try:
-                    if plugin_instance.has_live_content():
-                        live_with_content.append(live_mode)
-                except Exception:
-                    pass
-        
-        # Build mode list: live modes with content first, then other modes, then live modes without content
-        if live_with_content:
-            ordered_modes = live_with_content + other_modes + [m for m in live_modes if m not in live_with_content]
-        else:
-            # No live content, skip live modes
-            ordered_modes = other_modes
-        
-        if not ordered_modes:
-            # Only live modes available but no content - use them anyway
-            ordered_modes = live_modes
-        
         self.on_demand_active = True
         self.on_demand_mode = resolved_mode  # Keep for backward compatibility
         self.on_demand_modes = ordered_modes
@@ -1115,8 +1487,10 @@ class DisplayController:
             logger.warning("Failed to clear display during on-demand activation: %s", e)
         
         # Start with first mode (or resolved_mode if it's in the list)
-        if resolved_mode in ordered_modes:
+        try:
             self.on_demand_mode_index = ordered_modes.index(resolved_mode)
+        except ValueError:
+            pass
         self.current_display_mode = ordered_modes[self.on_demand_mode_index]
         logger.info("Activated on-demand for plugin '%s' with %d modes: %s (starting at index %d: %s)", 
                    resolved_plugin_id, len(ordered_modes), ordered_modes, 
@@ -1190,7 +1564,7 @@ class DisplayController:
         if self.on_demand_expires_at is None:
             return
 
-        if time.time() >= self.on_demand_expires_at:
+        if time.monotonic() >= self._get_on_demand_deadline():
             logger.info("On-demand mode '%s' expired (duration: %s seconds)", 
                        self.on_demand_mode, self.on_demand_duration)
             self._clear_on_demand(reason='expired')
@@ -1200,7 +1574,7 @@ class DisplayController:
         if not self._enable_memory_logging:
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         if (current_time - self._last_memory_log) < self._memory_log_interval:
             return
         
@@ -1224,34 +1598,46 @@ class DisplayController:
             if hasattr(self.display_manager, '_scrolling_state'):
                 deferred_count = len(self.display_manager._scrolling_state.get('deferred_updates', []))
                 if deferred_count > 0:
-                    logger.info(f"Deferred Updates Queue: {deferred_count} pending updates")
+                    logger.info("Deferred Updates Queue: %d pending updates", deferred_count)
             
         except Exception as e:
-            logger.debug(f"Error logging memory stats: {e}")
+            logger.debug("Error logging memory stats: %s", e)
 
     def _check_live_priority(self):
         """
         Check all plugins for live priority content.
         Returns the mode that should be displayed if live content is found, None otherwise.
         """
+        # Each plugin is probed once per scan, however many modes it registers:
+        # id(plugin) -> whether it is live (its suggested live modes already tried)
+        live_plugins: Dict[int, bool] = {}
         for mode_name, plugin_instance in self.plugin_modes.items():
-            if hasattr(plugin_instance, 'has_live_priority') and hasattr(plugin_instance, 'has_live_content'):
-                try:
-                    if plugin_instance.has_live_priority() and plugin_instance.has_live_content():
-                        # Get the specific live mode from the plugin if available
-                        if hasattr(plugin_instance, 'get_live_modes'):
-                            live_modes = plugin_instance.get_live_modes()
-                            if live_modes and len(live_modes) > 0:
-                                # Verify the mode actually exists before returning it
-                                for suggested_mode in live_modes:
-                                    if suggested_mode in self.plugin_modes:
-                                        return suggested_mode
-                                # If suggested modes don't exist, fall through to check current mode
-                        # Fallback: if this mode ends with _live, return it
-                        if mode_name.endswith('_live'):
-                            return mode_name
-                except Exception as e:
-                    logger.warning("Error checking live priority for %s: %s", mode_name, e)
+            is_live = live_plugins.get(id(plugin_instance))
+            if is_live is None:
+                is_live = False
+                caps = self._plugin_caps(plugin_instance)
+                has_live_priority = caps['has_live_priority']
+                has_live_content = caps['has_live_content']
+                if has_live_priority is not None and has_live_content is not None:
+                    try:
+                        if has_live_priority() and has_live_content():
+                            # Get the specific live mode from the plugin if available
+                            get_live_modes = caps['get_live_modes']
+                            if get_live_modes is not None:
+                                live_modes = get_live_modes()
+                                if live_modes and len(live_modes) > 0:
+                                    # Verify the mode actually exists before returning it
+                                    for suggested_mode in live_modes:
+                                        if suggested_mode in self.plugin_modes:
+                                            return suggested_mode
+                                    # If suggested modes don't exist, fall through to check current mode
+                            is_live = True
+                    except Exception as e:
+                        logger.warning("Error checking live priority for %s: %s", mode_name, e)
+                live_plugins[id(plugin_instance)] = is_live
+            # Fallback: if this mode ends with _live, return it
+            if is_live and mode_name.endswith('_live'):
+                return mode_name
         return None
 
     def run(self):
@@ -1260,6 +1646,10 @@ class DisplayController:
             logger.warning("No display modes are enabled. Exiting.")
             self.display_manager.cleanup()
             return
+
+        # Pin the render loop only now, so threads started during initialization
+        # don't inherit its affinity
+        _pin_current_thread(self.cpu_affinity_config.get("render_core"), "render loop")
              
         try:
             # Initialize with cached data for fast startup - let background updates refresh naturally
@@ -1304,13 +1694,13 @@ class DisplayController:
                         self.display_manager.clear()
                         self.display_manager.update_display()
                     except Exception as e:
-                        logger.debug(f"Error clearing display when inactive: {e}")
+                        logger.debug("Error clearing display when inactive: %s", e)
                     
-                    logger.info(f"Display not active (is_display_active={self.is_display_active}), sleeping...")
+                    logger.info("Display not active (is_display_active=%s), sleeping...", self.is_display_active)
                     self._sleep_with_plugin_updates(60)
                     continue
                 
-                logger.info(f"Display active, processing mode: {self.current_display_mode}")
+                logger.info("Display active, processing mode: %s", self.current_display_mode)
                 
                 # Plugins update on their own schedules - no forced sync updates needed
                 # Each plugin has its own update_interval and background services
@@ -1393,9 +1783,11 @@ class DisplayController:
 
                 manager_to_display = None
                 
-                logger.info(f"Processing mode: {active_mode}, available_modes: {len(self.available_modes)}, plugin_modes: {list(self.plugin_modes.keys())}")
+                logger.info("Processing mode: %s, available_modes: %d, plugin_modes: %s",
+                            active_mode, len(self.available_modes), list(self.plugin_modes))
                 
                 # Handle plugin-based display modes
+                self._ensure_plugin_loaded(self.mode_to_plugin_id.get(active_mode))
                 if active_mode in self.plugin_modes:
                     plugin_instance = self.plugin_modes[active_mode]
                     if hasattr(plugin_instance, 'display'):
@@ -1405,33 +1797,32 @@ class DisplayController:
                         if self.plugin_manager and hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
                             should_skip = self.plugin_manager.health_tracker.should_skip_plugin(plugin_id)
                             if should_skip:
-                                logger.info(f"Skipping plugin {plugin_id} due to circuit breaker (mode: {active_mode})")
+                                logger.info("Skipping plugin %s due to circuit breaker (mode: %s)", plugin_id, active_mode)
                                 display_result = False
                                 # Skip to next mode - let existing logic handle it
                                 manager_to_display = None
                         
                         if not should_skip:
                             manager_to_display = plugin_instance
-                            logger.debug(f"Found plugin manager for mode {active_mode}: {type(plugin_instance).__name__}")
+                            logger.debug("Found plugin manager for mode %s: %s", active_mode, type(plugin_instance).__name__)
                     else:
-                        logger.warning(f"Plugin {active_mode} found but has no display() method")
+                        logger.warning("Plugin %s found but has no display() method", active_mode)
                 else:
-                    logger.warning(f"Mode {active_mode} not found in plugin_modes (available: {list(self.plugin_modes.keys())})")
+                    logger.warning("Mode %s not found in plugin_modes (available: %s)", active_mode, list(self.plugin_modes))
                 
                 # Display the current mode
                 display_result = True  # Default to True for backward compatibility
                 display_failed_due_to_exception = False  # Track if False was due to exception vs no content
                 if not manager_to_display:
-                    logger.warning(f"No plugin manager found for mode {active_mode} - skipping display and rotating to next mode")
+                    logger.warning("No plugin manager found for mode %s - skipping display and rotating to next mode", active_mode)
                     display_result = False
                 elif manager_to_display:
                     plugin_id = getattr(manager_to_display, 'plugin_id', active_mode)
                     try:
-                        logger.debug(f"Calling display() for {active_mode} with force_clear={self.force_change}")
+                        logger.debug("Calling display() for %s with force_clear=%s", active_mode, self.force_change)
                         if hasattr(manager_to_display, 'display'):
                             # Check if plugin accepts display_mode parameter
-                            import inspect
-                            sig = inspect.signature(manager_to_display.display)
+                            accepts_display_mode = self._plugin_caps(manager_to_display)['accepts_display_mode']
                             
                             # Use PluginExecutor for safe execution with timeout
                             if self.plugin_manager and hasattr(self.plugin_manager, 'plugin_executor'):
@@ -1439,7 +1830,7 @@ class DisplayController:
                                     manager_to_display,
                                     plugin_id,
                                     force_clear=self.force_change,
-                                    display_mode=active_mode if 'display_mode' in sig.parameters else None
+                                    display_mode=active_mode if accepts_display_mode else None
                                 )
                                 # execute_display returns bool, convert to expected format
                                 if result:
@@ -1448,17 +1839,17 @@ class DisplayController:
                                     result = False  # Failed
                             else:
                                 # Fallback to direct call if executor not available
-                                if 'display_mode' in sig.parameters:
+                                if accepts_display_mode:
                                     result = manager_to_display.display(display_mode=active_mode, force_clear=self.force_change)
                                 else:
                                     result = manager_to_display.display(force_clear=self.force_change)
                             
-                            logger.debug(f"display() returned: {result} (type: {type(result)})")
+                            logger.debug("display() returned: %s (type: %s)", result, type(result))
                             # Check if display() returned a boolean (new behavior)
                             if isinstance(result, bool):
                                 display_result = result
                                 if not display_result:
-                                    logger.info(f"Plugin {plugin_id} display() returned False for mode {active_mode}")
+                                    logger.info("Plugin %s display() returned False for mode %s", plugin_id, active_mode)
                         
                         # Record success if display completed without exception
                         if self.plugin_manager and hasattr(self.plugin_manager, 'health_tracker') and self.plugin_manager.health_tracker:
@@ -1527,7 +1918,7 @@ class DisplayController:
                                     if next_plugin_id != current_plugin_id:
                                         self.current_mode_index = next_index
                                         self.current_display_mode = next_mode
-                                        self.last_mode_change = time.time()
+                                        self.last_mode_change = time.monotonic()
                                         self.force_change = True
                                         logger.info("Switching to mode: %s (skipped plugin %s due to exception)", 
                                                   self.current_display_mode, current_plugin_id)
@@ -1688,7 +2079,7 @@ class DisplayController:
                             )
 
                         target_duration = max_duration
-                        start_time = time.time()
+                        start_time = time.monotonic()
 
                         def _should_exit_dynamic(elapsed_time: float) -> bool:
                             if not dynamic_enabled:
@@ -1737,7 +2128,7 @@ class DisplayController:
                             while True:
                                 try:
                                     # Pass display_mode to maintain sticky manager state
-                                    if 'display_mode' in sig.parameters:
+                                    if accepts_display_mode:
                                         result = manager_to_display.display(display_mode=active_mode, force_clear=False)
                                     else:
                                         result = manager_to_display.display(force_clear=False)
@@ -1756,7 +2147,7 @@ class DisplayController:
                                     logger.debug("Mode changed during high-FPS loop, breaking early")
                                     break
 
-                                elapsed = time.time() - start_time
+                                elapsed = time.monotonic() - start_time
                                 if elapsed >= target_duration:
                                     logger.debug(
                                         "Reached high-FPS target duration %.2fs for mode %s",
@@ -1786,7 +2177,7 @@ class DisplayController:
                                 time.sleep(display_interval)
                                 self._tick_plugin_updates()
 
-                                elapsed = time.time() - start_time
+                                elapsed = time.monotonic() - start_time
                                 if elapsed >= target_duration:
                                     logger.debug(
                                         "Reached standard target duration %.2fs for mode %s",
@@ -1798,7 +2189,7 @@ class DisplayController:
 
                                 try:
                                     # Pass display_mode to maintain sticky manager state
-                                    if 'display_mode' in sig.parameters:
+                                    if accepts_display_mode:
                                         result = manager_to_display.display(display_mode=active_mode, force_clear=False)
                                     else:
                                         result = manager_to_display.display(force_clear=False)
@@ -1834,13 +2225,13 @@ class DisplayController:
                             and not loop_completed
                             and not needs_high_fps
                         ):
-                            elapsed = time.time() - start_time
+                            elapsed = time.monotonic() - start_time
                             remaining_sleep = max(0.0, max_duration - elapsed)
                             if remaining_sleep > 0:
                                 self._sleep_with_plugin_updates(remaining_sleep)
 
                         if dynamic_enabled:
-                            elapsed_total = time.time() - start_time
+                            elapsed_total = time.monotonic() - start_time
                             cycle_done = self._plugin_cycle_complete(manager_to_display)
                             
                             # Log cycle completion status and metrics
@@ -1894,20 +2285,20 @@ class DisplayController:
 
                 # Check for live priority - don't rotate if current plugin has live content
                 should_rotate = True
-                if active_mode in self.plugin_modes:
-                    plugin_instance = self.plugin_modes[active_mode]
-                    if hasattr(plugin_instance, 'has_live_priority') and hasattr(plugin_instance, 'has_live_content'):
-                        try:
-                            if plugin_instance.has_live_priority() and plugin_instance.has_live_content():
-                                logger.info("Live priority active for %s - staying on current mode", active_mode)
-                                should_rotate = False
-                        except Exception as e:
-                            logger.warning("Error checking live priority for %s: %s", active_mode, e)
+                plugin_instance = self.plugin_modes.get(active_mode)
+                caps = self._plugin_caps(plugin_instance) if plugin_instance is not None else None
+                if caps and caps['has_live_priority'] is not None and caps['has_live_content'] is not None:
+                    try:
+                        if caps['has_live_priority']() and caps['has_live_content']():
+                            logger.info("Live priority active for %s - staying on current mode", active_mode)
+                            should_rotate = False
+                    except Exception as e:
+                        logger.warning("Error checking live priority for %s: %s", active_mode, e)
                 
                 if should_rotate:
                     self.current_mode_index = (self.current_mode_index + 1) % len(self.available_modes)
                     self.current_display_mode = self.available_modes[self.current_mode_index]
-                    self.last_mode_change = time.time()
+                    self.last_mode_change = time.monotonic()
                     self.force_change = True
                     
                     logger.info("Switching to mode: %s", self.current_display_mode)
@@ -1922,6 +2313,9 @@ class DisplayController:
     def _check_wifi_status_message(self) -> Optional[Dict[str, Any]]:
         """
         Safely check for WiFi status message file.
+
+        The file is stat'ed on each check but only re-read and re-parsed when
+        its mtime or size changes.
         
         Returns:
             Dict with 'message', 'timestamp', 'duration' if valid message exists, None otherwise.
@@ -1929,67 +2323,94 @@ class DisplayController:
         """
         try:
             # Check if file exists
-            if not self.wifi_status_file or not self.wifi_status_file.exists():
+            if not self.wifi_status_file:
                 return None
-            
-            # Read and parse JSON file
             try:
-                with open(self.wifi_status_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, IOError, OSError) as e:
-                logger.debug(f"Error reading WiFi status file (will be cleaned up): {e}")
-                # Clean up corrupted file
-                try:
-                    self.wifi_status_file.unlink()
-                except Exception:
-                    pass
-                return None
-            
-            # Validate required fields
-            if not isinstance(data, dict):
-                logger.debug("WiFi status file contains invalid data (not a dict)")
+                stat_result = os.stat(self.wifi_status_file)
+            except OSError:
+                self._wifi_status_cache = None
                 return None
             
-            message = data.get('message')
-            timestamp = data.get('timestamp')
-            duration = data.get('duration', 5)
-            
-            if not message or not isinstance(message, str):
-                logger.debug("WiFi status file missing or invalid message field")
-                return None
-            
-            if not isinstance(timestamp, (int, float)) or timestamp <= 0:
-                logger.debug("WiFi status file missing or invalid timestamp field")
+            file_stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+            cached = self._wifi_status_cache
+            if cached is not None and cached[0] == file_stamp:
+                status = cached[1]
+            else:
+                status = self._read_wifi_status_file()
+                self._wifi_status_cache = (file_stamp, status)
+            if status is None:
                 return None
             
-            if not isinstance(duration, (int, float)) or duration < 0:
-                duration = 5  # Default to 5 seconds if invalid
-            
             # Check if message has expired
             current_time = time.time()
-            expires_at = timestamp + duration
+            timestamp = status['timestamp']
+            duration = status['duration']
             
-            if current_time >= expires_at:
-                logger.debug(f"WiFi status message expired (age: {current_time - timestamp:.1f}s, duration: {duration}s)")
+            if current_time >= status['expires_at']:
+                logger.debug("WiFi status message expired (age: %.1fs, duration: %ss)", current_time - timestamp, duration)
                 # Clean up expired file
                 try:
                     self.wifi_status_file.unlink()
                 except Exception:
                     pass
+                self._wifi_status_cache = None
                 return None
             
             # Message is valid and not expired
-            return {
-                'message': message,
-                'timestamp': timestamp,
-                'duration': duration,
-                'expires_at': expires_at
-            }
+            return dict(status)
             
         except Exception as e:
             # Catch-all for any unexpected errors - log but don't break the display
-            logger.debug(f"Unexpected error checking WiFi status message: {e}")
+            logger.debug("Unexpected error checking WiFi status message: %s", e)
             return None
+
+    def _read_wifi_status_file(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and validate the WiFi status message file.
+
+        Returns:
+            Dict with 'message', 'timestamp', 'duration' and 'expires_at', or
+            None if the file is unreadable or invalid
+        """
+        # Read and parse JSON file
+        try:
+            with open(self.wifi_status_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            logger.debug("Error reading WiFi status file (will be cleaned up): %s", e)
+            # Clean up corrupted file
+            try:
+                self.wifi_status_file.unlink()
+            except Exception:
+                pass
+            return None
+        
+        # Validate required fields
+        if not isinstance(data, dict):
+            logger.debug("WiFi status file contains invalid data (not a dict)")
+            return None
+        
+        message = data.get('message')
+        timestamp = data.get('timestamp')
+        duration = data.get('duration', 5)
+        
+        if not message or not isinstance(message, str):
+            logger.debug("WiFi status file missing or invalid message field")
+            return None
+        
+        if not isinstance(timestamp, (int, float)) or timestamp <= 0:
+            logger.debug("WiFi status file missing or invalid timestamp field")
+            return None
+        
+        if not isinstance(duration, (int, float)) or duration < 0:
+            duration = 5  # Default to 5 seconds if invalid
+        
+        return {
+            'message': message,
+            'timestamp': timestamp,
+            'duration': duration,
+            'expires_at': timestamp + duration
+        }
     
     def _display_wifi_status_message(self, status_data: Dict[str, Any]) -> bool:
         """
@@ -2060,12 +2481,12 @@ class DisplayController:
             self.wifi_status_active = True
             self.wifi_status_expires_at = status_data.get('expires_at')
             
-            logger.debug(f"Displayed WiFi status message: {message[:50]}")
+            logger.debug("Displayed WiFi status message: %.50s", message)
             return True
             
         except Exception as e:
             # Catch-all for any display errors - log but don't break
-            logger.warning(f"Error displaying WiFi status message: {e}")
+            logger.warning("Error displaying WiFi status message: %s", e)
             self.wifi_status_active = False
             self.wifi_status_expires_at = None
             return False
@@ -2082,12 +2503,12 @@ class DisplayController:
                             self.wifi_status_file.unlink()
                             logger.debug("Cleaned up expired WiFi status message file")
                         except Exception as e:
-                            logger.debug(f"Could not delete WiFi status file: {e}")
+                            logger.debug("Could not delete WiFi status file: %s", e)
                     
                     self.wifi_status_active = False
                     self.wifi_status_expires_at = None
         except Exception as e:
-            logger.debug(f"Error cleaning up WiFi status: {e}")
+            logger.debug("Error cleaning up WiFi status: %s", e)
             # Reset state on any error
             self.wifi_status_active = False
             self.wifi_status_expires_at = None
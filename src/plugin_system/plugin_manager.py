@@ -107,27 +107,32 @@ class PluginManager:
             return plugin_ids
         
         try:
-            for item in directory.iterdir():
-                if not item.is_dir():
-                    continue
-                
+            # scandir reports entry types from the directory listing, so plain
+            # directories need no extra stat (symlinked plugins are still followed)
+            with os.scandir(directory) as entries:
+                plugin_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+            for item in plugin_dirs:
                 manifest_path = item / "manifest.json"
-                if manifest_path.exists():
-                    try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            manifest = json.load(f)
-                            plugin_id = manifest.get('id')
-                            if plugin_id:
-                                plugin_ids.append(plugin_id)
-                                self.plugin_manifests[plugin_id] = manifest
-                                
-                                # Store directory mapping
-                                if not hasattr(self, 'plugin_directories'):
-                                    self.plugin_directories = {}
-                                self.plugin_directories[plugin_id] = item
-                    except (json.JSONDecodeError, PermissionError, OSError) as e:
-                        self.logger.warning("Error reading manifest from %s: %s", manifest_path, e, exc_info=True)
-                        continue
+                # Open directly instead of checking exists() first; most directories have a manifest
+                try:
+                    with open(manifest_path, 'rb') as f:
+                        manifest = json.loads(f.read())
+                except FileNotFoundError:
+                    continue
+                except (json.JSONDecodeError, UnicodeDecodeError, PermissionError, OSError) as e:
+                    self.logger.warning("Error reading manifest from %s: %s", manifest_path, e, exc_info=True)
+                    continue
+
+                plugin_id = manifest.get('id')
+                if plugin_id:
+                    plugin_ids.append(plugin_id)
+                    self.plugin_manifests[plugin_id] = manifest
+                    
+                    # Store directory mapping
+                    if not hasattr(self, 'plugin_directories'):
+                        self.plugin_directories = {}
+                    self.plugin_directories[plugin_id] = item
         except (OSError, PermissionError) as e:
             self.logger.error("Error scanning directory %s: %s", directory, e, exc_info=True)
         
@@ -634,6 +639,45 @@ class PluginManager:
         # Default: 60 seconds
         return 60.0
 
+    def seconds_until_next_update(self, current_time: Optional[float] = None) -> Optional[float]:
+        """
+        Get the time until run_scheduled_updates() next has a plugin due.
+
+        Circuit breaker and execution state are not considered, so a plugin
+        they hold back keeps reporting as due; callers should poll no faster
+        than they otherwise would.
+
+        Args:
+            current_time: Current wall-clock time (defaults to time.time())
+
+        Returns:
+            Seconds until the next scheduled update (0.0 if one is already due),
+            or None if no plugin has scheduled updates
+        """
+        if current_time is None:
+            current_time = time.time()
+
+        next_due = None
+        for plugin_id, plugin_instance in list(self.plugins.items()):
+            if not getattr(plugin_instance, "enabled", True):
+                continue
+
+            if not hasattr(plugin_instance, "update"):
+                continue
+
+            interval = self._get_plugin_update_interval(plugin_id, plugin_instance)
+            if interval is None:
+                continue
+
+            last_update = self.plugin_last_update.get(plugin_id, 0.0)
+            if last_update == 0.0:
+                return 0.0
+            due_in = max(0.0, last_update + interval - current_time)
+            if next_due is None or due_in < next_due:
+                next_due = due_in
+
+        return next_due
+
     def run_scheduled_updates(self, current_time: Optional[float] = None) -> None:
         """
         Trigger plugin updates based on their defined update intervals.
@@ -39,6 +39,46 @@ class StartupValidator:
         """
         self.logger.info("Starting startup validation...")
         
+        self._run_config_checks()
+        
+        # Validate plugins if plugin manager is available
+        if self.plugin_manager:
+            self._validate_plugins()
+        
+        return self._report(0, 0, "Startup validation")
+    
+    def validate_config(self) -> Tuple[bool, List[str], List[str]]:
+        """
+        Run the configuration, cache directory and display checks.
+        
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        self.logger.info("Starting startup validation...")
+        self._run_config_checks()
+        return self._report(0, 0, "Startup validation")
+    
+    def validate_plugins(self, plugin_manager: Optional[Any] = None) -> Tuple[bool, List[str], List[str]]:
+        """
+        Run only the plugin checks, e.g. once the plugin manager exists after validate_config().
+        
+        Errors and warnings still accumulate for raise_on_errors(), but the
+        returned result covers this pass only.
+        
+        Args:
+            plugin_manager: PluginManager instance (defaults to the one given at init)
+            
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        if plugin_manager is not None:
+            self.plugin_manager = plugin_manager
+        errors_start, warnings_start = len(self.errors), len(self.warnings)
+        self._validate_plugins()
+        return self._report(errors_start, warnings_start, "Plugin validation")
+    
+    def _run_config_checks(self) -> None:
+        """Run the checks that do not need a plugin manager."""
         # Validate configuration
         self._validate_config()
         
@@ -47,21 +87,21 @@ class StartupValidator:
         
         # Validate display configuration
         self._validate_display_config()
-        
-        # Validate plugins if plugin manager is available
-        if self.plugin_manager:
-            self._validate_plugins()
-        
-        is_valid = len(self.errors) == 0
+    
+    def _report(self, errors_start: int, warnings_start: int, label: str) -> Tuple[bool, List[str], List[str]]:
+        """Log and return the errors and warnings recorded since the given offsets."""
+        errors = self.errors[errors_start:]
+        warnings = self.warnings[warnings_start:]
+        is_valid = len(errors) == 0
         
         if is_valid:
-            self.logger.info("Startup validation passed")
-            if self.warnings:
-                self.logger.warning(f"Startup validation completed with {len(self.warnings)} warning(s)")
+            self.logger.info(f"{label} passed")
+            if warnings:
+                self.logger.warning(f"{label} completed with {len(warnings)} warning(s)")
         else:
-            self.logger.error(f"Startup validation failed with {len(self.errors)} error(s)")
+            self.logger.error(f"{label} failed with {len(errors)} error(s)")
         
-        return (is_valid, self.errors.copy(), self.warnings.copy())
+        return (is_valid, errors, warnings)
     
     def _validate_config(self) -> None:
         """Validate configuration files."""
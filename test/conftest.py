@@ -55,6 +55,8 @@ def mock_cache_manager():
     mock.set = Mock(side_effect=mock_set)
     mock.clear = Mock(side_effect=mock_clear)
     mock.get_cached_data = Mock(side_effect=mock_get)
+    # No disk files in the mock; pollers fall back to get()
+    mock.get_if_changed = Mock(return_value=(None, None))
     mock.save_cache = Mock(side_effect=mock_set)
     mock.load_cache = Mock(side_effect=mock_get)
     mock.get_cache_dir = Mock(return_value=mock.cache_dir)
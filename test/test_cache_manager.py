@@ -4,9 +4,12 @@ Tests for CacheManager and cache components.
 Tests cache functionality including memory cache, disk cache, strategy, and metrics.
 """
 
+import json
+import math
+import os
 import time
-from datetime import datetime
-from unittest.mock import patch
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -72,6 +75,64 @@ class TestCacheStrategy:
         assert "max_age" in result
         assert result["max_age"] <= 60  # Live data should be short
 
+    def test_get_cache_strategy_sport_intervals(self):
+        """Test sport-specific intervals override live/recent/upcoming defaults."""
+        config_manager = MagicMock()
+        config_manager.config = {
+            "nba_scoreboard": {
+                "live_update_interval": 20,
+                "recent_update_interval": 900,
+                "upcoming_update_interval": 7200,
+            }
+        }
+        strategy = CacheStrategy(config_manager)
+
+        assert strategy.get_cache_strategy("sports_live", "nba")["max_age"] == 20
+        assert strategy.get_cache_strategy("sports_recent", "nba")["memory_ttl"] == 1800
+        assert strategy.get_cache_strategy("sports_upcoming", "nba")["max_age"] == 7200
+        assert strategy.get_cache_strategy("sports_upcoming", "nfl")["max_age"] == 10800
+
+    def test_sport_config_memo_follows_config_reloads(self):
+        """Test memoized sport config is dropped on config reload or invalidate()."""
+        config_manager = MagicMock()
+        config_manager.config = {"nba_scoreboard": {"live_update_interval": 20}}
+        strategy = CacheStrategy(config_manager)
+        assert strategy.get_sport_live_interval("nba") == 20
+
+        # load_config/save_config replace the config dict
+        config_manager.config = {"nba_scoreboard": {"live_update_interval": 45}}
+        assert strategy.get_sport_live_interval("nba") == 45
+
+        # In-place edits need an explicit invalidate()
+        config_manager.config["nba_scoreboard"] = {"live_update_interval": 90}
+        assert strategy.get_sport_live_interval("nba") == 45
+        strategy.invalidate()
+        assert strategy.get_sport_live_interval("nba") == 90
+
+    def test_get_cache_strategy_static_is_read_only(self):
+        """Test shared static strategies cannot be modified by callers."""
+        strategy = CacheStrategy()
+        result = strategy.get_cache_strategy("news")
+
+        with pytest.raises(TypeError):
+            result["max_age"] = 1
+        assert strategy.get_cache_strategy("news")["max_age"] == 3600
+
+    def test_is_market_open(self):
+        """Test market hours are 9:30-16:00 Eastern on weekdays."""
+        strategy = CacheStrategy()
+        # 2026-10-16 is a Friday, 2026-10-17 a Saturday; Eastern Time is UTC-4 in October
+        cases = [
+            (datetime(2026, 10, 16, 13, 29, 59, tzinfo=timezone.utc), False),
+            (datetime(2026, 10, 16, 13, 30, tzinfo=timezone.utc), True),
+            (datetime(2026, 10, 16, 20, 0, tzinfo=timezone.utc), True),
+            (datetime(2026, 10, 16, 20, 0, 1, tzinfo=timezone.utc), False),
+            (datetime(2026, 10, 17, 16, 0, tzinfo=timezone.utc), False),
+        ]
+        for moment, expected in cases:
+            with patch('src.cache.cache_strategy.time.time', return_value=moment.timestamp()):
+                assert strategy.is_market_open() is expected, moment
+
     def test_get_data_type_from_key(self):
         """Test data type detection from cache key."""
         strategy = CacheStrategy()
@@ -335,6 +396,38 @@ class TestDiskCache:
         assert result is not None
         assert "data" in result
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_set_and_get_json_backends(self, tmp_path, orjson_available):
+        """Test records round-trip the same with and without orjson."""
+        cache = DiskCache(cache_dir=str(tmp_path))
+        moment = datetime(2026, 1, 2, 3, 4, 5)
+        test_data = {"data": {"spread": -3.5, "teams": ["A", "B"]}, "when": moment, 7: "seven"}
+
+        with patch('src.cache.disk_cache.ORJSON_AVAILABLE', orjson_available):
+            cache.set("test_key", test_data)
+            result = cache.get("test_key")
+
+        assert result == {"data": {"spread": -3.5, "teams": ["A", "B"]}, "when": moment.isoformat(), "7": "seven"}
+
+        # Non-finite floats survive instead of being written as null
+        with patch('src.cache.disk_cache.ORJSON_AVAILABLE', orjson_available):
+            cache.set("nan_key", {"data": {"spread": float("nan"), "total": float("inf")}})
+            result = cache.get("nan_key")
+
+        assert math.isnan(result["data"]["spread"])
+        assert result["data"]["total"] == float("inf")
+
+        # Files written by the stdlib encoder, NaN literals included, still load
+        legacy_path = cache.get_cache_path("legacy_key")
+        with open(legacy_path, 'w') as f:
+            json.dump({"data": {"spread": float("nan")}, "timestamp": time.time()}, f, indent=4)
+
+        with patch('src.cache.disk_cache.ORJSON_AVAILABLE', orjson_available):
+            result = cache.get("legacy_key")
+
+        assert math.isnan(result["data"]["spread"])
+        assert os.path.exists(legacy_path)
+
     def test_cleanup_interval(self, tmp_path):
         """Test cleanup respects interval."""
         cache = MemoryCache(cleanup_interval=60.0)
@@ -427,6 +520,25 @@ class TestCacheManagerIntegration:
             result = cm.get_cached_data("test", max_age=300)
             assert result == data
 
+    def test_get_if_changed_reads_only_new_writes(self, tmp_path):
+        """Test get_if_changed skips unchanged files and sees writes from another process."""
+        with patch('src.cache_manager.CacheManager._get_writable_cache_dir', return_value=str(tmp_path)):
+            cm = CacheManager()
+            assert cm.get_if_changed("request", None) == (None, None)
+
+            cm.set("request", {"request_id": "a"})
+            version, data = cm.get_if_changed("request", None)
+            assert data == {"request_id": "a"}
+            assert cm.get_if_changed("request", version) == (version, None)
+
+            # A second CacheManager stands in for the web interface process
+            writer = CacheManager()
+            writer.set("request", {"request_id": "b"})
+            os.utime(tmp_path / "request.json", ns=(version + 10**9, version + 10**9))
+            new_version, data = cm.get_if_changed("request", version)
+            assert new_version != version
+            assert data == {"request_id": "b"}
+
     def test_get_cached_data_expired(self, tmp_path):
         """Test that expired data returns None."""
         with patch('src.cache_manager.CacheManager._get_writable_cache_dir', return_value=str(tmp_path)):
@@ -1,3 +1,4 @@
+import inspect
 import json
 import time
 from datetime import datetime
@@ -25,6 +26,84 @@ class TestDisplayControllerInitialization:
         pm.discover_plugins.return_value = ["plugin1", "plugin2"]
         pm.get_plugin.return_value = MagicMock()
 
+    def test_lazy_plugin_loads_on_first_use(self, test_display_controller):
+        """Test lazily registered plugins load once, when a mode is first needed."""
+        ctrl = test_display_controller
+        pm = ctrl.plugin_manager
+        pm.plugin_manifests = {"weather": {"display_modes": ["weather_current", "weather_hourly"]}}
+        plugin = MagicMock()
+        plugin.modes = ["weather_current", "weather_hourly"]
+        pm.get_plugin.return_value = plugin
+
+        ctrl._register_manifest_modes("weather")
+        assert ctrl.available_modes == ["weather_current", "weather_hourly"]
+        assert "weather_current" not in ctrl.plugin_modes
+
+        ctrl._ensure_plugin_loaded(ctrl.mode_to_plugin_id["weather_hourly"])
+        ctrl._ensure_plugin_loaded("weather")
+        pm.load_plugin.assert_called_once_with("weather")
+        assert ctrl.available_modes == ["weather_current", "weather_hourly"]
+        assert ctrl.plugin_modes["weather_current"] is plugin
+
+    def test_lazy_plugin_drops_modes_it_does_not_provide(self, test_display_controller):
+        """Test manifest modes missing from plugin.modes, or from a failed load, leave the rotation."""
+        ctrl = test_display_controller
+        pm = ctrl.plugin_manager
+        pm.plugin_manifests = {
+            "clock": {"display_modes": ["clock"]},
+            "basketball": {"display_modes": ["nba_live", "wnba_live", "nba_recent", "wnba_recent"]},
+            "weather": {"display_modes": ["weather_current", "weather_hourly"]},
+        }
+        plugin = MagicMock()
+        plugin.modes = ["nba_live", "nba_recent"]
+        pm.get_plugin.return_value = plugin
+
+        for plugin_id in ("clock", "basketball", "weather"):
+            ctrl._register_manifest_modes(plugin_id)
+        ctrl.current_mode_index = ctrl.available_modes.index("wnba_live")
+
+        ctrl._ensure_plugin_loaded("basketball")
+        assert ctrl.available_modes == ["clock", "nba_live", "nba_recent", "weather_current", "weather_hourly"]
+        assert "wnba_live" not in ctrl.mode_to_plugin_id
+        assert ctrl.plugin_display_modes["basketball"] == ["nba_live", "nba_recent"]
+        # The removed current mode advances to the mode that followed it
+        assert ctrl.available_modes[(ctrl.current_mode_index + 1) % len(ctrl.available_modes)] == "nba_recent"
+
+        pm.load_plugin.return_value = False
+        ctrl.current_mode_index = ctrl.available_modes.index("weather_hourly")
+        ctrl._ensure_plugin_loaded("weather")
+        assert ctrl.available_modes == ["clock", "nba_live", "nba_recent"]
+        assert "weather_current" not in ctrl.mode_to_plugin_id
+        assert "weather" not in ctrl.plugin_display_modes
+        assert 0 <= ctrl.current_mode_index < len(ctrl.available_modes)
+
+    def test_config_change_dispatched_to_changed_plugins(self, test_display_controller):
+        """Test one dispatcher notifies only plugins whose config section changed."""
+        ctrl = test_display_controller
+        weather, clock = MagicMock(), MagicMock()
+        ctrl._config_subscribers = {"weather": weather, "clock": clock}
+        clock.on_config_change.side_effect = RuntimeError("boom")
+
+        old = {"weather": {"units": "metric"}, "clock": {"format": "24h"}}
+        ctrl._dispatch_config_change(old, {"weather": {"units": "imperial"}, "clock": {"format": "24h"}})
+        weather.on_config_change.assert_called_once_with({"units": "imperial"})
+        clock.on_config_change.assert_not_called()
+
+        # A failing plugin handler does not stop the others
+        ctrl._dispatch_config_change(old, {"weather": {"units": "kelvin"}, "clock": {"format": "12h"}})
+        assert weather.on_config_change.call_count == 2
+
+    def test_cpu_affinity_pinning(self, test_display_controller):
+        """Test render/worker core pinning is optional and tolerates bad core ids."""
+        from src.display_controller import _pin_current_thread
+        with patch('src.display_controller.os.sched_setaffinity', create=True) as mock_affinity:
+            assert _pin_current_thread(None, "render loop") is False
+            assert _pin_current_thread(3, "render loop") is True
+            mock_affinity.assert_called_once_with(0, {3})
+
+            mock_affinity.side_effect = OSError("Invalid argument")
+            assert _pin_current_thread([0, 1], "plugin loader thread") is False
+
     def test_init_sets_default_state(self, test_display_controller):
         """Test that initialization sets default state values."""
         ctrl = test_display_controller
@@ -199,6 +278,20 @@ class TestDisplayControllerOnDemand:
         controller._check_on_demand_expiration()
         assert controller.on_demand_active is True
 
+    def test_on_demand_expiration_ignores_clock_steps(self, test_display_controller):
+        """Test a wall-clock step after activation does not expire the session."""
+        controller = test_display_controller
+        controller.on_demand_active = True
+        controller.on_demand_mode = "od_mode"
+        controller.on_demand_expires_at = time.time() + 60
+        controller._check_on_demand_expiration()
+
+        with patch('src.display_controller.time.time', return_value=time.time() + 3600):
+            controller._check_on_demand_expiration()
+            remaining = controller._get_on_demand_remaining()
+        assert controller.on_demand_active is True
+        assert 59 <= remaining <= 60
+
     def test_on_demand_expiration_no_expiry(self, test_display_controller):
         """Test on-demand mode with no expiration (pinned)."""
         controller = test_display_controller
@@ -262,6 +355,44 @@ class TestDisplayControllerOnDemand:
         assert remaining is not None
         assert 29 <= remaining <= 31
 
+    def test_publish_on_demand_state_skips_unchanged(self, test_display_controller):
+        """Test unchanged on-demand state is not rewritten until the refresh interval."""
+        controller = test_display_controller
+        controller.cache_manager = MagicMock()
+        controller._last_on_demand_publish = None
+        controller._publish_on_demand_state()
+        controller._publish_on_demand_state()
+        assert controller.cache_manager.set.call_count == 1
+
+        controller.on_demand_status = 'active'
+        controller._publish_on_demand_state()
+        assert controller.cache_manager.set.call_count == 2
+
+        fields, published_at = controller._last_on_demand_publish
+        controller._last_on_demand_publish = (fields, published_at - 61)
+        controller._publish_on_demand_state()
+        assert controller.cache_manager.set.call_count == 3
+
+    def test_publish_on_demand_state_keeps_remaining_current(self, test_display_controller):
+        """Test a republish with otherwise unchanged state still refreshes 'remaining'."""
+        controller = test_display_controller
+        controller.cache_manager = MagicMock()
+        controller._last_on_demand_publish = None
+        controller.on_demand_active = True
+        wall, mono = time.time(), time.monotonic()
+        controller.on_demand_expires_at = wall + 100
+
+        with patch('src.display_controller.time.time', return_value=wall), \
+             patch('src.display_controller.time.monotonic', return_value=mono):
+            controller._publish_on_demand_state()
+        with patch('src.display_controller.time.time', return_value=wall + 10), \
+             patch('src.display_controller.time.monotonic', return_value=mono + 10):
+            controller._publish_on_demand_state()
+
+        assert controller.cache_manager.set.call_count == 2
+        state = controller.cache_manager.set.call_args[0][1]
+        assert state['remaining'] == pytest.approx(90, abs=0.01)
+
     def test_set_on_demand_error(self, test_display_controller):
         """Test setting on-demand error state."""
         controller = test_display_controller
@@ -326,6 +457,21 @@ class TestDisplayControllerOnDemand:
         # Should not activate since it's a duplicate
         assert controller.on_demand_active is False
 
+    def test_poll_on_demand_requests_skips_unchanged_file(self, test_display_controller):
+        """Test an unchanged request file is not read or processed again."""
+        controller = test_display_controller
+        controller.cache_manager.get_if_changed = MagicMock(
+            return_value=(1, {'request_id': 'stop-1', 'action': 'stop'}))
+        controller._poll_on_demand_requests()
+        assert controller.on_demand_request_id == 'stop-1'
+
+        controller.on_demand_request_id = None
+        controller.cache_manager.get.reset_mock()
+        controller.cache_manager.get_if_changed.return_value = (1, None)
+        controller._poll_on_demand_requests()
+        assert controller.on_demand_request_id is None
+        controller.cache_manager.get.assert_not_called()
+
     def test_resolve_mode_for_plugin_direct_mode(self, test_display_controller):
         """Test resolving a valid direct mode."""
         controller = test_display_controller
@@ -396,6 +542,19 @@ class TestDisplayControllerLivePriority:
         live_mode = controller._check_live_priority()
         assert live_mode is None
 
+    def test_live_priority_probes_each_plugin_once(self, test_display_controller):
+        """Test a plugin with several modes is asked about live content once per check."""
+        controller = test_display_controller
+        sports = MagicMock()
+        sports.has_live_priority.return_value = True
+        sports.has_live_content.return_value = True
+        sports.get_live_modes.return_value = []
+        controller.plugin_modes = {"sports_recent": sports, "sports_upcoming": sports, "sports_live": sports}
+
+        assert controller._check_live_priority() == "sports_live"
+        sports.has_live_content.assert_called_once()
+        sports.get_live_modes.assert_called_once()
+
 
 @pytest.mark.unit
 class TestDisplayControllerDynamicDuration:
@@ -450,15 +609,63 @@ class TestDisplayControllerDynamicDuration:
         mock_plugin.is_cycle_complete.return_value = True
         assert test_display_controller._plugin_cycle_complete(mock_plugin) is True
 
+    def test_plugin_caps_display_mode_signature(self, test_display_controller):
+        """Test whether display() takes display_mode is read once per plugin."""
+        controller = test_display_controller
+
+        class ModePlugin:
+            def display(self, display_mode=None, force_clear=False):
+                return True
+
+        class PlainPlugin:
+            def display(self, force_clear=False):
+                return True
+
+        mode_plugin = ModePlugin()
+        with patch('src.display_controller.inspect.signature', wraps=inspect.signature) as mock_signature:
+            assert controller._plugin_caps(mode_plugin)['accepts_display_mode'] is True
+            assert controller._plugin_caps(mode_plugin)['accepts_display_mode'] is True
+            assert mock_signature.call_count == 1
+        assert controller._plugin_caps(PlainPlugin())['accepts_display_mode'] is False
+        assert controller._plugin_caps(object())['accepts_display_mode'] is False
+
+    def test_plugin_caps_probed_once_per_load(self, test_display_controller):
+        """Test plugin hooks are looked up once and probed again when the plugin reloads."""
+        controller = test_display_controller
+
+        class Plugin:
+            def is_cycle_complete(self):
+                return False
+
+        plugin = Plugin()
+        assert controller._plugin_cycle_complete(plugin) is False
+        assert controller._plugin_supports_dynamic(plugin) is False
+
+        # Hooks added after the first probe are not seen until the plugin is re-registered
+        plugin.supports_dynamic_duration = lambda: True
+        assert controller._plugin_supports_dynamic(plugin) is False
+
+        controller.plugin_manager.get_plugin.return_value = plugin
+        controller.plugin_manager.plugin_manifests = {"demo": {"display_modes": ["demo"]}}
+        controller._register_loaded_plugin("demo")
+        assert controller._plugin_supports_dynamic(plugin) is True
+
 
 @pytest.mark.unit
 class TestDisplayControllerSchedule:
     """Test schedule management."""
 
+    @staticmethod
+    def _set_config(controller, config):
+        """Serve config through config_service, which the schedule checks read."""
+        controller.config_service = MagicMock()
+        controller.config_service.get_version.return_value = 1
+        controller.config_service.get_config.return_value = config
+
     def test_schedule_disabled(self, test_display_controller):
         """Test when schedule is disabled."""
         controller = test_display_controller
-        controller.config = {"schedule": {"enabled": False}}
+        self._set_config(controller, {"schedule": {"enabled": False}})
 
         controller._check_schedule()
         assert controller.is_display_active is True
@@ -466,7 +673,7 @@ class TestDisplayControllerSchedule:
     def test_schedule_missing(self, test_display_controller):
         """Test when schedule config is missing entirely."""
         controller = test_display_controller
-        controller.config = {}
+        self._set_config(controller, {})
         controller._check_schedule()
         assert controller.is_display_active is True
 
@@ -474,17 +681,16 @@ class TestDisplayControllerSchedule:
         """Test active hours check."""
         controller = test_display_controller
         with patch('src.display_controller.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value.lower.return_value = "monday"
-            mock_datetime.now.return_value.time.return_value = datetime.strptime("12:00", "%H:%M").time()
+            mock_datetime.fromtimestamp.return_value = datetime(2024, 1, 1, 12, 0)
             mock_datetime.strptime = datetime.strptime
 
-            controller.config = {
+            self._set_config(controller, {
                 "schedule": {
                     "enabled": True,
                     "start_time": "09:00",
                     "end_time": "17:00"
                 }
-            }
+            })
 
             controller._check_schedule()
             assert controller.is_display_active is True
@@ -493,17 +699,16 @@ class TestDisplayControllerSchedule:
         """Test inactive hours check."""
         controller = test_display_controller
         with patch('src.display_controller.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value.lower.return_value = "monday"
-            mock_datetime.now.return_value.time.return_value = datetime.strptime("20:00", "%H:%M").time()
+            mock_datetime.fromtimestamp.return_value = datetime(2024, 1, 1, 20, 0)
             mock_datetime.strptime = datetime.strptime
 
-            controller.config = {
+            self._set_config(controller, {
                 "schedule": {
                     "enabled": True,
                     "start_time": "09:00",
                     "end_time": "17:00"
                 }
-            }
+            })
 
             controller._check_schedule()
             assert controller.is_display_active is False
@@ -512,17 +717,16 @@ class TestDisplayControllerSchedule:
         """Test overnight schedule when current time is late (after start)."""
         controller = test_display_controller
         with patch('src.display_controller.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value.lower.return_value = "monday"
-            mock_datetime.now.return_value.time.return_value = datetime.strptime("23:00", "%H:%M").time()
+            mock_datetime.fromtimestamp.return_value = datetime(2024, 1, 1, 23, 0)
             mock_datetime.strptime = datetime.strptime
 
-            controller.config = {
+            self._set_config(controller, {
                 "schedule": {
                     "enabled": True,
                     "start_time": "20:00",
                     "end_time": "06:00"
                 }
-            }
+            })
             controller._check_schedule()
             assert controller.is_display_active is True
 
@@ -530,11 +734,11 @@ class TestDisplayControllerSchedule:
         """Test per-day schedule when current day is disabled."""
         controller = test_display_controller
         with patch('src.display_controller.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value.lower.return_value = "monday"
-            mock_datetime.now.return_value.time.return_value = datetime.strptime("12:00", "%H:%M").time()
+            # 2024-01-01 is a Monday
+            mock_datetime.fromtimestamp.return_value = datetime(2024, 1, 1, 12, 0)
             mock_datetime.strptime = datetime.strptime
 
-            controller.config = {
+            self._set_config(controller, {
                 "schedule": {
                     "enabled": True,
                     "start_time": "09:00",
@@ -543,9 +747,63 @@ class TestDisplayControllerSchedule:
                         "monday": {"enabled": False}
                     }
                 }
+            })
+            controller._check_schedule()
+            assert controller.is_display_active is False
+
+    def test_schedule_parsed_once_per_config_version(self, test_display_controller):
+        """Test schedule config is re-read only when the config version changes."""
+        controller = test_display_controller
+        controller.config_service = MagicMock()
+        controller.config_service.get_version.return_value = 1
+        controller.config_service.get_config.return_value = {
+            "schedule": {"enabled": True, "start_time": "09:00", "end_time": "17:00"}
+        }
+        with patch('src.display_controller.datetime') as mock_datetime:
+            # 2024-01-01 is a Monday
+            mock_datetime.fromtimestamp.return_value = datetime(2024, 1, 1, 12, 0)
+            mock_datetime.strptime = datetime.strptime
+
+            controller._check_schedule()
+            controller._check_schedule()
+            assert controller.is_display_active is True
+            assert controller.config_service.get_config.call_count == 1
+
+            controller.config_service.get_version.return_value = 2
+            controller.config_service.get_config.return_value = {
+                "schedule": {"enabled": True, "start_time": "09:00", "end_time": "17:00",
+                             "days": {"monday": {"enabled": False}}}
             }
             controller._check_schedule()
             assert controller.is_display_active is False
+            assert controller.config_service.get_config.call_count == 2
+
+    def test_dim_schedule_parsed_once_per_config_version(self, test_display_controller):
+        """Test dim schedule uses cached brightness until the config version changes."""
+        controller = test_display_controller
+        controller.is_display_active = True
+        controller.config_service = MagicMock()
+        controller.config_service.get_version.return_value = 1
+        controller.config_service.get_config.return_value = {
+            "display": {"hardware": {"brightness": 80}},
+            "dim_schedule": {"enabled": True, "start_time": "20:00", "end_time": "07:00",
+                             "dim_brightness": 25},
+        }
+        with patch('src.display_controller.datetime') as mock_datetime:
+            mock_datetime.fromtimestamp.return_value = datetime(2024, 1, 1, 23, 0)
+            mock_datetime.strptime = datetime.strptime
+
+            assert controller._check_dim_schedule() == 25
+            assert controller._check_dim_schedule() == 25
+            assert controller.config_service.get_config.call_count == 1
+
+            controller.config_service.get_version.return_value = 2
+            controller.config_service.get_config.return_value = {
+                "display": {"hardware": {"brightness": 70}},
+                "dim_schedule": {"enabled": False},
+            }
+            assert controller._check_dim_schedule() == 70
+            assert controller.is_dimmed is False
 
 
 @pytest.mark.unit
@@ -630,6 +888,17 @@ class TestDisplayControllerPluginUpdates:
             controller._sleep_with_plugin_updates(0.1, tick_interval=0.05)
             assert mock_tick.called
 
+    def test_sleep_with_plugin_updates_waits_for_next_due(self, test_display_controller):
+        """Test the sleep wakes only when a plugin update is due, not every tick."""
+        controller = test_display_controller
+        controller.plugin_manager.seconds_until_next_update = MagicMock(return_value=45.0)
+        with patch('src.display_controller.time.monotonic', side_effect=[0.0, 0.0, 10.0]), \
+             patch('src.display_controller.time.sleep') as mock_sleep, \
+             patch.object(controller, '_tick_plugin_updates') as mock_tick:
+            controller._sleep_with_plugin_updates(10.0)
+        mock_sleep.assert_called_once_with(10.0)
+        mock_tick.assert_called_once()
+
 
 @pytest.mark.unit
 class TestDisplayControllerRun:
@@ -685,6 +954,23 @@ class TestDisplayControllerWifiStatus:
         result = controller._check_wifi_status_message()
         assert result is None
 
+    def test_check_wifi_status_rereads_only_on_change(self, test_display_controller, tmp_path):
+        """Test the wifi status file is parsed again only after it changes."""
+        controller = test_display_controller
+        status_file = tmp_path / "wifi_status.json"
+        status_file.write_text(json.dumps({"message": "Connecting", "timestamp": time.time(), "duration": 60}))
+        controller.wifi_status_file = status_file
+
+        with patch.object(controller, '_read_wifi_status_file',
+                          wraps=controller._read_wifi_status_file) as read_file:
+            assert controller._check_wifi_status_message()['message'] == "Connecting"
+            assert controller._check_wifi_status_message()['message'] == "Connecting"
+            assert read_file.call_count == 1
+
+            status_file.write_text(json.dumps({"message": "Connected to WiFi", "timestamp": time.time(), "duration": 60}))
+            assert controller._check_wifi_status_message()['message'] == "Connected to WiFi"
+            assert read_file.call_count == 2
+
     def test_display_wifi_status_message(self, test_display_controller):
         """Test displaying a wifi status message."""
         controller = test_display_controller
@@ -732,6 +1018,19 @@ class TestDisplayControllerOnDemandModePopulation:
         controller._populate_on_demand_modes_from_plugin()
         assert "sports_recent" in controller.on_demand_modes
 
+    def test_order_on_demand_modes_live_first(self, test_display_controller):
+        """Test live modes with content lead, and live modes without content are dropped."""
+        controller = test_display_controller
+        live_plugin = MagicMock()
+        live_plugin.has_live_content.return_value = True
+        controller.plugin_display_modes = {"sports": ["sports_recent", "sports_live", "sports_upcoming"]}
+        controller.plugin_modes = {m: live_plugin for m in controller.plugin_display_modes["sports"]}
+
+        assert controller._order_on_demand_modes("sports") == ["sports_live", "sports_recent", "sports_upcoming"]
+
+        live_plugin.has_live_content.return_value = False
+        assert controller._order_on_demand_modes("sports") == ["sports_recent", "sports_upcoming"]
+
 
 @pytest.mark.unit
 class TestDisplayControllerCleanup:
@@ -83,6 +83,28 @@ class TestPluginManager:
             assert pm.state_manager.get_state("non_existent_plugin") == PluginState.ERROR
 
 
+    def test_seconds_until_next_update(self, mock_config_manager, mock_display_manager, mock_cache_manager):
+        """Test the next scheduled update time follows the shortest remaining interval."""
+        with patch('src.plugin_system.plugin_manager.ensure_directory_permissions'):
+            pm = PluginManager(
+                plugins_dir="plugins",
+                config_manager=mock_config_manager,
+                display_manager=mock_display_manager,
+                cache_manager=mock_cache_manager
+            )
+            assert pm.seconds_until_next_update(current_time=1000.0) is None
+
+            pm.plugins = {"slow": MagicMock(enabled=True), "fast": MagicMock(enabled=True),
+                          "off": MagicMock(enabled=False)}
+            pm.plugin_manifests = {"slow": {"update_interval": 300}, "fast": {"update_interval": 30},
+                                   "off": {"update_interval": 1}}
+            pm.plugin_last_update = {"slow": 990.0, "fast": 990.0, "off": 990.0}
+            assert pm.seconds_until_next_update(current_time=1000.0) == 20.0
+
+            pm.plugin_last_update["fast"] = 900.0
+            assert pm.seconds_until_next_update(current_time=1000.0) == 0.0
+
+
 class TestPluginLoader:
     """Test PluginLoader functionality."""
     
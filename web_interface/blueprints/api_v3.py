@@ -7204,13 +7204,13 @@ def _install_star_file(app_id: str, star_file_path: str, metadata: Dict[str, Any
     try:
         PixletRenderer = _get_pixlet_renderer_class()
         pixlet = PixletRenderer()
-        if pixlet.is_available():
-            _, schema, _ = pixlet.extract_schema(str(dest))
-            if schema:
-                schema_path = app_dir / "schema.json"
-                with open(schema_path, 'w') as f:
-                    json.dump(schema, f, indent=2)
-                logger.info(f"Extracted schema for {app_id}")
+        # Schema extraction parses the .star source and does not need the Pixlet binary
+        _, schema, _ = pixlet.extract_schema(str(dest))
+        if schema:
+            schema_path = app_dir / "schema.json"
+            with open(schema_path, 'w') as f:
+                json.dump(schema, f, indent=2)
+            logger.info(f"Extracted schema for {app_id}")
     except Exception as e:
         logger.warning(f"Failed to extract schema for {app_id}: {e}")
 
@@ -7753,7 +7753,8 @@ def browse_tronbyte_repository():
 
     Returns ALL apps with metadata, categories, and authors.
     Filtering/sorting/pagination is handled client-side.
-    Results are cached server-side for 2 hours.
+    Results are cached server-side for 2 hours; pass ?refresh=true to re-fetch
+    from GitHub instead of the cache or shipped manifest snapshot.
     """
     try:
         TronbyteRepository = _get_tronbyte_repository_class()
@@ -7762,7 +7763,8 @@ def browse_tronbyte_repository():
         github_token = config.get('github_token')
         repo = TronbyteRepository(github_token=github_token)
 
-        result = repo.list_all_apps_cached()
+        force_refresh = request.args.get('refresh', '').lower() == 'true'
+        result = repo.list_all_apps_cached(force_refresh=force_refresh)
 
         rate_limit = repo.get_rate_limit_info()
 